@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+
+class BulkEvaluationSummaryDTO(BaseModel):
+    """DTO summarizing a bulk scoring run."""
+    total: int = Field(..., description="Submissions in the input file")
+    completed: int = Field(..., description="Submissions scored and saved (including previous runs)")
+    failed: int = Field(..., description="Submissions that could not be scored")
+    skipped: int = Field(..., description="Submissions already handled by a previous run")
+    batches_submitted: int = Field(..., description="Batches submitted during this run")
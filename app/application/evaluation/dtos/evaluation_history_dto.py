@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class EvaluationHistoryPageDTO(BaseModel):
+    """DTO for one page of a user's evaluation history."""
+    items: List[Dict[str, Any]] = Field(
+        ..., description="Evaluations, newest first, with the requested fields (id and created_at always included)"
+    )
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page; null on the last page")
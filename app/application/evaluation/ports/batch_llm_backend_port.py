@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, Tuple
+
+# Batch job statuses reported by backends
+BATCH_IN_PROGRESS = "in_progress"
+BATCH_COMPLETED = "completed"
+BATCH_FAILED = "failed"
+
+
+class BatchLLMBackendPort(ABC):
+    """Port for asynchronous batch-submission LLM backends (submit now, poll for results later)."""
+
+    @abstractmethod
+    async def submit_evaluations(
+        self,
+        submissions: Dict[str, Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> str:
+        """Submit (questions_dict, answers_dict) evaluations keyed by custom id; return the batch id."""
+        pass
+
+    @abstractmethod
+    async def get_status(self, batch_id: str) -> str:
+        """Return the batch status: in_progress, completed or failed."""
+        pass
+
+    @abstractmethod
+    async def fetch_results(self, batch_id: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Return the evaluation of every custom id of a completed batch; None marks a failed item."""
+        pass
+
+    async def aclose(self) -> None:
+        """Release resources held by the backend (e.g. pooled connections)."""
+        pass
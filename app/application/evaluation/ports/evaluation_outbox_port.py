@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class OutboxMessage:
+    """A message read from the outbox."""
+    id: str
+    kind: Optional[str]
+    payload: Optional[Dict[str, Any]]  # None when the message cannot be decoded
+    published_at: float                # epoch seconds
+    deliveries: int = 1
+
+
+class EvaluationOutboxPort(ABC):
+    """
+    Port for the durable outbox of evaluation results awaiting persistence.
+    Messages are read by a group of consumers; a message stays pending until
+    acknowledged and can then be claimed by another consumer.
+    """
+
+    @abstractmethod
+    async def publish(self, kind: str, payload: Dict[str, Any]) -> str:
+        """Append a message; return its ID."""
+        pass
+
+    @abstractmethod
+    async def read(self, consumer: str, count: int, block_ms: Optional[int]) -> List[OutboxMessage]:
+        """Up to ``count`` messages never delivered before, waiting up to ``block_ms`` for one (None: no wait)."""
+        pass
+
+    @abstractmethod
+    async def claim_stale(self, consumer: str, min_idle_ms: int, count: int) -> List[OutboxMessage]:
+        """Take over up to ``count`` messages delivered but not acknowledged for ``min_idle_ms``."""
+        pass
+
+    @abstractmethod
+    async def ack(self, messages: List[OutboxMessage]) -> None:
+        """Acknowledge messages as persisted and remove them from the outbox."""
+        pass
+
+    @abstractmethod
+    async def dead_letter(self, messages: List[OutboxMessage], reason: str) -> None:
+        """Move messages that cannot be persisted to the dead-letter store."""
+        pass
+
+    @abstractmethod
+    async def stats(self) -> Dict[str, float]:
+        """``backlog`` (messages not yet persisted), ``pending`` (delivered, not acknowledged) and ``oldest_age_seconds``."""
+        pass
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
 
 
 class LLMServicePort(ABC):
@@ -14,6 +15,68 @@ class LLMServicePort(ABC):
         """Evaluate answers using LLM and return structured feedback."""
         pass
 
+    async def evaluate_answers_batch(
+        self,
+        submissions: List[Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Evaluate several users' (questions_dict, answers_dict) submissions.
+        Results are returned in order; None marks a submission that could not be evaluated.
+        The default implementation evaluates each submission separately.
+        """
+        return list(await asyncio.gather(*(
+            self.evaluate_answers(questions_dict, answers_dict)
+            for questions_dict, answers_dict in submissions
+        )))
+
+    async def stream_evaluation(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Evaluate answers, yielding parts of the result as soon as they are available.
+
+        Events are dicts with a ``type`` and ``data``: ``reason``, one ``feedback``
+        per answer, ``feedback_end`` once all feedback has arrived and
+        ``next_questions``. The default implementation waits for the full result.
+        """
+        result = await self.evaluate_answers(questions_dict, answers_dict)
+        if "reason" in result:
+            yield {"type": "reason", "data": result["reason"]}
+        for feedback in result["feedback"]:
+            yield {"type": "feedback", "data": feedback}
+        yield {"type": "feedback_end", "data": result["feedback"]}
+        yield {"type": "next_questions", "data": result.get("next_questions", [])}
+
+    @abstractmethod
+    async def evaluate_single_answer(
+        self,
+        question: str,
+        answer: str
+    ) -> Dict[str, Any]:
+        """Evaluate a single answer and return its feedback item."""
+        pass
+
+    @abstractmethod
+    async def generate_next_questions(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[str]:
+        """Generate follow-up questions suited to the level shown by the answers."""
+        pass
+
+    @abstractmethod
+    async def generate_questions(
+        self,
+        level: str,
+        topic: str,
+        count: int
+    ) -> List[str]:
+        """Generate new questions for a CEFR level and topic (used to stock the question pool)."""
+        pass
+
     @abstractmethod
     async def final_evaluation(
         self,
@@ -21,4 +84,8 @@ class LLMServicePort(ABC):
         new_answers: List[Dict[str, str]]
     ) -> str:
         """Perform final evaluation and return CEFR level."""
-        pass
\ No newline at end of file
+        pass
+
+    async def aclose(self) -> None:
+        """Release resources held by the service (e.g. pooled connections)."""
+        pass
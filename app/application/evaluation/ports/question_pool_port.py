@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class QuestionPoolPort(ABC):
+    """Port for the store of pre-generated questions, indexed by CEFR level and topic."""
+
+    @abstractmethod
+    async def take(self, level: str, user_id: int, count: int) -> List[str]:
+        """
+        Return up to ``count`` questions of a level the user has not been served,
+        spread across topics, and remember them as served to that user.
+        """
+        pass
+
+    @abstractmethod
+    async def add(self, level: str, topic: str, questions: List[str]) -> int:
+        """Add questions to a level and topic; return how many were new."""
+        pass
+
+    @abstractmethod
+    async def sizes(self, level: str) -> Dict[str, int]:
+        """Number of questions of a level per topic."""
+        pass
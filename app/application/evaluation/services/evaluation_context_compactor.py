@@ -0,0 +1,114 @@
+import json
+from collections import Counter
+from typing import Any, Dict, List
+
+from app.domain.value_objects.cefr_level import CEFRLevel
+
+# Keyword rules mapping free-text mistakes to categories, checked in order
+MISTAKE_CATEGORIES = [
+    ("subject-verb agreement", ("agreement", "subject-verb", "third person", "we was", "he have", "she have")),
+    ("verb tense", ("tense", "past simple", "present perfect", "past participle", "continuous", "conditional")),
+    ("articles", ("article",)),
+    ("prepositions", ("preposition",)),
+    ("plurals", ("plural", "singular", "countable")),
+    ("word order", ("word order", "order of")),
+    ("word choice", ("word choice", "vocabulary", "collocation", "synonym", "more precise", "formal", "informal")),
+    ("spelling", ("spelling", "misspel", "typo")),
+    ("punctuation", ("punctuation", "comma", "capitali")),
+    ("sentence structure", ("sentence", "connector", "conjunction", "run-on", "fragment", "clause")),
+]
+OTHER_CATEGORY = "other"
+
+CHARS_PER_TOKEN = 4
+MAX_REASON_CHARS = 300
+MAX_EXAMPLE_CHARS = 80
+
+
+class EvaluationContextCompactor:
+    """
+    Reduces a cached initial evaluation to what the final arbiter needs:
+    overall level, per-skill averages, per-level counts and the most frequent
+    mistake categories, trimmed to fit a token budget.
+    """
+
+    def __init__(self, max_tokens: int = 300, top_mistake_categories: int = 5):
+        self.max_tokens = max_tokens
+        self.top_mistake_categories = top_mistake_categories
+
+    def compact(self, evaluation: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the compact context, dropping detail until it fits the budget."""
+        feedback = evaluation.get("feedback") or []
+
+        context = {
+            "level": evaluation.get("level"),
+            "scores": self._average_scores(feedback) or evaluation.get("scores"),
+            "answers_evaluated": len(feedback),
+            "level_counts": self._level_counts(feedback),
+            "top_mistakes": self._top_mistakes(feedback),
+            "reason": self._truncate(evaluation.get("reason") or "", MAX_REASON_CHARS)
+        }
+
+        # Shed detail in order of decreasing expendability
+        for item in context["top_mistakes"]:
+            if self._fits(context):
+                return context
+            item.pop("example", None)
+        while context["top_mistakes"] and not self._fits(context):
+            context["top_mistakes"].pop()
+        if not self._fits(context):
+            context["reason"] = self._truncate(context["reason"], MAX_REASON_CHARS // 3)
+        if not self._fits(context):
+            context.pop("reason")
+        return context
+
+    def estimate_tokens(self, data: Any) -> int:
+        """Approximate token count of data serialized as compact JSON."""
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    def _fits(self, context: Dict[str, Any]) -> bool:
+        """Whether the context is within the token budget."""
+        return self.estimate_tokens(context) <= self.max_tokens
+
+    def _average_scores(self, feedback: List[Dict[str, Any]]) -> Dict[str, float]:
+        """Per-skill averages over the feedback items."""
+        totals: Dict[str, List[float]] = {}
+        for item in feedback:
+            for skill, score in (item.get("scores") or {}).items():
+                if isinstance(score, (int, float)):
+                    totals.setdefault(skill, []).append(float(score))
+        return {skill: round(sum(values) / len(values), 2) for skill, values in totals.items()}
+
+    def _level_counts(self, feedback: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Number of answers estimated at each CEFR level, in level order."""
+        counts = Counter(item.get("estimated_level") for item in feedback)
+        return {level: counts[level] for level in CEFRLevel.get_all_levels() if counts[level]}
+
+    def _top_mistakes(self, feedback: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Most frequent mistake categories with their count and one example."""
+        counts: Counter = Counter()
+        examples: Dict[str, str] = {}
+        for item in feedback:
+            for mistake in item.get("mistakes") or []:
+                category = self.categorize(mistake)
+                counts[category] += 1
+                examples.setdefault(category, mistake)
+
+        return [
+            {"category": category, "count": count, "example": self._truncate(examples[category], MAX_EXAMPLE_CHARS)}
+            for category, count in counts.most_common(self.top_mistake_categories)
+        ]
+
+    @staticmethod
+    def categorize(mistake: str) -> str:
+        """Map a free-text mistake to its category."""
+        text = str(mistake).lower()
+        for category, keywords in MISTAKE_CATEGORIES:
+            if any(keyword in text for keyword in keywords):
+                return category
+        return OTHER_CATEGORY
+
+    @staticmethod
+    def _truncate(text: str, max_chars: int) -> str:
+        """Shorten text to a maximum length, marking the cut."""
+        return text if len(text) <= max_chars else text[:max_chars - 1].rstrip() + "…"
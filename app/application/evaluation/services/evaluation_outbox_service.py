@@ -0,0 +1,276 @@
+import asyncio
+import dataclasses
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional
+
+from app.application.evaluation.ports.evaluation_outbox_port import EvaluationOutboxPort, OutboxMessage
+from app.domain.entities.evaluation import Evaluation
+from app.domain.entities.final_evaluation import FinalEvaluation
+from app.domain.repositories.evaluation_repository import EvaluationRepositoryInterface
+from app.domain.repositories.final_evaluation_repository import FinalEvaluationRepositoryInterface
+from app.core.exceptions.evaluation_exceptions import CacheException
+from app.core.metrics import metrics
+
+published_messages = metrics.counter(
+    "evaluation_outbox_published_total",
+    "Evaluation results queued in the outbox, by kind",
+    ("kind",)
+)
+direct_writes = metrics.counter(
+    "evaluation_outbox_direct_writes_total",
+    "Evaluation results written straight to the database because the outbox was unavailable",
+    ("kind",)
+)
+written_messages = metrics.counter(
+    "evaluation_outbox_written_total",
+    "Outbox messages persisted to the database, by kind",
+    ("kind",)
+)
+write_failures = metrics.counter(
+    "evaluation_outbox_write_failures_total",
+    "Failed database writes of outbox batches (retried)"
+)
+dead_lettered_messages = metrics.counter(
+    "evaluation_outbox_dead_lettered_total",
+    "Outbox messages moved to the dead-letter stream, by reason",
+    ("reason",)
+)
+consumer_errors = metrics.counter(
+    "evaluation_outbox_consumer_errors_total",
+    "Outbox reads, claims or acknowledgements that failed"
+)
+write_delay = metrics.histogram(
+    "evaluation_outbox_write_delay_seconds",
+    "Time from queueing an evaluation result to its database commit",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+)
+outbox_backlog = metrics.gauge(
+    "evaluation_outbox_backlog",
+    "Outbox messages not yet persisted"
+)
+outbox_pending = metrics.gauge(
+    "evaluation_outbox_pending",
+    "Outbox messages delivered to a consumer but not yet acknowledged"
+)
+outbox_oldest_age = metrics.gauge(
+    "evaluation_outbox_oldest_age_seconds",
+    "Age of the oldest outbox message not yet persisted (the outbox lag)"
+)
+
+
+class EvaluationOutboxService:
+    """
+    Write-behind persistence of evaluation results.
+
+    Requests queue results in the durable outbox and return; a background
+    consumer (one per process, all in one consumer group) bulk-writes them to
+    the database. Every row carries a dedup key and is created at the time it
+    was queued, so a batch written but not acknowledged (crash, lost
+    connection) is not duplicated when retried.
+    Batches that fail are retried message by message; messages left
+    unacknowledged are reclaimed after ``claim_idle`` seconds by any consumer,
+    and dead-lettered once they keep failing (``max_deliveries``) while the
+    database is available, so a database outage only delays persistence.
+    """
+
+    INITIAL_EVALUATIONS = "initial_evaluations"
+    FINAL_EVALUATION = "final_evaluation"
+
+    def __init__(
+        self,
+        outbox: EvaluationOutboxPort,
+        evaluation_repository: EvaluationRepositoryInterface,
+        final_evaluation_repository: FinalEvaluationRepositoryInterface,
+        consumer_name: Optional[str] = None,
+        batch_size: int = 200,
+        block_ms: int = 1000,
+        claim_idle: float = 30.0,
+        max_deliveries: int = 5,
+        error_backoff: float = 1.0,
+        stats_interval: float = 5.0,
+        database_health_check: Optional[Callable[[], Awaitable[bool]]] = None
+    ):
+        self.outbox = outbox
+        self.evaluation_repository = evaluation_repository
+        self.final_evaluation_repository = final_evaluation_repository
+        # Unique per process, so each worker is its own consumer of the group
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle = claim_idle
+        self.max_deliveries = max_deliveries
+        self.error_backoff = error_backoff
+        self.stats_interval = stats_interval
+        # Tells a database outage from messages that cannot be written; without it, failures count as the latter
+        self.database_health_check = database_health_check
+        self._consumer: Optional[asyncio.Task] = None
+        self._last_stats = float("-inf")
+
+    async def save_evaluations(self, evaluations: List[Evaluation]) -> None:
+        """Queue per-answer evaluations for persistence; written directly if the outbox is unavailable."""
+        if not evaluations:
+            return
+        submission_key = uuid.uuid4().hex
+        evaluations = [
+            evaluation.model_copy(update={"dedup_key": f"{submission_key}:{position}"})
+            for position, evaluation in enumerate(evaluations)
+        ]
+        try:
+            await self.outbox.publish(
+                self.INITIAL_EVALUATIONS,
+                {"evaluations": [evaluation.model_dump(mode="json") for evaluation in evaluations]}
+            )
+            published_messages.inc(kind=self.INITIAL_EVALUATIONS)
+        except CacheException:
+            direct_writes.inc(kind=self.INITIAL_EVALUATIONS)
+            await self.evaluation_repository.save_many_deduplicated(evaluations)
+
+    async def save_final_evaluation(self, final_evaluation: FinalEvaluation) -> None:
+        """Queue a final evaluation for persistence; written directly if the outbox is unavailable."""
+        final_evaluation = dataclasses.replace(final_evaluation, dedup_key=uuid.uuid4().hex)
+        try:
+            payload = dataclasses.asdict(final_evaluation)
+            await self.outbox.publish(self.FINAL_EVALUATION, {
+                name: value for name, value in payload.items() if name not in ("created_at", "updated_at")
+            })
+            published_messages.inc(kind=self.FINAL_EVALUATION)
+        except CacheException:
+            direct_writes.inc(kind=self.FINAL_EVALUATION)
+            await self.final_evaluation_repository.save_many_deduplicated([final_evaluation])
+
+    def start(self) -> None:
+        """Start the background consumer."""
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.ensure_future(self.run())
+
+    async def aclose(self) -> None:
+        """Stop the consumer; unacknowledged messages are reclaimed by the other consumers."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            self._consumer = None
+        if hasattr(self.outbox, "aclose"):
+            await self.outbox.aclose()
+
+    async def run(self) -> None:
+        """Consume the outbox until cancelled."""
+        while True:
+            try:
+                await self.consume_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                consumer_errors.inc()
+                await asyncio.sleep(self.error_backoff)
+
+    async def consume_once(self) -> int:
+        """Persist one batch of stale and new messages; return how many were written."""
+        messages = await self.outbox.claim_stale(self.consumer_name, int(self.claim_idle * 1000), self.batch_size)
+        # Only wait for new messages when there is nothing to retry
+        messages += await self.outbox.read(
+            self.consumer_name, self.batch_size, self.block_ms if not messages else None
+        )
+        written = await self._process(messages) if messages else 0
+        await self._record_stats()
+        return written
+
+    async def _process(self, messages: List[OutboxMessage]) -> int:
+        """Write a batch and acknowledge what was written; dead-letter what can never be written."""
+        undecodable = [message for message in messages if message.payload is None or not self._is_known(message)]
+        if undecodable:
+            await self._dead_letter(undecodable, "undecodable")
+            undecodable_ids = {message.id for message in undecodable}
+            messages = [message for message in messages if message.id not in undecodable_ids]
+        if not messages:
+            return 0
+
+        try:
+            await self._write(messages)
+            written = messages
+        except Exception:
+            write_failures.inc()
+            written = await self._write_one_by_one(messages)
+
+        await self.outbox.ack(written)
+        now = time.time()
+        for message in written:
+            written_messages.inc(kind=message.kind)
+            write_delay.observe(max(now - message.published_at, 0.0))
+        return len(written)
+
+    async def _write_one_by_one(self, messages: List[OutboxMessage]) -> List[OutboxMessage]:
+        """
+        Write the messages of a failed batch one by one, fewest deliveries
+        first, to isolate the ones that cannot be written. A failure before any
+        success stops the pass if the database is unavailable, leaving the
+        messages to be retried; otherwise a message that fails is
+        dead-lettered once delivered ``max_deliveries`` times, even when it is
+        alone in its batch.
+        """
+        written = []
+        database_available = None
+        for message in sorted(messages, key=lambda message: message.deliveries):
+            try:
+                await self._write([message])
+                written.append(message)
+            except Exception:
+                write_failures.inc()
+                if not written and database_available is None:
+                    database_available = await self._database_available()
+                if not written and not database_available:
+                    break
+                if message.deliveries >= self.max_deliveries:
+                    await self._dead_letter([message], "write_failed")
+        return written
+
+    async def _database_available(self) -> bool:
+        if self.database_health_check is None:
+            return True
+        try:
+            return await self.database_health_check()
+        except Exception:
+            return False
+
+    async def _dead_letter(self, messages: List[OutboxMessage], reason: str) -> None:
+        await self.outbox.dead_letter(messages, reason)
+        dead_lettered_messages.inc(len(messages), reason=reason)
+
+    async def _write(self, messages: List[OutboxMessage]) -> None:
+        """Bulk-write the results of several messages, one insert per table."""
+        evaluations = [
+            Evaluation(**{**evaluation, "created_at": self._queued_at(message).replace(tzinfo=None)})
+            for message in messages if message.kind == self.INITIAL_EVALUATIONS
+            for evaluation in message.payload["evaluations"]
+        ]
+        final_evaluations = [
+            FinalEvaluation(**{**message.payload, "created_at": self._queued_at(message)})
+            for message in messages if message.kind == self.FINAL_EVALUATION
+        ]
+        await self.evaluation_repository.save_many_deduplicated(evaluations)
+        await self.final_evaluation_repository.save_many_deduplicated(final_evaluations)
+
+    @staticmethod
+    def _queued_at(message: OutboxMessage) -> datetime:
+        """Creation time of the rows of a message: when it was queued, identical on every retry."""
+        return datetime.fromtimestamp(message.published_at, timezone.utc)
+
+    def _is_known(self, message: OutboxMessage) -> bool:
+        return message.kind in (self.INITIAL_EVALUATIONS, self.FINAL_EVALUATION)
+
+    async def _record_stats(self) -> None:
+        """Refresh the backlog gauges, at most once per stats interval."""
+        now = time.monotonic()
+        if now - self._last_stats < self.stats_interval:
+            return
+        self._last_stats = now
+        try:
+            stats = await self.outbox.stats()
+        except CacheException:
+            consumer_errors.inc()
+            return
+        outbox_backlog.set(stats["backlog"])
+        outbox_pending.set(stats["pending"])
+        outbox_oldest_age.set(stats["oldest_age_seconds"])
@@ -0,0 +1,130 @@
+from typing import Any, Dict, List, Optional
+
+from app.application.evaluation.dtos.initial_evaluation_dto import (
+    InitialEvaluationResponseDTO,
+    FeedbackDTO
+)
+from app.domain.entities.evaluation import Evaluation
+from app.domain.services.level_calculator import LevelCalculatorService
+from app.domain.value_objects.scores import Scores
+
+DEFAULT_REASON = "Based on overall performance"
+
+
+class EvaluationResultBuilder:
+    """Turns raw LLM evaluation output into response DTOs and domain entities."""
+
+    def __init__(self, level_calculator: LevelCalculatorService):
+        self.level_calculator = level_calculator
+
+    def attach_submission(
+        self,
+        feedback_data: Dict[str, Any],
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str],
+        position: int
+    ) -> Dict[str, Any]:
+        """
+        Stamp the submitted question and answer on a feedback item, which the
+        LLM references by ``question_id`` instead of echoing the texts. Items
+        without a known id fall back to the answer at the same position.
+        """
+        question_id = feedback_data.get("question_id")
+        if isinstance(question_id, str) and question_id.strip().isdigit():
+            question_id = int(question_id)
+        if question_id not in answers_dict:
+            question_ids = list(answers_dict)
+            if position >= len(question_ids):
+                return feedback_data
+            question_id = question_ids[position]
+
+        return {
+            **feedback_data,
+            "question_id": question_id,
+            "question": questions_dict.get(question_id, ""),
+            "answer": answers_dict[question_id]
+        }
+
+    def build_feedback(self, feedback_data: Dict[str, Any]) -> FeedbackDTO:
+        """Convert a raw LLM feedback item into a DTO."""
+        return FeedbackDTO(
+            question=feedback_data["question"],
+            answer=feedback_data["answer"],
+            estimated_level=feedback_data["estimated_level"],
+            scores=feedback_data["scores"],
+            mistakes=feedback_data["mistakes"],
+            suggestions=feedback_data["suggestions"]
+        )
+
+    def summarize(self, feedback_list: List[FeedbackDTO], reason: Optional[str]) -> Dict[str, Any]:
+        """Calculate overall level and average scores using the domain service."""
+        individual_levels = [feedback.estimated_level for feedback in feedback_list]
+        individual_scores = [Scores.from_dict(feedback.scores) for feedback in feedback_list]
+
+        overall_level = self.level_calculator.calculate_overall_level(individual_levels)
+        average_scores = self.level_calculator.calculate_average_scores(individual_scores)
+
+        return {
+            "level": overall_level,
+            "scores": average_scores.to_dict(),
+            "reason": reason or DEFAULT_REASON
+        }
+
+    def build_response(
+        self,
+        feedback_list: List[FeedbackDTO],
+        reason: Optional[str],
+        next_questions: List[str]
+    ) -> InitialEvaluationResponseDTO:
+        """Create the response DTO from the processed feedback."""
+        summary = self.summarize(feedback_list, reason)
+        return InitialEvaluationResponseDTO(
+            level=summary["level"],
+            scores=summary["scores"],
+            reason=summary["reason"],
+            feedback=feedback_list,
+            next_questions=next_questions
+        )
+
+    def build_from_llm_response(
+        self,
+        llm_response: Dict[str, Any],
+        questions_dict: Optional[Dict[int, str]] = None,
+        answers_dict: Optional[Dict[int, str]] = None
+    ) -> InitialEvaluationResponseDTO:
+        """
+        Create the response DTO from a complete LLM evaluation. Given the
+        submitted questions and answers, feedback items are rebuilt from them.
+        """
+        feedback_items = llm_response["feedback"]
+        if answers_dict is not None:
+            feedback_items = [
+                self.attach_submission(feedback_data, questions_dict or {}, answers_dict, position)
+                for position, feedback_data in enumerate(feedback_items)
+            ]
+        feedback_list = [
+            self.build_feedback(feedback_data)
+            for feedback_data in feedback_items
+        ]
+        return self.build_response(
+            feedback_list,
+            llm_response.get("reason"),
+            llm_response.get("next_questions", [])
+        )
+
+    def to_entities(self, user_id: int, response: InitialEvaluationResponseDTO) -> List[Evaluation]:
+        """Create one evaluation entity per feedback item."""
+        return [
+            Evaluation(
+                user_id=user_id,
+                question=feedback.question,
+                answer=feedback.answer,
+                estimated_level=feedback.estimated_level,
+                grammar=feedback.scores["grammar"],
+                vocabulary=feedback.scores["vocabulary"],
+                fluency=feedback.scores["fluency"],
+                mistakes=feedback.mistakes,
+                suggestions=feedback.suggestions
+            )
+            for feedback in response.feedback
+        ]
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from typing import Dict, Iterable, List, Set
+
+from app.application.evaluation.ports.llm_service_port import LLMServicePort
+from app.application.evaluation.ports.question_pool_port import QuestionPoolPort
+from app.core.exceptions.evaluation_exceptions import CacheException, LLMException
+from app.core.metrics import metrics
+
+served_questions = metrics.counter(
+    "question_pool_served_total",
+    "Next-round questions served from the question pool",
+    ("level",)
+)
+pool_misses = metrics.counter(
+    "question_pool_misses_total",
+    "Requests the question pool could not cover without an inline refill",
+    ("level",)
+)
+pool_refills = metrics.counter(
+    "question_pool_refills_total",
+    "Question pool refills by level",
+    ("level",)
+)
+generated_questions = metrics.counter(
+    "question_pool_generated_total",
+    "New questions added to the question pool",
+    ("level",)
+)
+refill_failures = metrics.counter(
+    "question_pool_refill_failures_total",
+    "Question generation calls or stock checks that failed during a refill",
+    ("level",)
+)
+pool_size = metrics.gauge(
+    "question_pool_size",
+    "Questions in the pool per level, as of the last stock check",
+    ("level",)
+)
+
+
+class QuestionPoolService:
+    """
+    Serves next-round questions from the pre-generated question pool and keeps it stocked.
+
+    Questions are taken for the user's overall level without repeating any
+    already served to that user. After a request, a background check refills
+    the level when it is below the low watermark; a refill is only awaited
+    when the pool cannot cover a request (cold start, or a user who has seen
+    most of a level). Refills of the same level are never run concurrently.
+    """
+
+    def __init__(
+        self,
+        pool: QuestionPoolPort,
+        llm_service: LLMServicePort,
+        topics: List[str],
+        count: int = 5,
+        low_watermark: int = 40,
+        refill_per_topic: int = 5,
+        max_per_topic: int = 200,
+        check_interval: float = 10.0
+    ):
+        self.pool = pool
+        self.llm_service = llm_service
+        self.topics = topics
+        self.count = count
+        self.low_watermark = low_watermark
+        self.refill_per_topic = refill_per_topic
+        self.max_per_topic = max_per_topic
+        self.check_interval = check_interval
+        self._refills: Dict[str, asyncio.Task] = {}
+        self._last_checks: Dict[str, float] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    async def next_questions(self, user_id: int, level: str) -> List[str]:
+        """Questions for the next round at a level; fewer than ``count`` only if refilling failed."""
+        try:
+            questions = await self.pool.take(level, user_id, self.count)
+            if len(questions) < self.count:
+                pool_misses.inc(level=level)
+                await asyncio.shield(self._refill_task(level))
+                questions += await self.pool.take(level, user_id, self.count - len(questions))
+            else:
+                self.stock_in_background([level])
+        except (CacheException, LLMException):
+            return []
+
+        served_questions.inc(len(questions), level=level)
+        return questions
+
+    def stock_in_background(self, levels: Iterable[str]) -> None:
+        """Schedule a stock check (and refill if low) of each level, at most once per check interval."""
+        now = time.monotonic()
+        for level in levels:
+            if now - self._last_checks.get(level, float("-inf")) < self.check_interval:
+                continue
+            self._last_checks[level] = now
+            task = asyncio.ensure_future(self._check_stock(level))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def aclose(self) -> None:
+        """Cancel pending background work and release the pool's connections."""
+        for task in [*self._background, *self._refills.values()]:
+            task.cancel()
+        if hasattr(self.pool, "aclose"):
+            await self.pool.aclose()
+
+    async def _check_stock(self, level: str) -> None:
+        """Refill a level whose pool is below the low watermark."""
+        try:
+            sizes = await self.pool.sizes(level)
+            pool_size.set(sum(sizes.values()), level=level)
+            if sum(sizes.values()) < self.low_watermark:
+                await self._refill_task(level)
+        except (CacheException, LLMException):
+            refill_failures.inc(level=level)
+
+    def _refill_task(self, level: str) -> asyncio.Task:
+        """The running refill of a level, starting one if none is in progress."""
+        task = self._refills.get(level)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._refill(level))
+            self._refills[level] = task
+        return task
+
+    async def _refill(self, level: str) -> None:
+        """Generate a batch of questions for every topic of a level that is not full, concurrently."""
+        sizes = await self.pool.sizes(level)
+        topics = [topic for topic in self.topics if sizes.get(topic, 0) < self.max_per_topic]
+        results = await asyncio.gather(
+            *(self.llm_service.generate_questions(level, topic, self.refill_per_topic) for topic in topics),
+            return_exceptions=True
+        )
+
+        added = 0
+        for topic, questions in zip(topics, results):
+            if isinstance(questions, BaseException):
+                refill_failures.inc(level=level)
+                continue
+            added += await self.pool.add(level, topic, questions)
+
+        pool_refills.inc(level=level)
+        generated_questions.inc(added, level=level)
+        pool_size.set(sum(sizes.values()) + added, level=level)
@@ -0,0 +1,236 @@
+import asyncio
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from pydantic import ValidationError
+
+from app.application.evaluation.dtos.bulk_evaluation_dto import BulkEvaluationSummaryDTO
+from app.application.evaluation.dtos.initial_evaluation_dto import (
+    InitialEvaluationRequestDTO,
+    InitialEvaluationResponseDTO
+)
+from app.application.evaluation.ports.batch_llm_backend_port import (
+    BatchLLMBackendPort,
+    BATCH_COMPLETED,
+    BATCH_FAILED
+)
+from app.application.evaluation.services.evaluation_result_builder import EvaluationResultBuilder
+from app.domain.entities.evaluation import Evaluation
+from app.domain.repositories.question_repository import QuestionRepositoryInterface
+from app.domain.repositories.evaluation_repository import EvaluationRepositoryInterface
+from app.domain.services.level_calculator import LevelCalculatorService
+from app.core.exceptions.evaluation_exceptions import EvaluationException
+
+Submission = Tuple[Dict[int, str], Dict[int, str]]
+
+
+class BulkEvaluationUseCase:
+    """
+    Use case for scoring a JSONL file of ``{user_id, answers}`` submissions
+    through a batch LLM backend.
+
+    Progress is checkpointed to a JSON file after every submission and every
+    collected batch, so an interrupted run resumes where it stopped. Only
+    evaluations are persisted; no conversational memory is created.
+    """
+
+    def __init__(
+        self,
+        batch_backend: BatchLLMBackendPort,
+        question_repository: QuestionRepositoryInterface,
+        evaluation_repository: EvaluationRepositoryInterface,
+        level_calculator: LevelCalculatorService,
+        batch_size: int = 1000,
+        max_in_flight_batches: int = 4,
+        poll_interval: float = 30.0
+    ):
+        self.batch_backend = batch_backend
+        self.question_repository = question_repository
+        self.evaluation_repository = evaluation_repository
+        self.result_builder = EvaluationResultBuilder(level_calculator)
+        self.batch_size = batch_size
+        self.max_in_flight_batches = max_in_flight_batches
+        self.poll_interval = poll_interval
+
+    async def execute(self, input_path: str, checkpoint_path: str) -> BulkEvaluationSummaryDTO:
+        """Execute bulk evaluation use case."""
+        try:
+            # 1. Load checkpoint and input submissions
+            checkpoint = self._load_checkpoint(checkpoint_path)
+            requests = self._read_requests(input_path, checkpoint)
+            in_flight_ids = [custom_id for ids in checkpoint["batches"].values() for custom_id in ids]
+            handled = set(checkpoint["completed"]) | set(checkpoint["failed"]) | set(in_flight_ids)
+            pending_ids = [custom_id for custom_id in requests if custom_id not in handled]
+            skipped = len(requests) - len(pending_ids)
+
+            # 2. Resolve question texts with a single repository query; in-flight
+            #    submissions need them too, to rebuild their feedback once collected
+            submissions = await self._build_submissions(
+                {custom_id: requests[custom_id] for custom_id in [*pending_ids, *in_flight_ids] if custom_id in requests},
+                checkpoint
+            )
+            pending_ids = [custom_id for custom_id in pending_ids if custom_id in submissions]
+            self._save_checkpoint(checkpoint_path, checkpoint)
+
+            # 3. Submit chunks within the in-flight quota, poll and persist completed batches
+            chunks = [
+                pending_ids[start:start + self.batch_size]
+                for start in range(0, len(pending_ids), self.batch_size)
+            ]
+            batches_submitted = 0
+
+            while chunks or checkpoint["batches"]:
+                while chunks and len(checkpoint["batches"]) < self.max_in_flight_batches:
+                    chunk = chunks.pop(0)
+                    batch_id = await self.batch_backend.submit_evaluations(
+                        {custom_id: submissions[custom_id] for custom_id in chunk}
+                    )
+                    checkpoint["batches"][batch_id] = chunk
+                    batches_submitted += 1
+                    self._save_checkpoint(checkpoint_path, checkpoint)
+
+                finished = 0
+                for batch_id in list(checkpoint["batches"]):
+                    status = await self.batch_backend.get_status(batch_id)
+                    if status == BATCH_COMPLETED:
+                        await self._collect_batch(batch_id, requests, submissions, checkpoint)
+                    elif status == BATCH_FAILED:
+                        for custom_id in checkpoint["batches"].pop(batch_id):
+                            checkpoint["failed"][custom_id] = f"Batch {batch_id} failed"
+                    else:
+                        continue
+                    finished += 1
+                    self._save_checkpoint(checkpoint_path, checkpoint)
+
+                if checkpoint["batches"] and not finished:
+                    await asyncio.sleep(self.poll_interval)
+
+            # 4. Summarize the run
+            return BulkEvaluationSummaryDTO(
+                total=len(requests) + len(checkpoint["invalid_lines"]),
+                completed=len(checkpoint["completed"]),
+                failed=len(checkpoint["failed"]) + len(checkpoint["invalid_lines"]),
+                skipped=skipped,
+                batches_submitted=batches_submitted
+            )
+
+        except EvaluationException:
+            raise
+        except Exception as e:
+            raise EvaluationException(f"Failed to process bulk evaluation: {str(e)}")
+
+    async def _collect_batch(
+        self,
+        batch_id: str,
+        requests: Dict[str, InitialEvaluationRequestDTO],
+        submissions: Dict[str, Submission],
+        checkpoint: Dict[str, Any]
+    ) -> None:
+        """
+        Build entities for every result of a batch, from the submitted texts, and
+        bulk-write them. A result missing the evaluation of any answer (items
+        the LLM dropped and repair could not recover) fails its submission as a
+        whole: partial results are never persisted.
+        """
+        results = await self.batch_backend.fetch_results(batch_id)
+        entities: List[Evaluation] = []
+        completed: List[str] = []
+
+        for custom_id in checkpoint["batches"][batch_id]:
+            llm_response = results.get(custom_id)
+            if llm_response is None or custom_id not in submissions:
+                checkpoint["failed"][custom_id] = "LLM returned no valid evaluation"
+                continue
+            try:
+                response = self.result_builder.build_from_llm_response(llm_response, *submissions[custom_id])
+            except (KeyError, TypeError, ValueError) as e:
+                checkpoint["failed"][custom_id] = f"Invalid evaluation: {str(e)}"
+                continue
+            missing = self._unevaluated_questions(response, submissions[custom_id])
+            if missing:
+                checkpoint["failed"][custom_id] = f"LLM returned no evaluation for questions {missing}"
+                continue
+            entities.extend(self.result_builder.to_entities(requests[custom_id].user_id, response))
+            completed.append(custom_id)
+
+        # Results stay retrievable, so a failed write is retried on the next run
+        await self.evaluation_repository.save_many(entities)
+        checkpoint["completed"].extend(completed)
+        del checkpoint["batches"][batch_id]
+
+    @staticmethod
+    def _unevaluated_questions(response: InitialEvaluationResponseDTO, submission: Submission) -> List[int]:
+        """Ids of the submitted questions whose answer has no feedback item in the response."""
+        _, answers_dict = submission
+        evaluated = Counter(feedback.answer for feedback in response.feedback)
+        missing = []
+        for question_id, answer in answers_dict.items():
+            if evaluated[answer] > 0:
+                evaluated[answer] -= 1
+            else:
+                missing.append(question_id)
+        return missing
+
+    async def _build_submissions(
+        self,
+        requests: Dict[str, InitialEvaluationRequestDTO],
+        checkpoint: Dict[str, Any]
+    ) -> Dict[str, Submission]:
+        """Pair every request with its question texts, failing requests with unknown questions."""
+        question_ids = {answer.question_id for request in requests.values() for answer in request.answers}
+        questions = {
+            question.id: question.question
+            for question in await self.question_repository.find_by_ids(list(question_ids))
+        }
+
+        submissions: Dict[str, Submission] = {}
+        for custom_id, request in requests.items():
+            answers_dict = {answer.question_id: answer.answer for answer in request.answers}
+            missing = [question_id for question_id in answers_dict if question_id not in questions]
+            if missing:
+                checkpoint["failed"][custom_id] = f"Questions not found: {missing}"
+                continue
+            submissions[custom_id] = (
+                {question_id: questions[question_id] for question_id in answers_dict},
+                answers_dict
+            )
+        return submissions
+
+    def _read_requests(
+        self,
+        input_path: str,
+        checkpoint: Dict[str, Any]
+    ) -> Dict[str, InitialEvaluationRequestDTO]:
+        """Read the JSONL input; each line is identified by its line number."""
+        requests: Dict[str, InitialEvaluationRequestDTO] = {}
+        invalid_lines: Dict[str, str] = {}
+
+        with open(input_path, encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                custom_id = f"line-{line_number}"
+                try:
+                    requests[custom_id] = InitialEvaluationRequestDTO(**json.loads(line))
+                except (json.JSONDecodeError, TypeError, ValidationError) as e:
+                    invalid_lines[custom_id] = str(e)
+
+        checkpoint["invalid_lines"] = invalid_lines
+        return requests
+
+    def _load_checkpoint(self, checkpoint_path: str) -> Dict[str, Any]:
+        """Load the checkpoint of a previous run, or start a new one."""
+        if not os.path.exists(checkpoint_path):
+            return {"completed": [], "failed": {}, "batches": {}, "invalid_lines": {}}
+
+        with open(checkpoint_path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _save_checkpoint(self, checkpoint_path: str, checkpoint: Dict[str, Any]) -> None:
+        """Write the checkpoint atomically."""
+        temporary_path = f"{checkpoint_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(checkpoint, file)
+        os.replace(temporary_path, checkpoint_path)
@@ -0,0 +1,106 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.application.evaluation.dtos.evaluation_history_dto import EvaluationHistoryPageDTO
+from app.domain.repositories.evaluation_repository import EvaluationRepositoryInterface
+from app.domain.repositories.final_evaluation_repository import FinalEvaluationRepositoryInterface
+from app.core.exceptions.evaluation_exceptions import EvaluationException, RepositoryException
+
+# Fields that can be requested; id and created_at are always returned (they form the cursor)
+INITIAL_EVALUATION_FIELDS = (
+    "id", "user_id", "question", "answer", "estimated_level",
+    "grammar", "vocabulary", "fluency", "mistakes", "suggestions", "created_at"
+)
+FINAL_EVALUATION_FIELDS = ("id", "user_id", "initial_level", "final_level", "reason", "created_at", "updated_at")
+CURSOR_FIELDS = ("created_at", "id")
+
+
+class EvaluationHistoryUseCase:
+    """
+    Use case for paging through a user's evaluation history, newest first.
+
+    Pages are read with keyset pagination on (created_at, id): the cursor
+    holds the position of the last item returned, so every page costs one
+    index range scan however deep the user's history is.
+    """
+
+    def __init__(
+        self,
+        evaluation_repository: EvaluationRepositoryInterface,
+        final_evaluation_repository: FinalEvaluationRepositoryInterface
+    ):
+        self.evaluation_repository = evaluation_repository
+        self.final_evaluation_repository = final_evaluation_repository
+
+    async def initial_history(
+        self, user_id: int, limit: int, cursor: Optional[str] = None, fields: Optional[str] = None
+    ) -> EvaluationHistoryPageDTO:
+        """Page of the user's per-answer initial evaluations."""
+        # 1. Validate the request
+        columns = _parse_fields(fields, INITIAL_EVALUATION_FIELDS)
+        before = _decode_cursor(cursor)
+
+        # 2. Read one row more than the page to know whether another page follows
+        try:
+            rows = await self.evaluation_repository.find_history_page(user_id, limit + 1, before, columns)
+        except Exception as e:
+            raise RepositoryException(f"Failed to retrieve evaluation history: {str(e)}")
+
+        # 3. Build the page
+        return _page(rows, limit)
+
+    async def final_history(
+        self, user_id: int, limit: int, cursor: Optional[str] = None, fields: Optional[str] = None
+    ) -> EvaluationHistoryPageDTO:
+        """Page of the user's final evaluations."""
+        # 1. Validate the request
+        columns = _parse_fields(fields, FINAL_EVALUATION_FIELDS)
+        before = _decode_cursor(cursor)
+
+        # 2. Read one row more than the page to know whether another page follows
+        try:
+            rows = await self.final_evaluation_repository.find_history_page(user_id, limit + 1, before, columns)
+        except Exception as e:
+            raise RepositoryException(f"Failed to retrieve final evaluation history: {str(e)}")
+
+        # 3. Build the page
+        return _page(rows, limit)
+
+
+def _parse_fields(fields: Optional[str], allowed: Sequence[str]) -> List[str]:
+    """Columns to read: the requested fields (comma-separated) plus the cursor fields; all when None."""
+    if fields is None:
+        return list(allowed)
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise EvaluationException(f"Unknown fields {unknown}; available: {', '.join(allowed)}")
+    return list(dict.fromkeys([*CURSOR_FIELDS, *requested]))
+
+
+def _page(rows: List[Dict[str, Any]], limit: int) -> EvaluationHistoryPageDTO:
+    """Page of at most ``limit`` rows, with the cursor of the last one when more rows follow."""
+    items = rows[:limit]
+    next_cursor = _encode_cursor(items[-1]) if len(rows) > limit else None
+    return EvaluationHistoryPageDTO(items=items, next_cursor=next_cursor)
+
+
+def _encode_cursor(row: Dict[str, Any]) -> str:
+    """Opaque cursor of a row's position."""
+    content = json.dumps([row["created_at"].isoformat(), row["id"]])
+    return base64.urlsafe_b64encode(content.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """Position held by a cursor; None for the first page."""
+    if not cursor:
+        return None
+    try:
+        content = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(content)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise EvaluationException("Invalid cursor")
@@ -1,15 +1,27 @@
+from typing import Optional
+
 from app.application.evaluation.dtos.final_evaluation_dto import (
     FinalEvaluationRequestDTO,
     FinalEvaluationResponseDTO
 )
 from app.application.evaluation.ports.llm_service_port import LLMServicePort
 from app.application.evaluation.ports.memory_service_port import MemoryServicePort
+from app.application.evaluation.services.evaluation_context_compactor import EvaluationContextCompactor
+from app.application.evaluation.services.evaluation_outbox_service import EvaluationOutboxService
 from app.domain.services.level_calculator import LevelCalculatorService
 from app.domain.repositories.final_evaluation_repository import FinalEvaluationRepositoryInterface
 from app.domain.entities.final_evaluation import FinalEvaluation
 from app.core.exceptions.evaluation_exceptions import (
+    CacheException,
     EvaluationException,
-    EvaluationNotFoundException
+    EvaluationNotFoundException,
+    LLMUnavailableException
+)
+from app.core.metrics import metrics
+
+context_clear_failures = metrics.counter(
+    "final_evaluation_context_clear_failures_total",
+    "Final evaluations whose initial evaluation context could not be cleared from memory"
 )
 
 
@@ -21,12 +33,16 @@ class FinalEvaluationUseCase:
         llm_service: LLMServicePort,
         memory_service: MemoryServicePort,
         level_calculator: LevelCalculatorService,
-        final_evaluation_repository: FinalEvaluationRepositoryInterface
+        final_evaluation_repository: FinalEvaluationRepositoryInterface,
+        context_max_tokens: int = 300,
+        outbox: Optional[EvaluationOutboxService] = None
     ):
         self.llm_service = llm_service
         self.memory_service = memory_service
         self.level_calculator = level_calculator
         self.final_evaluation_repository = final_evaluation_repository
+        self.context_compactor = EvaluationContextCompactor(max_tokens=context_max_tokens)
+        self.outbox = outbox
 
     async def execute(self, request: FinalEvaluationRequestDTO) -> FinalEvaluationResponseDTO:
         """Execute final evaluation use case."""
@@ -53,9 +69,9 @@ class FinalEvaluationUseCase:
                     "answer": answer.answer
                 })
 
-            # 3. Get final evaluation from LLM
+            # 3. Get final evaluation from LLM, with the initial evaluation compacted to a summary
             llm_result = await self.llm_service.final_evaluation(
-                previous_evaluation,
+                self.context_compactor.compact(previous_evaluation),
                 new_answers_with_questions
             )
 
@@ -73,17 +89,24 @@ class FinalEvaluationUseCase:
                 # Log warning but don't fail - LLM decision takes precedence
                 pass
 
-            # 5. Save final evaluation to repository
+            # 5. Save final evaluation to repository, through the write-behind outbox when enabled
             final_evaluation_entity = FinalEvaluation(
                 user_id=request.user_id,
                 initial_level=previous_level,
                 final_level=final_level,
                 reason=reason
             )
-            saved_evaluation = self.final_evaluation_repository.save(final_evaluation_entity)
+            if self.outbox is not None:
+                await self.outbox.save_final_evaluation(final_evaluation_entity)
+            else:
+                await self.final_evaluation_repository.save(final_evaluation_entity)
 
-            # 6. Clear evaluation context from memory (cleanup)
-            await self.memory_service.clear_evaluation_context(request.user_id)
+            # 6. Clear evaluation context from memory (cleanup); the result is already
+            #    saved, so a cache failure must not fail the request: the context expires anyway
+            try:
+                await self.memory_service.clear_evaluation_context(request.user_id)
+            except CacheException:
+                context_clear_failures.inc()
 
             # 7. Return final result
             return FinalEvaluationResponseDTO(
@@ -91,7 +114,7 @@ class FinalEvaluationUseCase:
                 reason=reason
             )
 
-        except EvaluationNotFoundException:
+        except (EvaluationNotFoundException, LLMUnavailableException):
             raise
         except Exception as e:
             raise EvaluationException(f"Failed to process final evaluation: {str(e)}")
\ No newline at end of file
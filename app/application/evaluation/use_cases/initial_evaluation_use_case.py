@@ -1,5 +1,5 @@
-import json
-from typing import Dict, List
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from app.application.evaluation.dtos.initial_evaluation_dto import (
     InitialEvaluationRequestDTO,
@@ -10,10 +10,46 @@ from app.application.evaluation.ports.llm_service_port import LLMServicePort
 from app.application.evaluation.ports.memory_service_port import MemoryServicePort
 from app.domain.repositories.question_repository import QuestionRepositoryInterface
 from app.domain.repositories.evaluation_repository import EvaluationRepositoryInterface
-from app.domain.entities.evaluation import Evaluation
+from app.application.evaluation.services.evaluation_result_builder import EvaluationResultBuilder
+from app.application.evaluation.services.question_pool_service import QuestionPoolService
+from app.application.evaluation.services.evaluation_outbox_service import EvaluationOutboxService
 from app.domain.services.level_calculator import LevelCalculatorService
-from app.domain.value_objects.scores import Scores
-from app.core.exceptions.evaluation_exceptions import EvaluationException
+from app.domain.services.answer_guard import AnswerGuardService, VERDICT_MESSAGES
+from app.domain.value_objects.cefr_level import CEFRLevel
+from app.core.exceptions.evaluation_exceptions import (
+    EvaluationException,
+    InvalidResponseException,
+    LLMException,
+    LLMUnavailableException
+)
+from app.core.deadline import remaining_time
+from app.core.metrics import metrics
+
+# Evaluation strategies
+BATCH_STRATEGY = "batch"            # one completion for all answers
+PER_ANSWER_STRATEGY = "per_answer"  # one concurrent completion per answer
+
+# Deterministic evaluation of answers rejected by the answer guard
+GUARD_SUGGESTION = "Answer the question in your own words, with complete English sentences."
+GUARD_REASON = "None of the answers could be evaluated: they are empty, too short, copied or not in English"
+
+screened_answers = metrics.counter(
+    "answer_guard_checked_total",
+    "Answers screened by the answer guard before LLM evaluation"
+)
+guard_hits = metrics.counter(
+    "answer_guard_hits_total",
+    "Answers rejected by the answer guard and scored without the LLM",
+    ("reason",)
+)
+skipped_evaluations = metrics.counter(
+    "answer_guard_skipped_evaluations_total",
+    "Submissions whose answers were all rejected, so no LLM evaluation was made"
+)
+next_question_failures = metrics.counter(
+    "next_question_generation_failures_total",
+    "Next-question generations that failed, leaving pooled questions or none"
+)
 
 
 class InitialEvaluationUseCase:
@@ -25,84 +61,418 @@ class InitialEvaluationUseCase:
         memory_service: MemoryServicePort,
         question_repository: QuestionRepositoryInterface,
         evaluation_repository: EvaluationRepositoryInterface,
-        level_calculator: LevelCalculatorService
+        level_calculator: LevelCalculatorService,
+        evaluation_strategy: str = BATCH_STRATEGY,
+        max_concurrency: int = 8,
+        max_item_retries: int = 2,
+        question_pool: Optional[QuestionPoolService] = None,
+        answer_guard: Optional[AnswerGuardService] = None,
+        outbox: Optional[EvaluationOutboxService] = None
     ):
         self.llm_service = llm_service
         self.memory_service = memory_service
         self.question_repository = question_repository
         self.evaluation_repository = evaluation_repository
         self.level_calculator = level_calculator
+        self.result_builder = EvaluationResultBuilder(level_calculator)
+        self.evaluation_strategy = evaluation_strategy
+        self.max_concurrency = max_concurrency
+        self.max_item_retries = max_item_retries
+        self.question_pool = question_pool
+        self.answer_guard = answer_guard
+        self.outbox = outbox
 
     async def execute(self, request: InitialEvaluationRequestDTO) -> InitialEvaluationResponseDTO:
         """Execute initial evaluation use case."""
         try:
-            # 1. Get questions from repository
-            question_ids = [answer.question_id for answer in request.answers]
-            questions = self.question_repository.find_by_ids(question_ids)
-            
-            if len(questions) != len(question_ids):
-                raise EvaluationException("Some questions not found")
-
-            # 2. Prepare data for LLM
-            questions_dict = {q.id: q.question for q in questions}
-            answers_dict = {answer.question_id: answer.answer for answer in request.answers}
-
-            # 3. Get LLM evaluation
-            llm_response = await self.llm_service.evaluate_answers(questions_dict, answers_dict)
-
-            # 4. Process LLM response
-            feedback_list = []
-            individual_levels = []
-            individual_scores = []
-
-            for feedback_data in llm_response["feedback"]:
-                feedback = FeedbackDTO(
-                    question=feedback_data["question"],
-                    answer=feedback_data["answer"],
-                    estimated_level=feedback_data["estimated_level"],
-                    scores=feedback_data["scores"],
-                    mistakes=feedback_data["mistakes"],
-                    suggestions=feedback_data["suggestions"]
-                )
-                feedback_list.append(feedback)
-                individual_levels.append(feedback_data["estimated_level"])
-                individual_scores.append(Scores.from_dict(feedback_data["scores"]))
-
-            # 5. Calculate overall level and scores using domain service
-            overall_level = self.level_calculator.calculate_overall_level(individual_levels)
-            average_scores = self.level_calculator.calculate_average_scores(individual_scores)
-
-            # 6. Create response DTO
-            response = InitialEvaluationResponseDTO(
-                level=overall_level,
-                scores=average_scores.to_dict(),
-                reason=llm_response.get("reason", "Based on overall performance"),
-                feedback=feedback_list,
-                next_questions=llm_response.get("next_questions", [])
-            )
+            # 1-2. Get questions from repository and prepare data for LLM
+            questions_dict, answers_dict = await self._prepare_llm_input(request)
+
+            # 3. Score degenerate answers locally; only the rest go to the LLM
+            guarded_feedback, llm_answers = self._screen_answers(questions_dict, answers_dict)
 
-            # 7. Save to memory for later use
-            await self.memory_service.save_evaluation_context(
-                request.user_id,
-                response.dict()
+            # 4. Get LLM evaluation
+            if not llm_answers:
+                llm_response = {"feedback": [], "reason": GUARD_REASON, "next_questions": []}
+            elif self.evaluation_strategy == PER_ANSWER_STRATEGY:
+                llm_response = await self._evaluate_per_answer(questions_dict, llm_answers)
+            else:
+                llm_response = await self._evaluate_batch(questions_dict, llm_answers, answers_dict)
+            llm_response["feedback"] = self._merge_feedback(
+                answers_dict, guarded_feedback, llm_response["feedback"]
             )
 
-            # 8. Save evaluations to repository
-            for feedback in feedback_list:
-                evaluation = Evaluation(
-                    user_id=request.user_id,
-                    question=feedback.question,
-                    answer=feedback.answer,
-                    estimated_level=feedback.estimated_level,
-                    grammar=feedback.scores["grammar"],
-                    vocabulary=feedback.scores["vocabulary"],
-                    fluency=feedback.scores["fluency"],
-                    mistakes=json.dumps(feedback.mistakes),
-                    suggestions=json.dumps(feedback.suggestions)
+            # 5-7. Rebuild feedback from the submitted texts, calculate overall level and scores, create response DTO
+            response = self.result_builder.build_from_llm_response(llm_response, questions_dict, answers_dict)
+
+            # 8. Pick next-round questions for the overall level (without a pool they
+            #    were already generated alongside the LLM evaluation, if there was one)
+            if not response.next_questions and (self.question_pool is not None or not llm_answers):
+                response.next_questions = await self._select_next_questions(
+                    request.user_id, response.level, questions_dict, answers_dict
                 )
-                self.evaluation_repository.save(evaluation)
+
+            # 9-10. Save to memory and repository
+            await self._persist(request.user_id, response)
 
             return response
 
+        except LLMUnavailableException:
+            raise
         except Exception as e:
-            raise EvaluationException(f"Failed to process initial evaluation: {str(e)}")
\ No newline at end of file
+            raise EvaluationException(f"Failed to process initial evaluation: {str(e)}")
+
+    async def execute_stream(self, request: InitialEvaluationRequestDTO) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute initial evaluation, yielding events while the LLM output streams in.
+
+        Yields ``{"event", "data"}`` dicts: one ``feedback`` per answer as soon as
+        it is complete (answers rejected by the answer guard first), then ``evaluation`` (level, scores, reason) and finally
+        ``next_questions``, picked for the overall level. The result is
+        persisted once the stream is complete.
+        """
+        try:
+            # 1-2. Get questions from repository and prepare data for LLM
+            questions_dict, answers_dict = await self._prepare_llm_input(request)
+
+            # 3. Score degenerate answers locally; only the rest go to the LLM
+            guarded_feedback, llm_answers = self._screen_answers(questions_dict, answers_dict)
+            feedback_list: List[FeedbackDTO] = []
+            for feedback_data in guarded_feedback:
+                feedback = self.result_builder.build_feedback(feedback_data)
+                feedback_list.append(feedback)
+                yield {"event": "feedback", "data": feedback.dict()}
+
+            # 4-5. Stream LLM evaluation, forwarding feedback as it arrives
+            reason: Optional[str] = None if llm_answers else GUARD_REASON
+            next_questions: List[str] = []
+            summary_sent = False
+
+            if not llm_answers:
+                events = self._no_events()
+            elif self.evaluation_strategy == PER_ANSWER_STRATEGY:
+                events = self._stream_per_answer(questions_dict, llm_answers)
+            else:
+                events = self._stream_batch(questions_dict, llm_answers, answers_dict)
+
+            llm_position = 0
+            async for event in events:
+                if event["type"] == "feedback":
+                    # Streamed items reference their answer by question_id only
+                    feedback_data = self.result_builder.attach_submission(
+                        event["data"], questions_dict, llm_answers, llm_position
+                    )
+                    llm_position += 1
+                    feedback = self.result_builder.build_feedback(feedback_data)
+                    feedback_list.append(feedback)
+                    yield {"event": "feedback", "data": feedback.dict()}
+                elif event["type"] == "reason":
+                    reason = event["data"]
+                elif event["type"] == "feedback_end" and not summary_sent:
+                    summary_sent = True
+                    yield {"event": "evaluation", "data": self.result_builder.summarize(feedback_list, reason)}
+                elif event["type"] == "next_questions":
+                    next_questions = event["data"]
+
+            # 6-7. Calculate overall level and scores, create response DTO
+            response = self.result_builder.build_response(feedback_list, reason, next_questions)
+            if not summary_sent:
+                yield {"event": "evaluation", "data": self.result_builder.summarize(feedback_list, reason)}
+
+            # 8. Pick next-round questions for the overall level (without a pool they
+            #    were already generated alongside the LLM evaluation, if there was one)
+            if not response.next_questions and (self.question_pool is not None or not llm_answers):
+                response.next_questions = await self._select_next_questions(
+                    request.user_id, response.level, questions_dict, answers_dict
+                )
+            yield {"event": "next_questions", "data": response.next_questions}
+
+            # 9-10. Save to memory and repository
+            await self._persist(request.user_id, response)
+
+        except LLMUnavailableException:
+            raise
+        except Exception as e:
+            raise EvaluationException(f"Failed to process initial evaluation: {str(e)}")
+
+    async def _prepare_llm_input(
+        self,
+        request: InitialEvaluationRequestDTO
+    ) -> Tuple[Dict[int, str], Dict[int, str]]:
+        """Load the answered questions and build the question/answer dicts sent to the LLM."""
+        question_ids = [answer.question_id for answer in request.answers]
+        questions = await self.question_repository.find_by_ids(question_ids)
+
+        if len(questions) != len(question_ids):
+            raise EvaluationException("Some questions not found")
+
+        questions_dict = {q.id: q.question for q in questions}
+        answers_dict = {answer.question_id: answer.answer for answer in request.answers}
+        return questions_dict, answers_dict
+
+    def _screen_answers(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, str]]:
+        """Deterministic A1 / zero-score feedback for degenerate answers, and the answers left for the LLM."""
+        if self.answer_guard is None:
+            return [], answers_dict
+
+        verdicts = self.answer_guard.screen(questions_dict, answers_dict)
+        screened_answers.inc(len(answers_dict))
+        for verdict in verdicts.values():
+            guard_hits.inc(reason=verdict)
+        if answers_dict and len(verdicts) == len(answers_dict):
+            skipped_evaluations.inc()
+
+        guarded_feedback = [
+            {
+                "question_id": question_id,
+                "question": questions_dict[question_id],
+                "answer": answers_dict[question_id],
+                "estimated_level": CEFRLevel.A1.value,
+                "scores": {"grammar": 0.0, "vocabulary": 0.0, "fluency": 0.0},
+                "mistakes": [VERDICT_MESSAGES[verdict]],
+                "suggestions": [GUARD_SUGGESTION]
+            }
+            for question_id, verdict in verdicts.items()
+        ]
+        llm_answers = {
+            question_id: answer
+            for question_id, answer in answers_dict.items()
+            if question_id not in verdicts
+        }
+        return guarded_feedback, llm_answers
+
+    @staticmethod
+    def _merge_feedback(
+        answers_dict: Dict[int, str],
+        guarded_feedback: List[Dict[str, Any]],
+        llm_feedback: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Guard and LLM feedback together, in the order the answers were submitted."""
+        if not guarded_feedback:
+            return llm_feedback
+        positions = {question_id: position for position, question_id in enumerate(answers_dict)}
+        return sorted(
+            [*guarded_feedback, *llm_feedback],
+            key=lambda item: positions.get(item.get("question_id"), len(positions))
+        )
+
+    @staticmethod
+    async def _no_events() -> AsyncIterator[Dict[str, Any]]:
+        """Empty event stream, for submissions with no answer left for the LLM."""
+        return
+        yield
+
+    async def _evaluate_batch(
+        self,
+        questions_dict: Dict[int, str],
+        llm_answers: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> Dict[str, Any]:
+        """
+        Score the answers in one LLM call. Without a question pool, next
+        questions (which do not depend on the level) are generated in parallel.
+        """
+        if self.question_pool is not None:
+            return await self.llm_service.evaluate_answers(questions_dict, llm_answers)
+
+        next_questions_task = asyncio.ensure_future(
+            self._generate_next_questions_best_effort(asyncio.Semaphore(1), questions_dict, answers_dict)
+        )
+        try:
+            llm_response = await self.llm_service.evaluate_answers(questions_dict, llm_answers)
+            if llm_response.get("next_questions"):
+                return llm_response
+            return {**llm_response, "next_questions": await next_questions_task}
+        finally:
+            next_questions_task.cancel()
+
+    async def _stream_batch(
+        self,
+        questions_dict: Dict[int, str],
+        llm_answers: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the single-call evaluation; without a question pool, next questions are generated meanwhile."""
+        next_questions_task = None
+        if self.question_pool is None:
+            next_questions_task = asyncio.ensure_future(
+                self._generate_next_questions_best_effort(asyncio.Semaphore(1), questions_dict, answers_dict)
+            )
+
+        try:
+            streamed_next_questions = False
+            async for event in self.llm_service.stream_evaluation(questions_dict, llm_answers):
+                streamed_next_questions = streamed_next_questions or (
+                    event["type"] == "next_questions" and bool(event["data"])
+                )
+                yield event
+            if next_questions_task is not None and not streamed_next_questions:
+                yield {"type": "next_questions", "data": await next_questions_task}
+        finally:
+            if next_questions_task is not None:
+                next_questions_task.cancel()
+
+    async def _evaluate_per_answer(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> Dict[str, Any]:
+        """
+        Score every answer in its own concurrent LLM call. Without a question
+        pool, next questions are generated in parallel.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        next_questions_task = None
+        if self.question_pool is None:
+            next_questions_task = asyncio.ensure_future(
+                self._generate_next_questions_best_effort(semaphore, questions_dict, answers_dict)
+            )
+        answer_tasks = [
+            asyncio.ensure_future(
+                self._evaluate_answer_with_retry(semaphore, question_id, questions_dict[question_id], answer)
+            )
+            for question_id, answer in answers_dict.items()
+        ]
+
+        try:
+            feedback = await asyncio.gather(*answer_tasks)
+            next_questions = await next_questions_task if next_questions_task is not None else []
+            return {"feedback": list(feedback), "next_questions": next_questions}
+        finally:
+            for task in [*answer_tasks, next_questions_task]:
+                if task is not None:
+                    task.cancel()
+
+    async def _stream_per_answer(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Fan out per-answer calls, yielding each feedback item as soon as its call finishes."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        next_questions_task = None
+        if self.question_pool is None:
+            next_questions_task = asyncio.ensure_future(
+                self._generate_next_questions_best_effort(semaphore, questions_dict, answers_dict)
+            )
+        answer_tasks = [
+            asyncio.ensure_future(
+                self._evaluate_answer_with_retry(semaphore, question_id, questions_dict[question_id], answer)
+            )
+            for question_id, answer in answers_dict.items()
+        ]
+
+        try:
+            feedback = []
+            for completed in asyncio.as_completed(answer_tasks):
+                feedback_data = await completed
+                feedback.append(feedback_data)
+                yield {"type": "feedback", "data": feedback_data}
+            yield {"type": "feedback_end", "data": feedback}
+            if next_questions_task is not None:
+                yield {"type": "next_questions", "data": await next_questions_task}
+        finally:
+            for task in [*answer_tasks, next_questions_task]:
+                if task is not None:
+                    task.cancel()
+
+    async def _evaluate_answer_with_retry(
+        self,
+        semaphore: asyncio.Semaphore,
+        question_id: int,
+        question: str,
+        answer: str
+    ) -> Dict[str, Any]:
+        """Evaluate one answer, retrying only that item on LLM failures."""
+        feedback_data = await self._call_with_retry(
+            semaphore,
+            lambda: self.llm_service.evaluate_single_answer(question, answer)
+        )
+        # The texts are known locally and not part of the LLM output
+        return {**feedback_data, "question_id": question_id, "question": question, "answer": answer}
+
+    async def _generate_next_questions_with_retry(
+        self,
+        semaphore: asyncio.Semaphore,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[str]:
+        """Generate next questions, retrying on LLM failures."""
+        return await self._call_with_retry(
+            semaphore,
+            lambda: self.llm_service.generate_next_questions(questions_dict, answers_dict)
+        )
+
+    async def _generate_next_questions_best_effort(
+        self,
+        semaphore: asyncio.Semaphore,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[str]:
+        """Generate next questions; a failure leaves none instead of failing the evaluation."""
+        try:
+            return await self._generate_next_questions_with_retry(semaphore, questions_dict, answers_dict)
+        except LLMException:
+            next_question_failures.inc()
+            return []
+
+    async def _select_next_questions(
+        self,
+        user_id: int,
+        level: str,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[str]:
+        """
+        Next-round questions from the question pool, generated by the LLM when
+        there is no pool; a pool that comes up short is topped up with
+        generated questions, when generation succeeds.
+        """
+        if self.question_pool is None:
+            return await self._generate_next_questions_best_effort(asyncio.Semaphore(1), questions_dict, answers_dict)
+
+        next_questions = await self.question_pool.next_questions(user_id, level)
+        if len(next_questions) >= self.question_pool.count:
+            return next_questions
+        generated = await self._generate_next_questions_best_effort(asyncio.Semaphore(1), questions_dict, answers_dict)
+        next_questions += [question for question in generated if question not in next_questions]
+        return next_questions[:self.question_pool.count]
+
+    async def _call_with_retry(self, semaphore: asyncio.Semaphore, call):
+        """
+        Run an LLM call under the concurrency bound, retrying invalid responses
+        with exponential backoff while the request deadline allows. Transient
+        failures are already retried by the LLM service and propagate as is.
+        """
+        for attempt in range(self.max_item_retries + 1):
+            try:
+                async with semaphore:
+                    return await call()
+            except InvalidResponseException:
+                backoff = 0.5 * 2 ** attempt
+                remaining = remaining_time()
+                if attempt == self.max_item_retries or (remaining is not None and remaining <= backoff):
+                    raise
+                await asyncio.sleep(backoff)
+
+    async def _persist(self, user_id: int, response: InitialEvaluationResponseDTO) -> None:
+        """
+        Save the evaluation context to memory and all feedback items to the
+        repository, through the write-behind outbox when enabled.
+        """
+        # Save to memory for later use
+        await self.memory_service.save_evaluation_context(
+            user_id,
+            response.dict()
+        )
+
+        # Save evaluations to repository
+        evaluations = self.result_builder.to_entities(user_id, response)
+        if self.outbox is not None:
+            await self.outbox.save_evaluations(evaluations)
+        else:
+            await self.evaluation_repository.save_many(evaluations)
@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Optional, Tuple
 from app.application.questions.dtos.questions_dto import QuestionListResponseDTO, QuestionDTO
+from app.domain.entities.questions import Question
 from app.domain.repositories.question_repository import QuestionRepositoryInterface
 from app.core.exceptions.evaluation_exceptions import RepositoryException
 
@@ -10,22 +11,36 @@ class ListQuestionsUseCase:
     def __init__(self, question_repository: QuestionRepositoryInterface):
         self.question_repository = question_repository
 
-    def execute(self) -> QuestionListResponseDTO:
+    async def execute(self) -> QuestionListResponseDTO:
         """Execute the list questions use case."""
         try:
             # Get all questions from repository
-            questions = self.question_repository.find_all()
+            questions = await self.question_repository.find_all()
             
             # Convert to DTOs
-            question_dtos = [
-                QuestionDTO(
-                    id=question.id,
-                    question=question.question
-                )
-                for question in questions
-            ]
-            
-            return QuestionListResponseDTO(questions=question_dtos)
+            return self._to_response(questions)
             
         except Exception as e:
-            raise RepositoryException(f"Failed to retrieve questions: {str(e)}")
\ No newline at end of file
+            raise RepositoryException(f"Failed to retrieve questions: {str(e)}")
+
+    async def execute_versioned(self) -> Tuple[Optional[str], QuestionListResponseDTO]:
+        """
+        List the questions together with the version of the catalog they were
+        read from, for conditional requests; the version is None when not tracked.
+        """
+        try:
+            version, questions = await self.question_repository.find_all_versioned()
+            return version, self._to_response(questions)
+        except Exception as e:
+            raise RepositoryException(f"Failed to retrieve questions: {str(e)}")
+
+    def _to_response(self, questions: List[Question]) -> QuestionListResponseDTO:
+        """Convert question entities to the response DTO."""
+        question_dtos = [
+            QuestionDTO(
+                id=question.id,
+                question=question.question
+            )
+            for question in questions
+        ]
+        return QuestionListResponseDTO(questions=question_dtos)
\ No newline at end of file
@@ -1,22 +1,160 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config.settings import settings
+from app.core.metrics import metrics
+
+pool_checkouts = metrics.counter(
+    "db_pool_checkouts_total",
+    "Database connections checked out of the pool"
+)
+pool_checkout_wait = metrics.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection (includes opening new ones)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+pool_checked_out = metrics.gauge(
+    "db_pool_checked_out",
+    "Database connections currently checked out"
+)
+pool_overflow = metrics.gauge(
+    "db_pool_overflow",
+    "Database connections open beyond DB_POOL_SIZE (negative while the pool is not yet full)"
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool recording checkouts, checkout wait time, checked-out connections and overflow."""
+
+    def _do_get(self):
+        started = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            pool_checkout_wait.observe(time.monotonic() - started)
+            pool_checkouts.inc()
+            self._record_usage()
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._record_usage()
+
+    def _record_usage(self) -> None:
+        pool_checked_out.set(self.checkedout())
+        pool_overflow.set(self.overflow())
+
 
-# Database engine
-engine = create_engine(settings.database_url, echo=settings.DEBUG)
+# Single async database engine (asyncpg driver) shared by the whole application
+engine = create_async_engine(
+    settings.async_database_url,
+    echo=settings.DB_ECHO,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING
+)
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Session factory; loaded attributes stay readable after commit, as entities are built from them
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
 
 
-def get_db():
-    """Dependency to get database session."""
-    db = SessionLocal()
+class UnitOfWork:
+    """
+    Database session shared by every repository within a scope (one HTTP
+    request). The session is opened on first use and closed when the scope
+    ends; between transactions it holds no pooled connection.
+    """
+
+    def __init__(self):
+        self._session: Optional[AsyncSession] = None
+        self.closed = False
+
+    @property
+    def session(self) -> AsyncSession:
+        """The scope's session, opened on first use."""
+        if self.closed:
+            raise RuntimeError("Unit of work is already closed")
+        if self._session is None:
+            self._session = SessionLocal()
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session, rolling back any transaction left open."""
+        self.closed = True
+        if self._session is not None:
+            await self._session.close()
+
+
+_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar("unit_of_work", default=None)
+
+
+@asynccontextmanager
+async def unit_of_work_scope() -> AsyncIterator[UnitOfWork]:
+    """Run a block with a unit of work that repositories share; it is always closed on exit."""
+    unit_of_work = UnitOfWork()
+    token = _unit_of_work.set(unit_of_work)
     try:
-        yield db
+        yield unit_of_work
     finally:
-        db.close()
\ No newline at end of file
+        _unit_of_work.reset(token)
+        await unit_of_work.close()
+
+
+@asynccontextmanager
+async def repository_session(session: Optional[AsyncSession] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Session for one repository operation: the explicitly injected one, else the
+    current unit of work's (its transaction ended after the operation), else a
+    new session closed after the operation.
+    """
+    if session is not None:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        return
+
+    unit_of_work = _unit_of_work.get()
+    if unit_of_work is None or unit_of_work.closed:
+        async with SessionLocal() as session:
+            yield session
+        return
+
+    session = unit_of_work.session
+    try:
+        yield session
+        # End the operation's transaction, so the connection goes back to the
+        # pool while the request waits on other work (LLM calls)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def database_available() -> bool:
+    """Whether the database answers a trivial query."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get database session."""
+    async with repository_session() as db:
+        yield db
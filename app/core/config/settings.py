@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
@@ -14,7 +14,16 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: int = 5432
-    
+
+    # Database connection pool (one engine per process). Pre-ping discards connections
+    # dropped by the server; recycle replaces them before server/proxy idle timeouts.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False  # log every SQL statement
+
     # Redis settings
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
@@ -23,6 +32,137 @@ class Settings(BaseSettings):
     # LLM settings
     OPENAI_API_KEY: str
     OPENAI_MODEL: str = "gpt-4o-mini"
+    OPENAI_BASE_URL: Optional[str] = None  # e.g. the local simulator server, http://localhost:8089/v1
+    LLM_BACKEND: str = "openai"  # "openai" or the in-process "simulator"
+    LLM_TEMPERATURE: float = 0.7
+    LLM_RESPONSE_FORMAT: str = "json_schema"  # "json_schema", "json_object" or "text"
+
+    # Tiered model routing: OPENAI_MODEL is the strong tier, LLM_FAST_MODEL the fast tier.
+    # Fast-tier results that fail validation or rate answers above LLM_FAST_TIER_MAX_LEVEL are escalated.
+    LLM_ROUTING_ENABLED: bool = False
+    LLM_FAST_MODEL: str = "gpt-4o-mini"
+    LLM_FAST_TIER_MAX_LEVEL: str = "A2"
+    LLM_TASK_TIERS: Dict[str, str] = {
+        "evaluation": "strong",
+        "batch_evaluation": "strong",
+        "answer_evaluation": "fast",
+        "next_questions": "fast",
+        "question_generation": "fast",
+        "final_evaluation": "strong"
+    }
+    # USD per million [input, output] tokens, for cost reporting
+    LLM_MODEL_PRICES: Dict[str, List[float]] = {
+        "gpt-4o-mini": [0.15, 0.60],
+        "gpt-4o": [2.50, 10.00]
+    }
+
+    # LLM simulator (LLM_BACKEND="simulator" or llm_simulator_server.py): latency is
+    # log-normal around the median, followed by generation at the token rate
+    LLM_SIM_LATENCY_MEDIAN_SECONDS: float = 1.5
+    LLM_SIM_LATENCY_SIGMA: float = 0.5
+    LLM_SIM_TOKENS_PER_SECOND: float = 80.0
+    LLM_SIM_ERROR_RATE: float = 0.0
+    LLM_SIM_RATE_LIMIT_BURST_PROBABILITY: float = 0.0  # chance per call that a 429 burst starts
+    LLM_SIM_RATE_LIMIT_BURST_SECONDS: float = 5.0
+    LLM_SIM_SEED: Optional[int] = None
+
+    # LLM HTTP client settings (shared, pooled connection)
+    LLM_MAX_CONNECTIONS: int = 256
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 64
+    LLM_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_CONNECT_TIMEOUT: float = 5.0
+    LLM_REQUEST_TIMEOUT: float = 60.0
+    LLM_MAX_RETRIES: int = 0  # SDK retries; deadline-aware retries are done by the resilience layer
+
+    # Resilience: hedged requests and deadline-aware retries around LLM calls
+    LLM_RESILIENCE_ENABLED: bool = True
+    LLM_HEDGE_PERCENTILE: float = 95.0
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_RETRY_ATTEMPTS: int = 2
+    LLM_RETRY_BACKOFF_BASE: float = 0.5
+    LLM_RETRY_BACKOFF_MAX: float = 8.0
+    REQUEST_DEADLINE_SECONDS: float = 90.0
+
+    # Adaptive (AIMD) concurrency limit and circuit breaker in front of the LLM provider
+    LLM_ADAPTIVE_CONCURRENCY_ENABLED: bool = True
+    LLM_CONCURRENCY_INITIAL_LIMIT: int = 16
+    LLM_CONCURRENCY_MIN_LIMIT: int = 1
+    LLM_CONCURRENCY_MAX_LIMIT: int = 128
+    LLM_CONCURRENCY_BACKOFF_RATIO: float = 0.5
+    LLM_CONCURRENCY_LATENCY_THRESHOLD_SECONDS: float = 20.0
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    LLM_CIRCUIT_RECOVERY_SECONDS: float = 30.0
+
+    # Evaluation strategy: "batch" (one completion) or "per_answer" (concurrent fan-out)
+    EVALUATION_STRATEGY: str = "batch"
+    EVALUATION_MAX_CONCURRENCY: int = 8
+    EVALUATION_ITEM_RETRIES: int = 2
+
+    # Local pre-screening of degenerate answers (empty, one-word, copied from the
+    # question, repetitive, not English, duplicated), scored A1 / zero without the LLM
+    ANSWER_GUARD_ENABLED: bool = True
+    ANSWER_GUARD_MIN_WORDS: int = 2
+    ANSWER_GUARD_MIN_DIVERSITY: float = 0.3
+    ANSWER_GUARD_MAX_QUESTION_OVERLAP: float = 0.9
+    ANSWER_GUARD_MIN_LATIN_RATIO: float = 0.8
+
+    # Token budget of the initial evaluation summary sent to the final evaluation
+    FINAL_EVALUATION_CONTEXT_MAX_TOKENS: int = 300
+
+    # Pre-generated next-round questions, indexed by CEFR level and topic in Redis.
+    # A level is refilled in the background when it drops below the low watermark.
+    QUESTION_POOL_ENABLED: bool = True
+    QUESTION_POOL_TOPICS: List[str] = [
+        "daily life", "work", "travel", "education",
+        "technology", "environment", "culture", "health"
+    ]
+    QUESTION_POOL_NEXT_QUESTIONS: int = 5
+    QUESTION_POOL_LOW_WATERMARK: int = 40
+    QUESTION_POOL_REFILL_PER_TOPIC: int = 5
+    QUESTION_POOL_MAX_PER_TOPIC: int = 200
+    QUESTION_POOL_SERVED_TTL_SECONDS: int = 30 * 86400
+
+    # In-process question catalog cache; writes bump a shared version in Redis that other
+    # workers follow through pub/sub, and check at least every interval
+    QUESTION_CATALOG_CACHE_ENABLED: bool = True
+    QUESTION_CATALOG_CHECK_INTERVAL_SECONDS: float = 30.0
+
+    # Write-behind persistence of evaluation results: requests queue them in a Redis Stream
+    # outbox and a background consumer group bulk-writes them to the database
+    EVALUATION_OUTBOX_ENABLED: bool = True
+    EVALUATION_OUTBOX_BATCH_SIZE: int = 200
+    EVALUATION_OUTBOX_BLOCK_MS: int = 1000
+    EVALUATION_OUTBOX_CLAIM_IDLE_SECONDS: float = 30.0  # unacknowledged messages are retried after this
+    EVALUATION_OUTBOX_MAX_DELIVERIES: int = 5  # before a message failing on its own is dead-lettered
+
+    # Monthly partitions of evaluations and final_evaluations (manage_partitions.py). Months older
+    # than the retention are archived to zstd-compressed JSONL files, still read by user/ID lookups
+    PARTITION_MONTHS_AHEAD: int = 3
+    EVALUATION_ARCHIVE_ENABLED: bool = True
+    EVALUATION_ARCHIVE_DIR: str = "archive"
+    EVALUATION_ARCHIVE_RETENTION_MONTHS: int = 12
+    EVALUATION_ARCHIVE_COMPRESSION_LEVEL: int = 9
+
+    # Evaluation history endpoints (keyset pagination)
+    HISTORY_PAGE_DEFAULT_LIMIT: int = 20
+    HISTORY_PAGE_MAX_LIMIT: int = 100
+
+    # Cross-request micro-batching of evaluate_answers calls
+    LLM_MICRO_BATCH_ENABLED: bool = False
+    LLM_MICRO_BATCH_WINDOW_MS: float = 30.0
+    LLM_MICRO_BATCH_MAX_SIZE: int = 8
+
+    # Offline bulk scoring through a batch-submission backend ("openai" or "local")
+    LLM_BATCH_BACKEND: str = "openai"
+    LLM_BATCH_LOCAL_DIR: str = ".batch_jobs"
+    BULK_BATCH_SIZE: int = 1000
+    BULK_MAX_IN_FLIGHT_BATCHES: int = 4
+    BULK_POLL_INTERVAL_SECONDS: float = 30.0
+
+    # LLM response cache (only used when LLM_TEMPERATURE is 0)
+    LLM_CACHE_ENABLED: bool = False
+    LLM_CACHE_TTL_SECONDS: int = 86400
+    LLM_CACHE_MAX_ENTRIES: int = 10000
 
     class Config:
         env_file = ".env"
@@ -32,6 +172,11 @@ class Settings(BaseSettings):
         """Get PostgreSQL connection URL."""
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def async_database_url(self) -> str:
+        """Get PostgreSQL connection URL for the async (asyncpg) driver."""
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
     @property
     def redis_url(self) -> str:
         """Get Redis connection URL."""
@@ -2,19 +2,31 @@ from dependency_injector import containers, providers
 
 # Core imports
 from app.core.config.settings import settings
+from app.core.config.database import database_available
 
 # Domain services
 from app.domain.services.level_calculator import LevelCalculatorService
+from app.domain.services.answer_guard import AnswerGuardService
 
 # Application layer
 from app.application.evaluation.use_cases.initial_evaluation_use_case import InitialEvaluationUseCase
 from app.application.evaluation.use_cases.final_evaluation_use_case import FinalEvaluationUseCase
+from app.application.evaluation.use_cases.bulk_evaluation_use_case import BulkEvaluationUseCase
+from app.application.evaluation.use_cases.evaluation_history_use_case import EvaluationHistoryUseCase
+from app.application.evaluation.services.question_pool_service import QuestionPoolService
+from app.application.evaluation.services.evaluation_outbox_service import EvaluationOutboxService
 from app.application.questions.use_cases.list_questions_use_case import ListQuestionsUseCase
 
 # Infrastructure layer
-from app.infrastructure.external_services.langchain_llm_service import LangchainLLMService
+from app.infrastructure.external_services.llm_service_factory import build_llm_service, build_batch_llm_backend
 from app.infrastructure.persistence.redis.memory_service import RedisMemoryService
+from app.infrastructure.persistence.redis.llm_response_cache import RedisLLMResponseCache
+from app.infrastructure.persistence.redis.question_pool import RedisQuestionPool
+from app.infrastructure.persistence.redis.question_catalog_version import RedisQuestionCatalogVersion
+from app.infrastructure.persistence.redis.evaluation_outbox import RedisEvaluationOutbox
+from app.infrastructure.persistence.archive.partition_archive import PartitionArchive
 from app.infrastructure.persistence.sqlalchemy.repositories.question_repository_impl import SqlAlchemyQuestionRepository
+from app.infrastructure.persistence.sqlalchemy.repositories.cached_question_repository import CachedQuestionRepository
 from app.infrastructure.persistence.sqlalchemy.repositories.evaluation_repository_impl import SqlAlchemyEvaluationRepository
 from app.infrastructure.persistence.sqlalchemy.repositories.final_evaluation_repository_impl import SqlAlchemyFinalEvaluationRepository
 
@@ -34,16 +46,74 @@ class Container(containers.DeclarativeContainer):
 
     # Domain services
     level_calculator_service = providers.Factory(LevelCalculatorService)
+    answer_guard_service = providers.Factory(
+        AnswerGuardService,
+        min_words=settings.ANSWER_GUARD_MIN_WORDS,
+        min_diversity=settings.ANSWER_GUARD_MIN_DIVERSITY,
+        max_question_overlap=settings.ANSWER_GUARD_MAX_QUESTION_OVERLAP,
+        min_latin_ratio=settings.ANSWER_GUARD_MIN_LATIN_RATIO
+    )
 
     # Infrastructure services
-    llm_service = providers.Factory(LangchainLLMService)
+    llm_response_cache = providers.Singleton(RedisLLMResponseCache)
+
+    # Singleton so every request shares one client and its keep-alive pool
+    llm_service = providers.Singleton(
+        build_llm_service,
+        response_cache=llm_response_cache if settings.LLM_CACHE_ENABLED else None
+    )
     
+    batch_llm_backend = providers.Singleton(build_batch_llm_backend)
+
     memory_service = providers.Factory(RedisMemoryService)
 
+    # Singleton so refills of a level are deduplicated across requests
+    question_pool_service = providers.Singleton(
+        QuestionPoolService,
+        pool=providers.Singleton(RedisQuestionPool),
+        llm_service=llm_service,
+        topics=settings.QUESTION_POOL_TOPICS,
+        count=settings.QUESTION_POOL_NEXT_QUESTIONS,
+        low_watermark=settings.QUESTION_POOL_LOW_WATERMARK,
+        refill_per_topic=settings.QUESTION_POOL_REFILL_PER_TOPIC,
+        max_per_topic=settings.QUESTION_POOL_MAX_PER_TOPIC
+    )
+
     # Repositories
-    question_repository = providers.Factory(SqlAlchemyQuestionRepository)
-    evaluation_repository = providers.Factory(SqlAlchemyEvaluationRepository)
-    final_evaluation_repository = providers.Factory(SqlAlchemyFinalEvaluationRepository)
+    # Singleton so every request reads the same in-process catalog snapshot
+    question_repository = providers.Singleton(
+        CachedQuestionRepository,
+        repository=providers.Factory(SqlAlchemyQuestionRepository),
+        version_store=providers.Singleton(RedisQuestionCatalogVersion),
+        check_interval=settings.QUESTION_CATALOG_CHECK_INTERVAL_SECONDS
+    ) if settings.QUESTION_CATALOG_CACHE_ENABLED else providers.Factory(SqlAlchemyQuestionRepository)
+    # Singleton so archive manifests are loaded once per process
+    partition_archive = providers.Singleton(
+        PartitionArchive,
+        directory=settings.EVALUATION_ARCHIVE_DIR,
+        compression_level=settings.EVALUATION_ARCHIVE_COMPRESSION_LEVEL
+    )
+    evaluation_repository = providers.Factory(
+        SqlAlchemyEvaluationRepository,
+        archive=partition_archive if settings.EVALUATION_ARCHIVE_ENABLED else None
+    )
+    final_evaluation_repository = providers.Factory(
+        SqlAlchemyFinalEvaluationRepository,
+        archive=partition_archive if settings.EVALUATION_ARCHIVE_ENABLED else None
+    )
+
+    # Singleton so each process runs one outbox consumer
+    evaluation_outbox_service = providers.Singleton(
+        EvaluationOutboxService,
+        outbox=providers.Singleton(RedisEvaluationOutbox),
+        evaluation_repository=evaluation_repository,
+        final_evaluation_repository=final_evaluation_repository,
+        batch_size=settings.EVALUATION_OUTBOX_BATCH_SIZE,
+        block_ms=settings.EVALUATION_OUTBOX_BLOCK_MS,
+        claim_idle=settings.EVALUATION_OUTBOX_CLAIM_IDLE_SECONDS,
+        max_deliveries=settings.EVALUATION_OUTBOX_MAX_DELIVERIES,
+        database_health_check=providers.Object(database_available)
+    )
 
     # Use cases
     initial_evaluation_use_case = providers.Factory(
@@ -52,7 +122,13 @@ class Container(containers.DeclarativeContainer):
         memory_service=memory_service,
         question_repository=question_repository,
         evaluation_repository=evaluation_repository,
-        level_calculator=level_calculator_service
+        level_calculator=level_calculator_service,
+        evaluation_strategy=settings.EVALUATION_STRATEGY,
+        max_concurrency=settings.EVALUATION_MAX_CONCURRENCY,
+        max_item_retries=settings.EVALUATION_ITEM_RETRIES,
+        question_pool=question_pool_service if settings.QUESTION_POOL_ENABLED else None,
+        answer_guard=answer_guard_service if settings.ANSWER_GUARD_ENABLED else None,
+        outbox=evaluation_outbox_service if settings.EVALUATION_OUTBOX_ENABLED else None
     )
 
     final_evaluation_use_case = providers.Factory(
@@ -60,6 +136,25 @@ class Container(containers.DeclarativeContainer):
         llm_service=llm_service,
         memory_service=memory_service,
         level_calculator=level_calculator_service,
+        final_evaluation_repository=final_evaluation_repository,
+        context_max_tokens=settings.FINAL_EVALUATION_CONTEXT_MAX_TOKENS,
+        outbox=evaluation_outbox_service if settings.EVALUATION_OUTBOX_ENABLED else None
+    )
+
+    bulk_evaluation_use_case = providers.Factory(
+        BulkEvaluationUseCase,
+        batch_backend=batch_llm_backend,
+        question_repository=question_repository,
+        evaluation_repository=evaluation_repository,
+        level_calculator=level_calculator_service,
+        batch_size=settings.BULK_BATCH_SIZE,
+        max_in_flight_batches=settings.BULK_MAX_IN_FLIGHT_BATCHES,
+        poll_interval=settings.BULK_POLL_INTERVAL_SECONDS
+    )
+
+    evaluation_history_use_case = providers.Factory(
+        EvaluationHistoryUseCase,
+        evaluation_repository=evaluation_repository,
         final_evaluation_repository=final_evaluation_repository
     )
 
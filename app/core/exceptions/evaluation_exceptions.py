@@ -31,6 +31,29 @@ class InvalidResponseException(LLMException):
     pass
 
 
+class TransientLLMException(LLMException):
+    """Exception raised for LLM failures that may succeed on retry (timeouts, connection errors, 5xx)."""
+    pass
+
+
+class LLMTimeoutException(TransientLLMException):
+    """Exception raised when an LLM call does not finish before the request deadline."""
+    pass
+
+
+class LLMRateLimitException(TransientLLMException):
+    """Exception raised when the LLM provider rate-limits a request (HTTP 429)."""
+    pass
+
+
+class LLMUnavailableException(LLMException):
+    """Exception raised without calling the LLM provider while it is considered unhealthy."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class RepositoryException(LanguageTestException):
     """Exception raised during repository operations."""
     pass
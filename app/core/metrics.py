@@ -0,0 +1,225 @@
+"""In-process metrics registry (counters, gauges and histograms with labels)."""
+
+import math
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Route template of the HTTP request being served, used to attribute work to endpoints
+_endpoint: ContextVar[str] = ContextVar("metrics_endpoint", default="background")
+
+
+def current_endpoint() -> str:
+    """Route template of the current request, or "background" outside requests."""
+    return _endpoint.get()
+
+
+@contextmanager
+def endpoint_scope(endpoint: str) -> Iterator[None]:
+    """Attribute the metrics recorded in a block to an endpoint."""
+    token = _endpoint.set(endpoint)
+    try:
+        yield
+    finally:
+        _endpoint.reset(token)
+
+
+class Metric:
+    """Base class for a labeled metric."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Build the storage key for a label set."""
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"Metric {self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the counter."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[LabelValues, float]]:
+        """Snapshot of all label sets and values."""
+        with self._lock:
+            return list(self._values.items())
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge to a value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrement the gauge."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation."""
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            counts[-1] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        """Number of observations for a label set."""
+        counts = self._counts.get(self._key(labels))
+        return counts[-1] if counts else 0
+
+    def sum(self, **labels: str) -> float:
+        """Sum of observations for a label set."""
+        return self._sums.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[LabelValues, List[int], float]]:
+        """Snapshot of bucket counts (last item is the total count) and sums."""
+        with self._lock:
+            return [(key, list(counts), self._sums[key]) for key, counts in self._counts.items()]
+
+
+class MetricsRegistry:
+    """Registry holding every metric of the process."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter, name, documentation, label_names)
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge, name, documentation, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Optional[Iterable[float]] = None
+    ) -> Histogram:
+        """Get or create a histogram."""
+        if buckets is None:
+            return self._register(Histogram, name, documentation, label_names)
+        return self._register(Histogram, name, documentation, label_names, buckets=buckets)
+
+    def collect(self) -> List[Metric]:
+        """All registered metrics, sorted by name."""
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if isinstance(metric, Histogram):
+                for key, counts, total in sorted(metric.samples()):
+                    labels = list(zip(metric.label_names, key))
+                    for bound, count in zip(metric.buckets + (math.inf,), counts):
+                        lines.append(f"{metric.name}_bucket{_format_labels(labels + [('le', _format_value(bound))])} {count}")
+                    lines.append(f"{metric.name}_sum{_format_labels(labels)} {_format_value(total)}")
+                    lines.append(f"{metric.name}_count{_format_labels(labels)} {counts[-1]}")
+            else:
+                for key, value in sorted(metric.samples()):
+                    lines.append(f"{metric.name}{_format_labels(zip(metric.label_names, key))} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric_class, name: str, documentation: str, label_names: Sequence[str], **kwargs):
+        """Return the metric registered under a name, creating it if needed."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, documentation, label_names, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not metric_class or metric.label_names != tuple(label_names):
+                raise ValueError(f"Metric {name} already registered with a different type or labels")
+            return metric
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    """Render a label set, escaping values."""
+    rendered = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+    return "{" + rendered + "}" if rendered else ""
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape backslashes, quotes and newlines in a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value; integral values without a fraction."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    """Escape a HELP line."""
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
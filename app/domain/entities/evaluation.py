@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
+import json
+from pydantic import BaseModel, field_validator
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -13,9 +14,16 @@ class Evaluation(BaseModel):
     grammar: float
     vocabulary: float
     fluency: float
-    mistakes: str  # JSON string
-    suggestions: str  # JSON string
+    mistakes: List[str]
+    suggestions: List[str]
     created_at: Optional[datetime] = None
+    dedup_key: Optional[str] = None  # idempotency key of write-behind persistence
+
+    @field_validator("mistakes", "suggestions", mode="before")
+    @classmethod
+    def decode_json_list(cls, value):
+        """Accept lists still encoded as JSON strings (outbox messages queued before JSONB storage)."""
+        return json.loads(value) if isinstance(value, str) else value
 
     def __str__(self) -> str:
         return f"Evaluation(id={self.id}, user_id={self.user_id}, level={self.estimated_level})"
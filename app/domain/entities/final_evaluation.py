@@ -14,6 +14,7 @@ class FinalEvaluation:
     id: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    dedup_key: Optional[str] = None  # idempotency key of write-behind persistence
 
     def __post_init__(self):
         """Validate the final evaluation data."""
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from app.domain.entities.evaluation import Evaluation
 
 
@@ -7,26 +8,64 @@ class EvaluationRepositoryInterface(ABC):
     """Interface for evaluation repository operations."""
 
     @abstractmethod
-    def save(self, evaluation: Evaluation) -> Evaluation:
+    async def save(self, evaluation: Evaluation) -> Evaluation:
         """Save evaluation to repository."""
         pass
 
     @abstractmethod
-    def find_by_user_id(self, user_id: int) -> List[Evaluation]:
+    async def save_many(self, evaluations: List[Evaluation]) -> List[Evaluation]:
+        """Save several evaluations in a single transaction."""
+        pass
+
+    @abstractmethod
+    async def save_many_deduplicated(self, evaluations: List[Evaluation]) -> int:
+        """Save the evaluations whose dedup_key is not stored yet; return how many were saved."""
+        pass
+
+    @abstractmethod
+    async def find_by_user_id(self, user_id: int) -> List[Evaluation]:
         """Find evaluations by user ID."""
         pass
 
     @abstractmethod
-    def find_by_id(self, evaluation_id: int) -> Optional[Evaluation]:
+    async def find_history_page(
+        self, user_id: int, limit: int, before: Optional[Tuple[datetime, int]], fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Up to ``limit`` evaluations of a user older than the (created_at, id) position ``before``, newest first, with only ``fields``."""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, evaluation_id: int) -> Optional[Evaluation]:
         """Find evaluation by ID."""
         pass
 
     @abstractmethod
-    def update(self, evaluation: Evaluation) -> Evaluation:
+    async def find_by_mistake(
+        self, mistake: str, estimated_level: Optional[str] = None, limit: int = 100
+    ) -> List[Evaluation]:
+        """Find the latest evaluations reporting a mistake, optionally at one level."""
+        pass
+
+    @abstractmethod
+    async def most_common_mistakes(
+        self, estimated_level: Optional[str] = None, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Most frequent mistakes with their occurrences, optionally at one level."""
+        pass
+
+    @abstractmethod
+    async def most_common_suggestions(
+        self, estimated_level: Optional[str] = None, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Most frequent suggestions with their occurrences, optionally at one level."""
+        pass
+
+    @abstractmethod
+    async def update(self, evaluation: Evaluation) -> Evaluation:
         """Update existing evaluation."""
         pass
 
     @abstractmethod
-    def delete(self, evaluation_id: int) -> bool:
+    async def delete(self, evaluation_id: int) -> bool:
         """Delete evaluation by ID."""
         pass
\ No newline at end of file
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Dict, Optional, List, Tuple
 from app.domain.entities.final_evaluation import FinalEvaluation
 
 
@@ -7,21 +8,33 @@ class FinalEvaluationRepositoryInterface(ABC):
     """Interface for final evaluation repository."""
 
     @abstractmethod
-    def save(self, final_evaluation: FinalEvaluation) -> FinalEvaluation:
+    async def save(self, final_evaluation: FinalEvaluation) -> FinalEvaluation:
         """Save a final evaluation."""
         pass
 
     @abstractmethod
-    def find_by_user_id(self, user_id: int) -> Optional[FinalEvaluation]:
+    async def save_many_deduplicated(self, final_evaluations: List[FinalEvaluation]) -> int:
+        """Save the final evaluations whose dedup_key is not stored yet; return how many were saved."""
+        pass
+
+    @abstractmethod
+    async def find_by_user_id(self, user_id: int) -> Optional[FinalEvaluation]:
         """Find the most recent final evaluation by user ID."""
         pass
 
     @abstractmethod
-    def find_all_by_user_id(self, user_id: int) -> List[FinalEvaluation]:
+    async def find_all_by_user_id(self, user_id: int) -> List[FinalEvaluation]:
         """Find all final evaluations by user ID."""
         pass
 
     @abstractmethod
-    def find_by_id(self, evaluation_id: int) -> Optional[FinalEvaluation]:
+    async def find_history_page(
+        self, user_id: int, limit: int, before: Optional[Tuple[datetime, int]], fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Up to ``limit`` final evaluations of a user older than the (created_at, id) position ``before``, newest first, with only ``fields``."""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, evaluation_id: int) -> Optional[FinalEvaluation]:
         """Find final evaluation by ID."""
         pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.domain.entities.questions import Question
 
 
@@ -7,31 +7,39 @@ class QuestionRepositoryInterface(ABC):
     """Interface for question repository operations."""
 
     @abstractmethod
-    def find_all(self) -> List[Question]:
+    async def find_all(self) -> List[Question]:
         """Get all questions."""
         pass
 
     @abstractmethod
-    def find_by_id(self, question_id: int) -> Optional[Question]:
+    async def find_by_id(self, question_id: int) -> Optional[Question]:
         """Find question by ID."""
         pass
 
     @abstractmethod
-    def find_by_ids(self, question_ids: List[int]) -> List[Question]:
+    async def find_by_ids(self, question_ids: List[int]) -> List[Question]:
         """Find questions by multiple IDs."""
         pass
 
     @abstractmethod
-    def create(self, question: Question) -> Question:
+    async def find_all_versioned(self) -> Tuple[Optional[str], List[Question]]:
+        """
+        Get all questions with the version identifying that set of questions
+        (None when not tracked), both read from the same catalog state.
+        """
+        pass
+
+    @abstractmethod
+    async def create(self, question: Question) -> Question:
         """Create a new question."""
         pass
 
     @abstractmethod
-    def update(self, question: Question) -> Question:
+    async def update(self, question: Question) -> Question:
         """Update existing question."""
         pass
 
     @abstractmethod
-    def delete(self, question_id: int) -> bool:
+    async def delete(self, question_id: int) -> bool:
         """Delete question by ID."""
         pass
\ No newline at end of file
@@ -0,0 +1,121 @@
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+# Verdicts of degenerate answers
+EMPTY = "empty"
+TOO_SHORT = "too_short"
+COPIED_QUESTION = "copied_question"
+REPETITIVE = "repetitive"
+GIBBERISH = "gibberish"
+NON_ENGLISH = "non_english"
+DUPLICATE = "duplicate"
+
+VERDICT_MESSAGES = {
+    EMPTY: "The answer is empty.",
+    TOO_SHORT: "The answer is too short to show any language ability.",
+    COPIED_QUESTION: "The answer repeats the question instead of answering it.",
+    REPETITIVE: "The answer repeats the same few words.",
+    GIBBERISH: "The answer is not made of real words.",
+    NON_ENGLISH: "The answer is not written in English.",
+    DUPLICATE: "The same answer was given to several questions.",
+}
+
+# Frequent function words, used to tell English from other Latin-script languages
+ENGLISH_WORDS = frozenset(
+    "the and is are was were i you he she we they it my your to of in on at for with that this "
+    "have has had do did be been not but so because like very can will would".split()
+)
+OTHER_LANGUAGE_WORDS = frozenset(
+    # Spanish, Portuguese, French, German and Italian
+    "el la los las que y es un una por para con yo pero muy del lo se su mi porque como esta este "
+    "não uma com você eu muito também isso "
+    "le les des est et je une pas pour avec dans mais très nous vous ce qui "
+    "der das und ist ich nicht ein eine mit auch sehr wir sie zu "
+    "il di che non per sono della molto anche".split()
+)
+
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+VOWELS = set("aeiouyáéíóúàèìòùâêîôûäëïöüãõ")
+# Shorter vowel-less words are too often abbreviations (tv, pc, cnn) to count as gibberish
+GIBBERISH_MIN_LENGTH = 4
+
+
+class AnswerGuardService:
+    """
+    Domain service screening answers for degenerate content with cheap text features.
+
+    Answers flagged here cannot show any language ability, so they get a
+    deterministic A1 / zero-score evaluation instead of an LLM call. Checks are
+    deliberately conservative: short but genuine learner answers must pass.
+    """
+
+    def __init__(
+        self,
+        min_words: int = 2,
+        min_diversity: float = 0.3,
+        diversity_min_words: int = 8,
+        max_question_overlap: float = 0.9,
+        min_latin_ratio: float = 0.8
+    ):
+        self.min_words = min_words
+        self.min_diversity = min_diversity
+        self.diversity_min_words = diversity_min_words
+        self.max_question_overlap = max_question_overlap
+        self.min_latin_ratio = min_latin_ratio
+
+    def screen(self, questions: Dict[int, str], answers: Dict[int, str]) -> Dict[int, str]:
+        """Verdict of every degenerate answer, keyed by question id; genuine answers are omitted."""
+        verdicts = {}
+        for question_id, answer in answers.items():
+            verdict = self.check_answer(questions.get(question_id, ""), answer)
+            if verdict is not None:
+                verdicts[question_id] = verdict
+
+        # The same answer given to different questions answers none of them
+        normalized = {question_id: " ".join(self._words(answer)) for question_id, answer in answers.items()}
+        counts = Counter(text for text in normalized.values() if text)
+        for question_id, text in normalized.items():
+            if counts[text] > 1 and question_id not in verdicts:
+                verdicts[question_id] = DUPLICATE
+        return verdicts
+
+    def check_answer(self, question: str, answer: str) -> Optional[str]:
+        """Verdict of a single answer, or None if it looks genuine."""
+        if not answer or not answer.strip():
+            return EMPTY
+
+        letters = [char for char in answer if char.isalpha()]
+        if letters and sum(1 for char in letters if ord(char) < 0x250) / len(letters) < self.min_latin_ratio:
+            return NON_ENGLISH
+
+        words = self._words(answer)
+        if len(set(words)) < self.min_words:
+            return TOO_SHORT
+
+        question_words = set(self._words(question))
+        if question_words and sum(1 for word in words if word in question_words) / len(words) >= self.max_question_overlap:
+            return COPIED_QUESTION
+
+        if len(words) >= self.diversity_min_words and len(set(words)) / len(words) < self.min_diversity:
+            return REPETITIVE
+
+        if sum(1 for word in WORD_PATTERN.findall(answer) if self._is_gibberish(word)) > len(words) / 2:
+            return GIBBERISH
+
+        english_hits = sum(1 for word in words if word in ENGLISH_WORDS)
+        other_hits = sum(1 for word in words if word in OTHER_LANGUAGE_WORDS)
+        if other_hits >= 2 and other_hits > 2 * english_hits:
+            return NON_ENGLISH
+
+        return None
+
+    @staticmethod
+    def _is_gibberish(word: str) -> bool:
+        """Whether a word, as written, has no vowel and is no acronym (all capitals) or short abbreviation."""
+        return len(word) >= GIBBERISH_MIN_LENGTH and not word.isupper() and not VOWELS & set(word.casefold())
+
+    @staticmethod
+    def _words(text: str) -> List[str]:
+        """Lower-cased words of a text."""
+        return WORD_PATTERN.findall(text.casefold())
@@ -0,0 +1,186 @@
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.application.evaluation.ports.llm_service_port import LLMServicePort
+from app.core.exceptions.evaluation_exceptions import (
+    TransientLLMException,
+    LLMRateLimitException,
+    LLMUnavailableException
+)
+from app.core.metrics import metrics
+from app.infrastructure.external_services.flow_control import (
+    AIMDLimiter,
+    CircuitBreaker,
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN
+)
+from app.infrastructure.external_services.llm_service_decorator import LLMServiceDecorator
+
+T = TypeVar("T")
+
+CIRCUIT_STATE_VALUES = {CIRCUIT_CLOSED: 0, CIRCUIT_HALF_OPEN: 1, CIRCUIT_OPEN: 2}
+
+concurrency_limit_gauge = metrics.gauge(
+    "llm_concurrency_limit",
+    "Current adaptive limit of in-flight LLM calls"
+)
+in_flight_gauge = metrics.gauge(
+    "llm_in_flight_requests",
+    "LLM calls currently in flight"
+)
+queue_depth_gauge = metrics.gauge(
+    "llm_queue_depth",
+    "LLM calls waiting for a concurrency slot"
+)
+circuit_state_gauge = metrics.gauge(
+    "llm_circuit_state",
+    "LLM circuit breaker state (0 closed, 1 half-open, 2 open)"
+)
+circuit_rejections = metrics.counter(
+    "llm_circuit_rejections_total",
+    "LLM calls rejected without reaching the provider while the circuit was open"
+)
+rate_limited_calls = metrics.counter(
+    "llm_rate_limited_total",
+    "LLM calls rejected by the provider with a rate limit"
+)
+
+
+class AdaptiveConcurrencyLLMService(LLMServiceDecorator):
+    """
+    Guards the provider with an AIMD concurrency limit and a circuit breaker.
+
+    Calls wait for a slot under the adaptive limit, which shrinks on rate
+    limits or slow calls and grows back as calls succeed quickly. Consecutive
+    transient failures open the circuit, after which calls fail fast with
+    LLMUnavailableException until a probe call succeeds.
+    """
+
+    def __init__(
+        self,
+        inner: LLMServicePort,
+        limiter: Optional[AIMDLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        super().__init__(inner)
+        self.limiter = limiter or AIMDLimiter()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.limiter.on_change = self._update_gauges
+        self._update_gauges()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limiter and breaker state."""
+        return {
+            "limit": int(self.limiter.limit),
+            "in_flight": self.limiter.in_flight,
+            "queue_depth": self.limiter.waiting,
+            "circuit_state": self.circuit_breaker.state
+        }
+
+    async def evaluate_answers(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> Dict[str, Any]:
+        """Evaluate answers under the concurrency limit."""
+        return await self._call(lambda: self.inner.evaluate_answers(questions_dict, answers_dict))
+
+    async def evaluate_answers_batch(
+        self,
+        submissions: List[Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Evaluate several submissions under the concurrency limit."""
+        return await self._call(lambda: self.inner.evaluate_answers_batch(submissions))
+
+    async def stream_evaluation(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the evaluation, holding a slot until the stream ends."""
+        started, probe = await self._enter()
+        try:
+            async for event in self.inner.stream_evaluation(questions_dict, answers_dict):
+                yield event
+        except BaseException as e:
+            await self._exit(started, probe, e)
+            raise
+        await self._exit(started, probe, None)
+
+    async def evaluate_single_answer(self, question: str, answer: str) -> Dict[str, Any]:
+        """Evaluate a single answer under the concurrency limit."""
+        return await self._call(lambda: self.inner.evaluate_single_answer(question, answer))
+
+    async def generate_next_questions(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[str]:
+        """Generate next questions under the concurrency limit."""
+        return await self._call(lambda: self.inner.generate_next_questions(questions_dict, answers_dict))
+
+    async def generate_questions(self, level: str, topic: str, count: int) -> List[str]:
+        """Generate questions for a level and topic under the concurrency limit."""
+        return await self._call(lambda: self.inner.generate_questions(level, topic, count))
+
+    async def final_evaluation(
+        self,
+        previous_evaluation: Dict[str, Any],
+        new_answers: List[Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Perform the final evaluation under the concurrency limit."""
+        return await self._call(lambda: self.inner.final_evaluation(previous_evaluation, new_answers))
+
+    async def _call(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a call inside a slot, feeding its outcome to the limiter and the breaker."""
+        started, probe = await self._enter()
+        try:
+            result = await call()
+        except BaseException as e:
+            await self._exit(started, probe, e)
+            raise
+        await self._exit(started, probe, None)
+        return result
+
+    async def _enter(self) -> Tuple[float, Optional[int]]:
+        """Check the breaker and wait for a slot; return the start time and the probe token."""
+        try:
+            probe = self.circuit_breaker.before_call()
+        except LLMUnavailableException:
+            circuit_rejections.inc()
+            self._update_gauges()
+            raise
+
+        try:
+            await self.limiter.acquire()
+        except BaseException:
+            self.circuit_breaker.record_abandoned(probe)
+            self._update_gauges()
+            raise
+        return time.monotonic(), probe
+
+    async def _exit(self, started: float, probe: Optional[int], error: Optional[BaseException]) -> None:
+        """Release the slot and record the outcome."""
+        if isinstance(error, LLMRateLimitException):
+            rate_limited_calls.inc()
+
+        if isinstance(error, TransientLLMException):
+            self.circuit_breaker.record_failure()
+            await self.limiter.release(None, overloaded=True)
+        elif error is not None and not isinstance(error, Exception):
+            # Cancelled (e.g. a losing hedge): no signal about the provider
+            self.circuit_breaker.record_abandoned(probe)
+            await self.limiter.release(None, overloaded=False)
+        else:
+            # Non-transient errors (e.g. invalid output) still mean the provider answered
+            self.circuit_breaker.record_success()
+            await self.limiter.release(time.monotonic() - started, overloaded=False)
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        """Publish the limiter and breaker state."""
+        concurrency_limit_gauge.set(int(self.limiter.limit))
+        in_flight_gauge.set(self.limiter.in_flight)
+        queue_depth_gauge.set(self.limiter.waiting)
+        circuit_state_gauge.set(CIRCUIT_STATE_VALUES[self.circuit_breaker.state])
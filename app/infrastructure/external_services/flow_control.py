@@ -0,0 +1,142 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+from app.core.deadline import remaining_time
+from app.core.exceptions.evaluation_exceptions import LLMTimeoutException, LLMUnavailableException
+
+# Circuit breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_OPEN = "open"
+
+
+class AIMDLimiter:
+    """
+    Adaptive concurrency limit with additive increase / multiplicative decrease.
+
+    Each fast success grows the limit by ``1 / limit`` (about +1 per round of
+    calls); an overload signal (rate limit or slow call) multiplies it by
+    ``backoff_ratio``, at most once per ``decrease_cooldown`` seconds so that
+    a burst of concurrent failures counts as one signal.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 128,
+        backoff_ratio: float = 0.5,
+        latency_threshold: float = 20.0,
+        decrease_cooldown: float = 1.0
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_threshold = latency_threshold
+        self.decrease_cooldown = decrease_cooldown
+        self.in_flight = 0
+        self.waiting = 0
+        self.on_change: Optional[Callable[[], None]] = None
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot, giving up when the request deadline runs out."""
+        async with self._condition:
+            self.waiting += 1
+            self._changed()
+            try:
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: self.in_flight < int(self.limit)),
+                    timeout=remaining_time()
+                )
+            except asyncio.TimeoutError:
+                raise LLMTimeoutException("Request deadline exceeded while waiting for LLM capacity")
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+            self._changed()
+
+    async def release(self, latency: Optional[float], overloaded: bool) -> None:
+        """Free a slot and adapt the limit; latency is None for calls that did not complete."""
+        async with self._condition:
+            self.in_flight -= 1
+            if overloaded or (latency is not None and latency > self.latency_threshold):
+                now = time.monotonic()
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+                    self._last_decrease = now
+            elif latency is not None:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self._condition.notify_all()
+            self._changed()
+
+    def _changed(self) -> None:
+        """Notify the observer of a change in limit, in-flight or waiting calls."""
+        if self.on_change is not None:
+            self.on_change()
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the provider is unhealthy.
+
+    Opens after ``failure_threshold`` consecutive failures; after
+    ``recovery_timeout`` seconds one probe call is let through (half-open),
+    whose outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probes = 0
+
+    def before_call(self) -> Optional[int]:
+        """
+        Reject the call if the circuit is open; let one probe through once it
+        may recover. Return the probe's token, or None for ordinary calls.
+        """
+        if self.state == CIRCUIT_OPEN:
+            retry_after = self._opened_at + self.recovery_timeout - time.monotonic()
+            if retry_after > 0:
+                raise LLMUnavailableException(
+                    f"LLM provider is unavailable; retry in {retry_after:.0f}s",
+                    retry_after=retry_after
+                )
+            self.state = CIRCUIT_HALF_OPEN
+
+        if self.state == CIRCUIT_HALF_OPEN:
+            if self._probe_in_flight:
+                raise LLMUnavailableException(
+                    "LLM provider is recovering; retry shortly",
+                    retry_after=1.0
+                )
+            self._probe_in_flight = True
+            self._probes += 1
+            return self._probes
+        return None
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+        self.state = CIRCUIT_CLOSED
+
+    def record_failure(self) -> None:
+        """Count a provider failure, opening the circuit past the threshold or on a failed probe."""
+        self._probe_in_flight = False
+        self.consecutive_failures += 1
+        if self.state == CIRCUIT_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = CIRCUIT_OPEN
+            self._opened_at = time.monotonic()
+
+    def record_abandoned(self, probe: Optional[int]) -> None:
+        """Release the probe slot if the call cancelled before it finished was the current probe."""
+        if probe is not None and probe == self._probes:
+            self._probe_in_flight = False
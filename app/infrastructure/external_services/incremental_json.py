@@ -0,0 +1,142 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.exceptions.evaluation_exceptions import InvalidResponseException
+
+# Path element used for the items of a JSON array
+ARRAY_ITEM = "*"
+
+_WHITESPACE = " \t\r\n"
+_PRIMITIVE_END = ",}]" + _WHITESPACE
+
+
+class _Frame:
+    """Open JSON container tracked by the parser."""
+
+    __slots__ = ("kind", "key", "expect_key", "start")
+
+    def __init__(self, kind: str, start: int):
+        self.kind = kind
+        self.key: Optional[str] = None
+        self.expect_key = kind == "object"
+        self.start = start
+
+
+class IncrementalJSONParser:
+    """
+    Parse a JSON document that arrives in chunks (e.g. streamed LLM tokens).
+    Values located at watched paths are emitted as soon as they are complete,
+    without waiting for the rest of the document.
+
+    Paths are tuples of object keys, with ``ARRAY_ITEM`` matching any array
+    item, e.g. ``("feedback", ARRAY_ITEM)`` emits each feedback object.
+    Text before the root value (such as a code fence) is ignored.
+    """
+
+    def __init__(self, watched_paths: Dict[Tuple[str, ...], str]):
+        self.watched_paths = watched_paths
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._started = False
+        self._complete = False
+        self._string_start: Optional[int] = None
+        self._string_is_key = False
+        self._escape = False
+        self._primitive_start: Optional[int] = None
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the root JSON value has been fully received."""
+        return self._complete
+
+    @property
+    def text(self) -> str:
+        """Raw text received so far."""
+        return self._text
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume a chunk and return ``(name, value)`` for every watched value completed by it."""
+        self._text += chunk
+        events: List[Tuple[str, Any]] = []
+
+        while self._pos < len(self._text) and not self._complete:
+            index = self._pos
+            char = self._text[index]
+            self._pos += 1
+
+            if self._string_start is not None:
+                self._consume_string_char(char, index, events)
+                continue
+
+            if self._primitive_start is not None:
+                if char not in _PRIMITIVE_END:
+                    continue
+                self._complete_value(self._primitive_start, index, events)
+                self._primitive_start = None
+
+            self._consume_structural_char(char, index, events)
+
+        return events
+
+    def _consume_string_char(self, char: str, index: int, events: List[Tuple[str, Any]]) -> None:
+        """Advance through a string literal, completing it on the closing quote."""
+        if self._escape:
+            self._escape = False
+        elif char == "\\":
+            self._escape = True
+        elif char == '"':
+            start = self._string_start
+            self._string_start = None
+            if self._string_is_key:
+                self._stack[-1].key = self._loads(start, index + 1)
+                self._stack[-1].expect_key = False
+            else:
+                self._complete_value(start, index + 1, events)
+
+    def _consume_structural_char(self, char: str, index: int, events: List[Tuple[str, Any]]) -> None:
+        """Handle a character outside of string and primitive literals."""
+        if not self._started:
+            if char in "{[":
+                self._started = True
+            else:
+                return
+
+        if char in _WHITESPACE or char == ":":
+            return
+
+        if char in "{[":
+            self._stack.append(_Frame("object" if char == "{" else "array", index))
+        elif char in "}]":
+            if not self._stack:
+                raise InvalidResponseException(f"Unexpected '{char}' at position {index}")
+            frame = self._stack.pop()
+            self._complete_value(frame.start, index + 1, events)
+        elif char == ",":
+            if self._stack and self._stack[-1].kind == "object":
+                self._stack[-1].expect_key = True
+        elif char == '"':
+            self._string_start = index
+            self._string_is_key = bool(self._stack) and self._stack[-1].expect_key
+        else:
+            self._primitive_start = index
+
+    def _complete_value(self, start: int, end: int, events: List[Tuple[str, Any]]) -> None:
+        """Emit a just-completed value if its path is watched."""
+        if not self._stack:
+            self._complete = True
+
+        path = tuple(
+            frame.key if frame.kind == "object" else ARRAY_ITEM
+            for frame in self._stack
+        )
+        name = self.watched_paths.get(path)
+        if name is not None:
+            events.append((name, self._loads(start, end)))
+
+    def _loads(self, start: int, end: int) -> Any:
+        """Decode a slice of the received text."""
+        try:
+            return json.loads(self._text[start:end])
+        except json.JSONDecodeError as e:
+            raise InvalidResponseException(f"LLM streamed invalid JSON: {str(e)}")
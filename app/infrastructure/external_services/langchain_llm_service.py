@@ -1,67 +1,330 @@
-import json
-from typing import Dict, Any, List
+import asyncio
+import time
+from typing import Dict, Any, List, Optional, AsyncIterator, Callable, Iterable, Tuple, TypeVar
 import openai
 
 from app.application.evaluation.ports.llm_service_port import LLMServicePort
 from app.core.config.settings import settings
-from app.core.exceptions.evaluation_exceptions import LLMException, InvalidResponseException
+from app.core.exceptions.evaluation_exceptions import (
+    LLMException,
+    InvalidResponseException,
+    TransientLLMException,
+    LLMRateLimitException,
+    CacheException
+)
+from app.core.interfaces.cache_interface import CacheInterface
+from app.core.metrics import metrics, current_endpoint
+from app.domain.value_objects.cefr_level import CEFRLevel
+from app.infrastructure.external_services.openai_client import build_async_openai_client
+from app.infrastructure.external_services.model_router import (
+    ModelRouter,
+    build_model_router,
+    EVALUATION_TASK,
+    BATCH_EVALUATION_TASK,
+    ANSWER_EVALUATION_TASK,
+    NEXT_QUESTIONS_TASK,
+    QUESTION_GENERATION_TASK,
+    FINAL_EVALUATION_TASK
+)
+from app.infrastructure.external_services.incremental_json import IncrementalJSONParser, ARRAY_ITEM
+from app.infrastructure.external_services.prompts import (
+    EVALUATION_PROMPT_VERSION,
+    BATCH_EVALUATION_PROMPT_VERSION,
+    ANSWER_EVALUATION_PROMPT_VERSION,
+    NEXT_QUESTIONS_PROMPT_VERSION,
+    QUESTION_GENERATION_PROMPT_VERSION,
+    FINAL_EVALUATION_PROMPT_VERSION,
+    evaluation_messages,
+    batch_evaluation_messages,
+    answer_evaluation_messages,
+    next_questions_messages,
+    question_generation_messages,
+    final_evaluation_messages
+)
+from app.infrastructure.external_services.response_repair import (
+    parse_json_lenient,
+    unwrap_evaluation,
+    normalize_level,
+    repair_feedback_item,
+    normalize_question_id,
+    repair_next_questions
+)
+from app.infrastructure.external_services.response_schemas import (
+    build_response_format,
+    INITIAL_EVALUATION_SCHEMA,
+    BATCH_EVALUATION_SCHEMA,
+    FEEDBACK_ITEM_SCHEMA,
+    NEXT_QUESTIONS_SCHEMA,
+    FINAL_EVALUATION_SCHEMA
+)
+from app.infrastructure.persistence.redis.llm_response_cache import build_cache_key
+
+T = TypeVar("T")
+
+# Provider errors worth retrying
+TRANSIENT_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    asyncio.TimeoutError
+)
+
+structured_output_outcomes = metrics.counter(
+    "llm_structured_output_total",
+    "Evaluation outputs by outcome: valid, repaired (locally), rerequested (missing parts) or failed",
+    ("outcome",)
+)
+rerequests_histogram = metrics.histogram(
+    "llm_rerequests_per_evaluation",
+    "Extra LLM calls needed to complete one evaluation's missing parts",
+    buckets=(0, 1, 2, 3, 5, 8)
+)
+tier_requests = metrics.counter(
+    "llm_tier_requests_total",
+    "LLM completions sent per model tier and sub-task",
+    ("tier", "task")
+)
+tier_latency = metrics.histogram(
+    "llm_tier_latency_seconds",
+    "LLM completion latency per model tier",
+    ("tier",)
+)
+tier_cost = metrics.counter(
+    "llm_tier_cost_usd_total",
+    "Estimated LLM spend per model tier, from token usage and LLM_MODEL_PRICES",
+    ("tier",)
+)
+llm_calls = metrics.counter(
+    "llm_requests_total",
+    "LLM completions by model, prompt template version, endpoint and outcome",
+    ("model", "prompt_version", "endpoint", "outcome")
+)
+llm_latency = metrics.histogram(
+    "llm_request_duration_seconds",
+    "LLM completion latency by model, prompt template version and outcome",
+    ("model", "prompt_version", "outcome")
+)
+llm_tokens = metrics.counter(
+    "llm_tokens_total",
+    "LLM tokens used, by model, prompt template version, endpoint and kind (prompt or completion)",
+    ("model", "prompt_version", "endpoint", "kind")
+)
+llm_tokens_per_call = metrics.histogram(
+    "llm_tokens_per_request",
+    "Tokens used by one LLM completion, by model, prompt template version and kind",
+    ("model", "prompt_version", "kind"),
+    buckets=(50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+)
+llm_cost = metrics.counter(
+    "llm_cost_usd_total",
+    "Estimated LLM spend, from token usage and LLM_MODEL_PRICES, by model and endpoint",
+    ("model", "endpoint")
+)
+tier_escalations = metrics.counter(
+    "llm_tier_escalations_total",
+    "Sub-tasks re-run on a stronger tier, by reason (invalid_output or low_confidence)",
+    ("task", "reason")
+)
 
 
 class LangchainLLMService(LLMServicePort):
     """Implementation of LLM service using OpenAI directly."""
 
-    def __init__(self):
-        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-        self.model = settings.OPENAI_MODEL
+    # JSON paths of the evaluation output emitted while streaming (flat and nested layouts)
+    STREAM_EVENT_PATHS = {
+        ("reason",): "reason",
+        ("feedback", ARRAY_ITEM): "feedback",
+        ("feedback",): "feedback_end",
+        ("evaluation", "reason"): "reason",
+        ("evaluation", "feedback", ARRAY_ITEM): "feedback",
+        ("evaluation", "feedback"): "feedback_end",
+        ("next_questions",): "next_questions",
+    }
+
+    def __init__(
+        self,
+        client: Optional[openai.AsyncOpenAI] = None,
+        response_cache: Optional[CacheInterface] = None,
+        router: Optional[ModelRouter] = None
+    ):
+        self.client = client or build_async_openai_client()
+        self.router = router or build_model_router()
+        # Model of full evaluations (also used for streaming and batch submissions)
+        self.model = self.router.model(self.router.route(EVALUATION_TASK))
+        self.temperature = settings.LLM_TEMPERATURE
+        self.response_format_mode = settings.LLM_RESPONSE_FORMAT
+        # Cached responses are only valid substitutes when sampling is deterministic
+        self.response_cache = response_cache if self.temperature == 0 else None
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections held by the client."""
+        await self.client.close()
+        if self.response_cache is not None and hasattr(self.response_cache, "aclose"):
+            await self.response_cache.aclose()
 
     async def evaluate_answers(
         self,
         questions_dict: Dict[int, str],
         answers_dict: Dict[int, str]
     ) -> Dict[str, Any]:
-        """Evaluate answers using LLM and return structured feedback."""
+        """
+        Evaluate answers using LLM and return structured feedback.
+        Defects in the output are repaired locally; feedback items or next
+        questions that cannot be recovered are re-requested on their own.
+        """
         try:
-            prompt = self._get_evaluation_prompt_template().format(
-                answers=answers_dict, 
-                questions=questions_dict
+            result, repaired = await self._complete(
+                self.build_evaluation_messages(questions_dict, answers_dict),
+                EVALUATION_PROMPT_VERSION,
+                self._parse_evaluation_with_repair,
+                self.response_format(INITIAL_EVALUATION_SCHEMA),
+                task=EVALUATION_TASK,
+                result_level=lambda result: self._highest_level(
+                    item["estimated_level"] for item in result[0]["feedback"]
+                )
             )
+            rerequests = await self._complete_missing_parts(result, questions_dict, answers_dict)
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7
+        except Exception as e:
+            structured_output_outcomes.inc(outcome="failed")
+            raise self._llm_error("Failed to evaluate answers", e)
+
+        rerequests_histogram.observe(rerequests)
+        if rerequests:
+            structured_output_outcomes.inc(outcome="rerequested")
+        elif repaired:
+            structured_output_outcomes.inc(outcome="repaired")
+        else:
+            structured_output_outcomes.inc(outcome="valid")
+        return result
+
+    async def evaluate_answers_batch(
+        self,
+        submissions: List[Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Evaluate several users' submissions in one multi-user completion.
+        Submissions missing or invalid in the output are returned as None.
+        """
+        try:
+            return await self._complete(
+                batch_evaluation_messages(submissions),
+                BATCH_EVALUATION_PROMPT_VERSION,
+                lambda content: self._parse_batch_evaluation(content, submissions),
+                self.response_format(BATCH_EVALUATION_SCHEMA),
+                task=BATCH_EVALUATION_TASK
             )
-            
-            result_str = response.choices[0].message.content
 
+        except Exception as e:
+            raise self._llm_error("Failed to evaluate batch of answers", e)
+
+    async def stream_evaluation(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the evaluation, emitting each feedback item as soon as it is complete."""
+        try:
+            messages = self.build_evaluation_messages(questions_dict, answers_dict)
+            response_format = self.response_format(INITIAL_EVALUATION_SCHEMA)
+            parser = IncrementalJSONParser(self.STREAM_EVENT_PATHS)
+
+            cache_key = self._cache_key(self.model, messages, EVALUATION_PROMPT_VERSION, response_format)
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                llm_calls.inc(
+                    model=self.model,
+                    prompt_version=EVALUATION_PROMPT_VERSION,
+                    endpoint=current_endpoint(),
+                    outcome="cache_hit"
+                )
+                for event_type, data in parser.feed(cached):
+                    yield {"type": event_type, "data": data}
+                return
+
+            tier = self.router.route(EVALUATION_TASK)
+            started = time.monotonic()
+            usage = None
             try:
-                result = json.loads(result_str)
-                
-                # Handle nested structure from LLM response
-                if "evaluation" in result and "next_questions" in result:
-                    # Extract evaluation data and flatten the structure
-                    evaluation_data = result["evaluation"]
-                    next_questions = result["next_questions"]
-                    
-                    flattened_result = {
-                        "level": evaluation_data["level"],
-                        "scores": evaluation_data["scores"],
-                        "reason": evaluation_data["reason"],
-                        "feedback": evaluation_data["feedback"],
-                        "next_questions": next_questions
-                    }
-                    return flattened_result
-                elif "level" in result and "scores" in result and "feedback" in result:
-                    # Already flat structure, return as is
-                    return result
-                else:
-                    raise InvalidResponseException(f"LLM returned unexpected JSON structure. Keys found: {list(result.keys())}")
-                    
-            except json.JSONDecodeError as e:
-                raise InvalidResponseException(f"LLM returned invalid JSON: {result_str}")
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **self._response_format_params(response_format)
+                )
+
+                async for chunk in stream:
+                    # With include_usage, the last chunk carries the usage and no choices
+                    usage = getattr(chunk, "usage", None) or usage
+                    if not chunk.choices or not chunk.choices[0].delta.content:
+                        continue
+                    for event_type, data in parser.feed(chunk.choices[0].delta.content):
+                        yield {"type": event_type, "data": data}
+
+                if not parser.is_complete:
+                    raise InvalidResponseException(f"LLM stream ended with incomplete JSON: {parser.text[-200:]}")
+            except BaseException as e:
+                self._record_call(tier, self.model, EVALUATION_PROMPT_VERSION, self._call_outcome(e), started, usage)
+                raise
+
+            self._record_call(tier, self.model, EVALUATION_PROMPT_VERSION, "success", started, usage)
+
+            await self._cache_set(cache_key, parser.text)
+
+        except LLMException:
+            raise
+        except Exception as e:
+            raise self._llm_error("Failed to stream evaluation", e)
+
+    async def evaluate_single_answer(self, question: str, answer: str) -> Dict[str, Any]:
+        """Evaluate a single answer and return its feedback item."""
+        try:
+            return await self._complete(
+                answer_evaluation_messages(question, answer),
+                ANSWER_EVALUATION_PROMPT_VERSION,
+                self._parse_feedback_item,
+                self.response_format(FEEDBACK_ITEM_SCHEMA),
+                task=ANSWER_EVALUATION_TASK,
+                result_level=lambda item: item["estimated_level"]
+            )
+
+        except Exception as e:
+            raise self._llm_error("Failed to evaluate answer", e)
+
+    async def generate_next_questions(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[str]:
+        """Generate follow-up questions targeted at the level shown by the answers."""
+        try:
+            return await self._complete(
+                next_questions_messages(questions_dict, answers_dict),
+                NEXT_QUESTIONS_PROMPT_VERSION,
+                self._parse_next_questions,
+                self.response_format(NEXT_QUESTIONS_SCHEMA),
+                task=NEXT_QUESTIONS_TASK
+            )
+
+        except Exception as e:
+            raise self._llm_error("Failed to generate next questions", e)
+
+    async def generate_questions(self, level: str, topic: str, count: int) -> List[str]:
+        """Generate new questions for a CEFR level and topic."""
+        try:
+            return await self._complete(
+                question_generation_messages(level, topic, count),
+                QUESTION_GENERATION_PROMPT_VERSION,
+                self._parse_next_questions,
+                self.response_format(NEXT_QUESTIONS_SCHEMA),
+                task=QUESTION_GENERATION_TASK
+            )
 
         except Exception as e:
-            raise LLMException(f"Failed to evaluate answers: {str(e)}")
+            raise self._llm_error("Failed to generate questions", e)
 
     async def final_evaluation(
         self,
@@ -70,104 +333,406 @@ class LangchainLLMService(LLMServicePort):
     ) -> Dict[str, str]:
         """Perform final evaluation and return CEFR level with reason."""
         try:
-            prompt = self._get_final_evaluation_prompt_template().format(
-                previous_evaluation=json.dumps(previous_evaluation, indent=2),
-                new_answers_with_questions=json.dumps(new_answers, indent=2)
+            return await self._complete(
+                final_evaluation_messages(previous_evaluation, new_answers),
+                FINAL_EVALUATION_PROMPT_VERSION,
+                self._parse_final_evaluation,
+                self.response_format(FINAL_EVALUATION_SCHEMA),
+                task=FINAL_EVALUATION_TASK,
+                level=normalize_level(previous_evaluation.get("level")),
+                result_level=lambda result: normalize_level(result.get("final_level"))
             )
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7
+        except Exception as e:
+            raise self._llm_error("Failed to perform final evaluation", e)
+
+    def build_evaluation_messages(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[Dict[str, str]]:
+        """Render the chat messages of a single-user evaluation request."""
+        return evaluation_messages(questions_dict, answers_dict)
+
+    def response_format(self, schema_name: str) -> Optional[Dict[str, Any]]:
+        """The response_format parameter of a request for the configured mode."""
+        return build_response_format(self.response_format_mode, schema_name)
+
+    async def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        prompt_version: str,
+        parse: Callable[[str], T],
+        response_format: Optional[Dict[str, Any]] = None,
+        task: str = EVALUATION_TASK,
+        level: Optional[str] = None,
+        result_level: Optional[Callable[[T], Optional[str]]] = None
+    ) -> T:
+        """
+        Run a sub-task on the tier chosen by the router, escalating to a stronger
+        tier when the output fails validation or its level exceeds what the tier
+        is trusted to rate.
+        """
+        tier = self.router.route(task, level)
+        while True:
+            next_tier = self.router.escalation(tier)
+            try:
+                result = await self._complete_with_model(
+                    tier, task, messages, prompt_version, parse, response_format
+                )
+            except InvalidResponseException:
+                if next_tier is None:
+                    raise
+                tier_escalations.inc(task=task, reason="invalid_output")
+                tier = next_tier
+                continue
+
+            if next_tier is not None and result_level is not None and self.router.exceeds_tier(tier, result_level(result)):
+                tier_escalations.inc(task=task, reason="low_confidence")
+                tier = next_tier
+                continue
+            return result
+
+    async def _complete_with_model(
+        self,
+        tier: str,
+        task: str,
+        messages: List[Dict[str, str]],
+        prompt_version: str,
+        parse: Callable[[str], T],
+        response_format: Optional[Dict[str, Any]]
+    ) -> T:
+        """
+        Run a chat completion on a tier's model and parse its content.
+        Deterministic requests are served from the response cache when possible;
+        only responses that parse successfully are stored.
+        """
+        model = self.router.model(tier)
+        cache_key = self._cache_key(model, messages, prompt_version, response_format)
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            llm_calls.inc(model=model, prompt_version=prompt_version, endpoint=current_endpoint(), outcome="cache_hit")
+            return parse(cached)
+
+        tier_requests.inc(tier=tier, task=task)
+        started = time.monotonic()
+        usage = None
+        try:
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=self.temperature,
+                **self._response_format_params(response_format)
             )
-            
-            result_str = response.choices[0].message.content.strip()
-            
-            # Try to parse as JSON first
+            usage = getattr(response, "usage", None)
+            content = response.choices[0].message.content
+            result = parse(content)
+        except BaseException as e:
+            self._record_call(tier, model, prompt_version, self._call_outcome(e), started, usage)
+            raise
+
+        self._record_call(tier, model, prompt_version, "success", started, usage)
+        await self._cache_set(cache_key, content)
+        return result
+
+    def _record_call(
+        self,
+        tier: str,
+        model: str,
+        prompt_version: str,
+        outcome: str,
+        started: float,
+        usage: Any
+    ) -> None:
+        """Record the latency, token usage and cost of a completion sent to the provider."""
+        latency = time.monotonic() - started
+        endpoint = current_endpoint()
+        llm_calls.inc(model=model, prompt_version=prompt_version, endpoint=endpoint, outcome=outcome)
+        llm_latency.observe(latency, model=model, prompt_version=prompt_version, outcome=outcome)
+        tier_latency.observe(latency, tier=tier)
+        if usage is None:
+            return
+
+        for kind, tokens in (("prompt", usage.prompt_tokens), ("completion", usage.completion_tokens)):
+            llm_tokens.inc(tokens, model=model, prompt_version=prompt_version, endpoint=endpoint, kind=kind)
+            llm_tokens_per_call.observe(tokens, model=model, prompt_version=prompt_version, kind=kind)
+        cost = self._estimate_cost(model, usage)
+        llm_cost.inc(cost, model=model, endpoint=endpoint)
+        tier_cost.inc(cost, tier=tier)
+
+    @staticmethod
+    def _call_outcome(error: BaseException) -> str:
+        """Outcome label of a failed completion."""
+        if isinstance(error, InvalidResponseException):
+            return "invalid_output"
+        if isinstance(error, openai.RateLimitError):
+            return "rate_limited"
+        if isinstance(error, TRANSIENT_ERRORS):
+            return "transient_error"
+        if not isinstance(error, Exception):
+            return "cancelled"
+        return "error"
+
+    @staticmethod
+    def _estimate_cost(model: str, usage: Any) -> float:
+        """Estimated USD cost of a completion from its token usage."""
+        prices = settings.LLM_MODEL_PRICES.get(model)
+        if not prices or usage is None:
+            return 0.0
+        input_price, output_price = prices
+        return (usage.prompt_tokens * input_price + usage.completion_tokens * output_price) / 1_000_000
+
+    @staticmethod
+    def _highest_level(levels: Iterable[str]) -> Optional[str]:
+        """Highest valid CEFR level among several, None if there are none."""
+        all_levels = CEFRLevel.get_all_levels()
+        indexes = [all_levels.index(level) for level in levels if level in all_levels]
+        return all_levels[max(indexes)] if indexes else None
+
+    @staticmethod
+    def _llm_error(message: str, error: Exception) -> LLMException:
+        """Wrap an error, keeping transient provider failures distinguishable so they can be retried."""
+        if isinstance(error, (LLMRateLimitException, openai.RateLimitError)):
+            return LLMRateLimitException(f"{message}: {str(error)}")
+        if isinstance(error, (TransientLLMException, *TRANSIENT_ERRORS)):
+            return TransientLLMException(f"{message}: {str(error)}")
+        return LLMException(f"{message}: {str(error)}")
+
+    @staticmethod
+    def _response_format_params(response_format: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Extra completion parameters; response_format is omitted in text mode."""
+        return {"response_format": response_format} if response_format else {}
+
+    def _cache_key(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        prompt_version: str,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Content-addressed cache key of a request, or None when caching is inactive."""
+        if self.response_cache is None:
+            return None
+        return build_cache_key({
+            "model": model,
+            "temperature": self.temperature,
+            "prompt_version": prompt_version,
+            "response_format": response_format,
+            "messages": messages
+        })
+
+    async def _cache_get(self, cache_key: Optional[str]) -> Optional[str]:
+        """Read a cached response; cache failures are treated as misses."""
+        if cache_key is None:
+            return None
+        try:
+            return await self.response_cache.get(cache_key)
+        except CacheException:
+            return None
+
+    async def _cache_set(self, cache_key: Optional[str], content: str) -> None:
+        """Store a response; cache failures never fail the evaluation."""
+        if cache_key is None:
+            return
+        try:
+            await self.response_cache.set(cache_key, content)
+        except CacheException:
+            pass
+
+    def parse_evaluation(self, result_str: str) -> Dict[str, Any]:
+        """Parse the evaluation JSON, repairing local defects; unrecoverable feedback items are dropped."""
+        evaluation, _ = self._parse_evaluation_with_repair(result_str)
+        return evaluation
+
+    def _parse_evaluation_with_repair(self, result_str: str) -> Tuple[Dict[str, Any], bool]:
+        """Parse and repair the evaluation JSON; also report whether a repair was needed."""
+        result, repaired = parse_json_lenient(result_str)
+        evaluation, evaluation_repaired = self._repair_evaluation(result)
+        return evaluation, repaired or evaluation_repaired
+
+    def _parse_batch_evaluation(
+        self,
+        result_str: str,
+        submissions: List[Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Split a multi-user evaluation back into per-submission results.
+        Incomplete submissions are returned as None so they are evaluated individually.
+        """
+        result, _ = parse_json_lenient(result_str)
+        if not isinstance(result, dict) or not isinstance(result.get("results"), list):
+            raise InvalidResponseException("LLM returned no results list for the batch")
+
+        evaluations: List[Optional[Dict[str, Any]]] = [None] * len(submissions)
+        for item in result["results"]:
+            index = item.get("submission_id") if isinstance(item, dict) else None
+            if not isinstance(index, int) or not 0 <= index < len(submissions):
+                continue
             try:
-                result = json.loads(result_str)
-                if isinstance(result, dict) and "final_level" in result:
-                    return result
-            except json.JSONDecodeError:
-                pass
-            
-            # If not JSON, assume it's just the level string
-            return {
-                "final_level": result_str,
-                "reason": "Final level determined based on comprehensive analysis"
+                evaluation, _ = self._repair_evaluation(item)
+            except InvalidResponseException:
+                continue
+
+            questions_dict, answers_dict = submissions[index]
+            aligned = self._align_feedback(evaluation["feedback"], questions_dict, answers_dict)
+            if len(aligned) < len(answers_dict):
+                continue
+            evaluation["feedback"] = [aligned[question_id] for question_id in answers_dict]
+            evaluations[index] = evaluation
+        return evaluations
+
+    def _repair_evaluation(self, result: Any) -> Tuple[Dict[str, Any], bool]:
+        """
+        Flatten the nested layout and repair each part of an evaluation object.
+        Unrecoverable feedback items are dropped, so the caller can re-request
+        just those answers. Next questions come from the question pool; any the
+        LLM volunteers anyway are passed through.
+        """
+        if not isinstance(result, dict):
+            raise InvalidResponseException(f"LLM returned unexpected JSON type: {type(result).__name__}")
+
+        # Handle nested structure from LLM response
+        result, _ = unwrap_evaluation(result)
+        if not any(key in result for key in ("level", "feedback", "next_questions")):
+            raise InvalidResponseException(f"LLM returned unexpected JSON structure. Keys found: {list(result.keys())}")
+
+        repaired = False
+        raw_feedback = result.get("feedback")
+        if not isinstance(raw_feedback, list):
+            raw_feedback = []
+            repaired = True
+
+        feedback = []
+        for item in raw_feedback:
+            fixed_item, item_repaired = repair_feedback_item(item)
+            if fixed_item is None:
+                repaired = True
+                continue
+            feedback.append(fixed_item)
+            repaired = repaired or item_repaired
+
+        reason = result.get("reason")
+        if not isinstance(reason, str) or not reason.strip():
+            reason = None
+            repaired = True
+
+        return {
+            "level": normalize_level(result.get("level")),
+            "scores": result.get("scores"),
+            "reason": reason,
+            "feedback": feedback,
+            "next_questions": repair_next_questions(result.get("next_questions")) or []
+        }, repaired
+
+    async def _complete_missing_parts(
+        self,
+        evaluation: Dict[str, Any],
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> int:
+        """
+        Re-request only the feedback items missing from a repaired evaluation,
+        concurrently. Returns the number of extra calls.
+        """
+        aligned = self._align_feedback(evaluation["feedback"], questions_dict, answers_dict)
+        missing_ids = [question_id for question_id in answers_dict if question_id not in aligned]
+
+        calls = [
+            self.evaluate_single_answer(questions_dict.get(question_id, ""), answers_dict[question_id])
+            for question_id in missing_ids
+        ]
+        outputs = await asyncio.gather(*calls)
+
+        for question_id, item in zip(missing_ids, outputs):
+            aligned[question_id] = {
+                **item,
+                "question_id": question_id,
+                "question": questions_dict.get(question_id, ""),
+                "answer": answers_dict[question_id]
             }
 
-        except Exception as e:
-            raise LLMException(f"Failed to perform final evaluation: {str(e)}")
-
-    def _get_evaluation_prompt_template(self) -> str:
-        """Get the prompt template for initial evaluation."""
-        return """Return ONLY valid JSON. DO NOT include any extra text.
-You are an expert English language evaluator.
-Your analysis must be grounded in established linguistic and pedagogical principles.
---- EVALUATION FRAMEWORK AND SCIENTIFIC BASIS: You must adhere to the following framework, which is based on the Common European Framework of Reference for Languages (CEFR)
-and principles of language acquisition.
-
-1. **Multi-component Competence Assessment:** Your evaluation of scores must break down proficiency into its core components, as defined by communicative competence models (Canale & Swain, 1980):
-* **Grammar (Accuracy):** The ability to use syntactic and morphological rules correctly. 
-* **Vocabulary (Lexical Resource):** The range and precision of the user's lexicon.
-* **Fluency:** The ability to produce language at a natural pace with minimal hesitation, reflecting cognitive automaticity.
-
-2. **CEFR-Aligned Question Analysis:** The provided questions are designed to elicit responses that correspond to specific CEFR levels. You must use this understanding to estimate the estimated_level:
-* **A1-A2 Level Questions (e.g., 'What did you do last weekend?'):** Assess the ability to use basic tenses for familiar topics.
-* **B1 Level Questions (e.g., 'Describe a challenge you overcame'):** Assess narrative structure, use of connectors, and expression of opinions on concrete topics.
-* **B2 Level Questions (e.g., 'How has technology changed your life?'):** Assess the ability to develop clear arguments on complex/abstract topics and use a wider range of language.
-* **C1-C2 Level Questions (e.g., Discussing abstract quotes or ethical dilemmas):** Assess advanced skills like interpreting figurative language, constructing counterfactual arguments, and expressing nuanced ideas with precision.
-
-3. **Formative Feedback Principle (Mistakes & Suggestions):**
-** Your feedback must facilitate learning. Based on Schmidt's "Noticing Hypothesis" (1990), you must explicitly identify mistakes and provide clear suggestions to help the user notice the gap between their output and the correct form. ALWAYS provide at least one mistake or suggestion, even for advanced levels (C1/C2) - focus on subtle improvements, style refinements, or advanced constructions.
-
-4. **Adaptive Assessment Principle (Next Questions):**
-** The 5 new questions you generate must be targeted at the user's diagnosed overall level. This aligns with Vygotsky's "Zone of Proximal Development," ensuring the user is challenged appropriately to stimulate further learning.
-
---- User answers (JSON): {{ "answers": {answers}, "questions": {questions} }}
-
-Instructions: - Guided strictly by the EVALUATION FRAMEWORK above, evaluate each answer individually.
-- For each answer, provide feedback with these fields: question, answer, estimated_level, scores, mistakes, suggestions.
-- Do not skip any answer. Evaluate **all provided answers**, even if there are more than 5.
-- Provide an overall level, average scores, and a short reason that explicitly references the framework.
-- Generate 5 new next_questions suitable for the user's diagnosed level (this is separate from the evaluation feedback).
-- For each answer, provide feedback with these fields:
-    - question
-    - answer
-    - estimated_level (A1-C2): Justified by the CEFR-Aligned Question Analysis.
-    - scores: {{grammar, vocabulary, fluency}}: Assessed according to the Multi-component Competence model. 
-    - mistakes: A list of specific errors (REQUIRED - even for advanced levels, identify subtle issues or areas for refinement)
-    - suggestions: A list of concrete corrections or better alternatives (REQUIRED - always provide constructive feedback)
-- Provide an overall level, average scores, and a short reason that explicitly references the framework.
-- Generate 5 new English next_questions suitable for the user's diagnosed level, following the Adaptive Assessment Principle. 
-
-Return strictly in this format:
-{{ "level": "A1-C2", "scores": {{"grammar": 0.0, "vocabulary": 0.0, "fluency": 0.0}}, "reason": "string", "feedback": [ {{ "question": "string", "answer": "string", "estimated_level": "A1-C2", "scores": {{"grammar": 0.0, "vocabulary": 0.0, "fluency": 0.0}}, "mistakes": ["string"], "suggestions": ["string"] }} ], "next_questions": [ "Question 1", "Question 2", "...", "Question 5" ] }}"""
-
-    def _get_final_evaluation_prompt_template(self) -> str:
-        """Get the prompt template for final evaluation."""
-        return """
-        You are an expert English language evaluator acting as a final arbiter. Your task is to determine a definitive CEFR level and provide reasoning.
-
-        --- SCIENTIFIC BASIS FOR FINAL JUDGMENT ---
-        Your final decision must be a holistic synthesis based on the principles established in the first evaluation:
-        1. CEFR Level Confirmation/Adjustment: Analyze the user's performance on these new, targeted questions.
-        2. Trend Analysis (Communicative Competence): Compare performance in the second round against the first round's scores (grammar, vocabulary, fluency).
-
-        --- CONTEXT: INITIAL EVALUATION SUMMARY ---
-        {previous_evaluation}
-
-        --- DATA: SECOND ROUND ANSWERS ---
-        {new_answers_with_questions}
-
-        --- FINAL INSTRUCTION ---
-        Return your response in this EXACT JSON format:
-        {{
-          "final_level": "B2",
-          "reason": "Detailed explanation of why this level was chosen, referencing specific evidence from both evaluations"
-        }}
-
-        Valid levels: 'A1', 'A2', 'B1', 'B2', 'C1', 'C2'.
-        The reason should be comprehensive and reference specific linguistic evidence.
-        """
\ No newline at end of file
+        evaluation["feedback"] = [aligned[question_id] for question_id in answers_dict]
+        return len(calls)
+
+    def _align_feedback(
+        self,
+        feedback: List[Dict[str, Any]],
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Match feedback items to answers by question_id, then by echoed question
+        or answer text (outputs of older prompt versions), then by position,
+        stamping the submitted question and answer on each item.
+        """
+        def normalize(text: Any) -> str:
+            return " ".join(str(text or "").split()).casefold()
+
+        remaining = []
+        matched: Dict[int, Dict[str, Any]] = {}
+        for item in feedback:
+            question_id = normalize_question_id(item.get("question_id"))
+            if question_id in answers_dict and question_id not in matched:
+                matched[question_id] = item
+            else:
+                remaining.append(item)
+
+        for question_id, answer in answers_dict.items():
+            if question_id in matched:
+                continue
+            question = normalize(questions_dict.get(question_id))
+            for item in remaining:
+                echoed_question, echoed_answer = normalize(item.get("question")), normalize(item.get("answer"))
+                if (echoed_question and echoed_question == question) or (echoed_answer and echoed_answer == normalize(answer)):
+                    matched[question_id] = item
+                    remaining.remove(item)
+                    break
+
+        # Items with neither a known id nor an echoed text keep their position
+        for question_id in answers_dict:
+            if question_id not in matched and remaining:
+                matched[question_id] = remaining.pop(0)
+
+        return {
+            question_id: {
+                **item,
+                "question_id": question_id,
+                "question": questions_dict.get(question_id, ""),
+                "answer": answers_dict[question_id]
+            }
+            for question_id, item in matched.items()
+        }
+
+    def _parse_feedback_item(self, result_str: str) -> Dict[str, Any]:
+        """Parse and repair a single feedback item."""
+        result, _ = parse_json_lenient(result_str)
+        item, _ = repair_feedback_item(result)
+        if item is None:
+            raise InvalidResponseException(f"LLM returned an incomplete feedback item: {result_str}")
+        return item
+
+    def _parse_next_questions(self, result_str: str) -> List[str]:
+        """Parse the list of follow-up questions."""
+        result, _ = parse_json_lenient(result_str)
+        next_questions = repair_next_questions(result)
+        if next_questions is None:
+            raise InvalidResponseException(f"LLM returned no next_questions list: {result_str}")
+        return next_questions
+
+    def _parse_final_evaluation(self, result_str: str) -> Dict[str, str]:
+        """Parse the final evaluation JSON, accepting a bare level string."""
+        result_str = result_str.strip()
+
+        # Try to parse as JSON first
+        try:
+            result, _ = parse_json_lenient(result_str)
+            if isinstance(result, dict) and "final_level" in result:
+                return result
+        except InvalidResponseException:
+            pass
+
+        # If not JSON, assume it's just the level string
+        return {
+            "final_level": result_str,
+            "reason": "Final level determined based on comprehensive analysis"
+        }
@@ -0,0 +1,62 @@
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
+
+from app.application.evaluation.ports.llm_service_port import LLMServicePort
+
+
+class LLMServiceDecorator(LLMServicePort):
+    """Base class for LLM service decorators; forwards every call to the wrapped service."""
+
+    def __init__(self, inner: LLMServicePort):
+        self.inner = inner
+
+    async def evaluate_answers(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> Dict[str, Any]:
+        """Evaluate answers using the wrapped service."""
+        return await self.inner.evaluate_answers(questions_dict, answers_dict)
+
+    async def evaluate_answers_batch(
+        self,
+        submissions: List[Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Evaluate several submissions using the wrapped service."""
+        return await self.inner.evaluate_answers_batch(submissions)
+
+    async def stream_evaluation(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the evaluation from the wrapped service."""
+        async for event in self.inner.stream_evaluation(questions_dict, answers_dict):
+            yield event
+
+    async def evaluate_single_answer(self, question: str, answer: str) -> Dict[str, Any]:
+        """Evaluate a single answer using the wrapped service."""
+        return await self.inner.evaluate_single_answer(question, answer)
+
+    async def generate_next_questions(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[str]:
+        """Generate next questions using the wrapped service."""
+        return await self.inner.generate_next_questions(questions_dict, answers_dict)
+
+    async def generate_questions(self, level: str, topic: str, count: int) -> List[str]:
+        """Generate questions for a level and topic using the wrapped service."""
+        return await self.inner.generate_questions(level, topic, count)
+
+    async def final_evaluation(
+        self,
+        previous_evaluation: Dict[str, Any],
+        new_answers: List[Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Perform the final evaluation using the wrapped service."""
+        return await self.inner.final_evaluation(previous_evaluation, new_answers)
+
+    async def aclose(self) -> None:
+        """Release the wrapped service's resources."""
+        await self.inner.aclose()
@@ -0,0 +1,67 @@
+from typing import Optional
+
+from app.application.evaluation.ports.batch_llm_backend_port import BatchLLMBackendPort
+from app.application.evaluation.ports.llm_service_port import LLMServicePort
+from app.core.config.settings import settings
+from app.core.interfaces.cache_interface import CacheInterface
+from app.infrastructure.external_services.adaptive_concurrency_llm_service import AdaptiveConcurrencyLLMService
+from app.infrastructure.external_services.flow_control import AIMDLimiter, CircuitBreaker
+from app.infrastructure.external_services.langchain_llm_service import LangchainLLMService
+from app.infrastructure.external_services.llm_simulator import SimulatedOpenAIClient, build_llm_simulator
+from app.infrastructure.external_services.micro_batching_llm_service import MicroBatchingLLMService
+from app.infrastructure.external_services.resilient_llm_service import ResilientLLMService
+from app.infrastructure.external_services.openai_batch_backend import OpenAIBatchBackend
+from app.infrastructure.external_services.local_file_batch_backend import LocalFileBatchBackend
+
+
+def build_llm_service(response_cache: Optional[CacheInterface] = None) -> LLMServicePort:
+    """
+    Build the process-wide LLM service, wrapping the adapter with the decorators enabled in settings.
+    With LLM_BACKEND="simulator" the adapter talks to the in-process LLM simulator instead of OpenAI.
+    Flow control sits closest to the provider so that retries and hedges also count against its limit.
+    """
+    client = SimulatedOpenAIClient(build_llm_simulator()) if settings.LLM_BACKEND == "simulator" else None
+    service: LLMServicePort = LangchainLLMService(client=client, response_cache=response_cache)
+
+    if settings.LLM_ADAPTIVE_CONCURRENCY_ENABLED:
+        service = AdaptiveConcurrencyLLMService(
+            service,
+            limiter=AIMDLimiter(
+                initial_limit=settings.LLM_CONCURRENCY_INITIAL_LIMIT,
+                min_limit=settings.LLM_CONCURRENCY_MIN_LIMIT,
+                max_limit=settings.LLM_CONCURRENCY_MAX_LIMIT,
+                backoff_ratio=settings.LLM_CONCURRENCY_BACKOFF_RATIO,
+                latency_threshold=settings.LLM_CONCURRENCY_LATENCY_THRESHOLD_SECONDS
+            ),
+            circuit_breaker=CircuitBreaker(
+                failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+                recovery_timeout=settings.LLM_CIRCUIT_RECOVERY_SECONDS
+            )
+        )
+
+    if settings.LLM_RESILIENCE_ENABLED:
+        service = ResilientLLMService(
+            service,
+            hedge_percentile=settings.LLM_HEDGE_PERCENTILE,
+            hedge_min_samples=settings.LLM_HEDGE_MIN_SAMPLES,
+            max_retries=settings.LLM_RETRY_ATTEMPTS,
+            backoff_base=settings.LLM_RETRY_BACKOFF_BASE,
+            backoff_max=settings.LLM_RETRY_BACKOFF_MAX
+        )
+
+    if settings.LLM_MICRO_BATCH_ENABLED:
+        service = MicroBatchingLLMService(
+            service,
+            window_ms=settings.LLM_MICRO_BATCH_WINDOW_MS,
+            max_batch_size=settings.LLM_MICRO_BATCH_MAX_SIZE
+        )
+
+    return service
+
+
+def build_batch_llm_backend(backend: Optional[str] = None) -> BatchLLMBackendPort:
+    """Build the batch-submission backend ("openai" or the file-based "local" stand-in)."""
+    backend = backend or settings.LLM_BATCH_BACKEND
+    if backend == "local":
+        return LocalFileBatchBackend(settings.LLM_BATCH_LOCAL_DIR)
+    return OpenAIBatchBackend()
@@ -0,0 +1,326 @@
+"""
+Deterministic LLM simulator for load and latency testing without a provider.
+
+``LLMSimulator`` answers the service's own prompts with schema-valid JSON
+sized to the input, after a configurable latency: a log-normal time to first
+token followed by generation at a fixed token rate. It can also inject
+server errors and bursts of rate limits. ``SimulatedOpenAIClient`` exposes it
+through the subset of the ``openai.AsyncOpenAI`` interface used by the
+adapter, so the whole adapter (parsing, repair, routing, caching) runs
+unchanged; llm_simulator_server.py serves it over HTTP.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import httpx
+import openai
+
+from app.core.config.settings import settings
+from app.domain.value_objects.cefr_level import CEFRLevel
+from app.infrastructure.external_services.model_router import (
+    EVALUATION_TASK,
+    BATCH_EVALUATION_TASK,
+    ANSWER_EVALUATION_TASK,
+    NEXT_QUESTIONS_TASK,
+    QUESTION_GENERATION_TASK,
+    FINAL_EVALUATION_TASK
+)
+from app.infrastructure.external_services.prompts import (
+    EVALUATION_SYSTEM_PROMPT,
+    BATCH_EVALUATION_SYSTEM_PROMPT,
+    ANSWER_EVALUATION_SYSTEM_PROMPT,
+    NEXT_QUESTIONS_SYSTEM_PROMPT,
+    QUESTION_GENERATION_SYSTEM_PROMPT,
+    FINAL_EVALUATION_SYSTEM_PROMPT
+)
+
+# Which sub-task each system prompt belongs to
+PROMPT_TASKS = {
+    EVALUATION_SYSTEM_PROMPT: EVALUATION_TASK,
+    BATCH_EVALUATION_SYSTEM_PROMPT: BATCH_EVALUATION_TASK,
+    ANSWER_EVALUATION_SYSTEM_PROMPT: ANSWER_EVALUATION_TASK,
+    NEXT_QUESTIONS_SYSTEM_PROMPT: NEXT_QUESTIONS_TASK,
+    QUESTION_GENERATION_SYSTEM_PROMPT: QUESTION_GENERATION_TASK,
+    FINAL_EVALUATION_SYSTEM_PROMPT: FINAL_EVALUATION_TASK
+}
+
+CHARS_PER_TOKEN = 4
+STREAM_CHUNK_TOKENS = 4
+
+
+class SimulatedLLMError(Exception):
+    """A simulated provider error, carrying the HTTP status a real provider would return."""
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.retry_after = retry_after
+
+
+class LLMSimulator:
+    """
+    Simulated chat completion provider.
+
+    Evaluations only depend on the messages; latencies, injected failures and
+    generated pool questions are drawn from a random generator that can be
+    seeded for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        latency_median: float = 1.5,
+        latency_sigma: float = 0.5,
+        tokens_per_second: float = 80.0,
+        error_rate: float = 0.0,
+        rate_limit_burst_probability: float = 0.0,
+        rate_limit_burst_seconds: float = 5.0,
+        seed: Optional[int] = None
+    ):
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.rate_limit_burst_probability = rate_limit_burst_probability
+        self.rate_limit_burst_seconds = rate_limit_burst_seconds
+        self.random = random.Random(seed)
+        self._rate_limited_until = 0.0
+
+    async def complete(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Wait for the simulated latency and return the content and token usage."""
+        content = self.render(messages)
+        usage = self.usage(messages, content)
+        await asyncio.sleep(self.time_to_first_token() + usage["completion_tokens"] / self.tokens_per_second)
+        return {"content": content, "usage": usage}
+
+    async def stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Yield the content in chunks, paced by the time to first token and the token rate."""
+        content = self.render(messages)
+        await asyncio.sleep(self.time_to_first_token())
+        chunk_size = STREAM_CHUNK_TOKENS * CHARS_PER_TOKEN
+        for start in range(0, len(content), chunk_size):
+            await asyncio.sleep(STREAM_CHUNK_TOKENS / self.tokens_per_second)
+            yield content[start:start + chunk_size]
+
+    def check_failure(self) -> None:
+        """Raise the injected failure of this call, if any; call before answering."""
+        now = time.monotonic()
+        if now >= self._rate_limited_until and self.random.random() < self.rate_limit_burst_probability:
+            self._rate_limited_until = now + self.rate_limit_burst_seconds
+        if now < self._rate_limited_until:
+            retry_after = self._rate_limited_until - now
+            raise SimulatedLLMError(429, f"Simulated rate limit; retry in {retry_after:.1f}s", retry_after)
+        if self.random.random() < self.error_rate:
+            raise SimulatedLLMError(500, "Simulated server error")
+
+    def time_to_first_token(self) -> float:
+        """Log-normal latency around the configured median."""
+        return self.latency_median * math.exp(self.random.gauss(0.0, self.latency_sigma))
+
+    @staticmethod
+    def usage(messages: List[Dict[str, str]], content: str) -> Dict[str, int]:
+        """Token usage estimated from the text length."""
+        prompt_tokens = sum(len(message["content"]) for message in messages) // CHARS_PER_TOKEN
+        completion_tokens = max(1, len(content) // CHARS_PER_TOKEN)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+
+    def render(self, messages: List[Dict[str, str]]) -> str:
+        """JSON content answering the service prompt in the messages."""
+        system = next((m["content"] for m in messages if m["role"] == "system"), "")
+        user = next((m["content"] for m in messages if m["role"] == "user"), "")
+        task = PROMPT_TASKS.get(system)
+        data = list(self._json_values(user))
+
+        if task == EVALUATION_TASK and data:
+            result = self._evaluation(data[0]["questions"], data[0]["answers"])
+        elif task == BATCH_EVALUATION_TASK and data:
+            result = {"results": [
+                {"submission_id": item["submission_id"], **self._evaluation(item["questions"], item["answers"])}
+                for item in data[0]
+            ]}
+        elif task == ANSWER_EVALUATION_TASK and data:
+            result = self._feedback_item(data[0]["answer"])
+        elif task == NEXT_QUESTIONS_TASK and data:
+            result = {"next_questions": self._next_questions(self._overall_level(data[0]["answers"].values()))}
+        elif task == QUESTION_GENERATION_TASK and data:
+            result = {"next_questions": self._pool_questions(data[0]["level"], data[0]["topic"], data[0]["count"])}
+        elif task == FINAL_EVALUATION_TASK and len(data) == 2:
+            result = self._final_evaluation(data[0], data[1])
+        else:
+            result = {}
+        return json.dumps(result, ensure_ascii=False)
+
+    @staticmethod
+    def _json_values(text: str) -> Iterator[Any]:
+        """Top-level JSON objects and arrays embedded in a prompt, in order."""
+        decoder = json.JSONDecoder()
+        index = 0
+        while True:
+            starts = [position for position in (text.find("{", index), text.find("[", index)) if position >= 0]
+            if not starts:
+                return
+            try:
+                value, index = decoder.raw_decode(text, min(starts))
+            except json.JSONDecodeError:
+                index = min(starts) + 1
+                continue
+            yield value
+
+    def _evaluation(self, questions: Dict[str, str], answers: Dict[str, str]) -> Dict[str, Any]:
+        """Initial evaluation with one feedback item per answer, referenced by question id."""
+        feedback = [{"question_id": int(key), **self._feedback_item(answer)} for key, answer in answers.items()]
+        level = self._overall_level(answers.values())
+        return {
+            "level": level,
+            "scores": self._average_scores(feedback),
+            "reason": f"Simulated evaluation of {len(feedback)} answers: the answers are consistent with {level}.",
+            "feedback": feedback
+        }
+
+    def _feedback_item(self, answer: str) -> Dict[str, Any]:
+        """Feedback on one answer; level and scores grow with its length."""
+        level = self._answer_level(answer)
+        base = 3.0 + CEFRLevel.get_all_levels().index(level) * 1.2
+        jitter = self._stable_fraction(answer)
+        return {
+            "estimated_level": level,
+            "scores": {
+                "grammar": round(min(10.0, base + jitter), 1),
+                "vocabulary": round(min(10.0, base + jitter / 2), 1),
+                "fluency": round(min(10.0, base), 1)
+            },
+            "mistakes": [f"Simulated mistake: check the verb forms in \"{answer[:40]}\""],
+            "suggestions": ["Simulated suggestion: use a wider range of connectors and tenses"]
+        }
+
+    def _final_evaluation(self, previous_evaluation: Dict[str, Any], new_answers: List[Dict[str, str]]) -> Dict[str, str]:
+        """Final level from the second round answers, compared with the first round."""
+        level = self._overall_level(item.get("answer", "") for item in new_answers)
+        previous_level = previous_evaluation.get("level", level)
+        return {
+            "final_level": level,
+            "reason": (
+                f"Simulated final evaluation: the initial evaluation estimated {previous_level} and "
+                f"the {len(new_answers)} second round answers are consistent with {level}."
+            )
+        }
+
+    @staticmethod
+    def _next_questions(level: str) -> List[str]:
+        """Five follow-up questions for a level."""
+        return [f"Simulated {level} follow-up question {number}?" for number in range(1, 6)]
+
+    def _pool_questions(self, level: str, topic: str, count: int) -> List[str]:
+        """Distinct questions for a level and topic; each call yields new ones, like a sampled LLM."""
+        batch = self.random.getrandbits(32)
+        return [f"Simulated {level} question about {topic} #{batch:08x}-{number}?" for number in range(1, count + 1)]
+
+    @staticmethod
+    def _answer_level(answer: str) -> str:
+        """Level of one answer, from its word count."""
+        levels = CEFRLevel.get_all_levels()
+        return levels[min(len(answer.split()) // 12, len(levels) - 1)]
+
+    def _overall_level(self, answers: Any) -> str:
+        """Median level of several answers."""
+        levels = CEFRLevel.get_all_levels()
+        indexes = sorted(levels.index(self._answer_level(answer)) for answer in answers)
+        return levels[indexes[len(indexes) // 2]] if indexes else CEFRLevel.A1.value
+
+    @staticmethod
+    def _average_scores(feedback: List[Dict[str, Any]]) -> Dict[str, float]:
+        """Per-skill average of the feedback scores."""
+        skills = ("grammar", "vocabulary", "fluency")
+        if not feedback:
+            return {skill: 0.0 for skill in skills}
+        return {skill: round(sum(item["scores"][skill] for item in feedback) / len(feedback), 1) for skill in skills}
+
+    @staticmethod
+    def _stable_fraction(text: str) -> float:
+        """Deterministic value in [0, 1) derived from a text."""
+        return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16) / 0x100000000
+
+
+class _SimulatedCompletions:
+    """``chat.completions`` of the simulated client."""
+
+    def __init__(self, simulator: LLMSimulator):
+        self.simulator = simulator
+
+    async def create(self, model: str, messages: List[Dict[str, str]], stream: bool = False, **kwargs: Any) -> Any:
+        """Simulated chat completion, raising the openai errors a real provider would cause."""
+        try:
+            self.simulator.check_failure()
+        except SimulatedLLMError as e:
+            raise _openai_error(e)
+
+        if stream:
+            include_usage = bool((kwargs.get("stream_options") or {}).get("include_usage"))
+            return self._chunks(model, messages, include_usage)
+
+        result = await self.simulator.complete(messages)
+        return SimpleNamespace(
+            model=model,
+            choices=[SimpleNamespace(index=0, finish_reason="stop", message=SimpleNamespace(role="assistant", content=result["content"]))],
+            usage=SimpleNamespace(**result["usage"])
+        )
+
+    async def _chunks(self, model: str, messages: List[Dict[str, str]], include_usage: bool) -> AsyncIterator[Any]:
+        """Stream chunks shaped like the SDK's, optionally ending with a usage-only chunk."""
+        content = ""
+        async for text in self.simulator.stream(messages):
+            content += text
+            yield SimpleNamespace(
+                model=model,
+                choices=[SimpleNamespace(index=0, delta=SimpleNamespace(content=text))],
+                usage=None
+            )
+        if include_usage:
+            yield SimpleNamespace(model=model, choices=[], usage=SimpleNamespace(**self.simulator.usage(messages, content)))
+
+
+class SimulatedOpenAIClient:
+    """In-process stand-in for ``openai.AsyncOpenAI`` backed by an LLMSimulator."""
+
+    def __init__(self, simulator: LLMSimulator):
+        self.chat = SimpleNamespace(completions=_SimulatedCompletions(simulator))
+
+    async def close(self) -> None:
+        """Nothing to release."""
+        pass
+
+
+def _openai_error(error: SimulatedLLMError) -> openai.APIStatusError:
+    """The openai SDK exception matching a simulated error."""
+    headers = {"retry-after": str(math.ceil(error.retry_after))} if error.retry_after else None
+    response = httpx.Response(
+        error.status_code,
+        headers=headers,
+        request=httpx.Request("POST", "http://llm-simulator/v1/chat/completions")
+    )
+    error_class = openai.RateLimitError if error.status_code == 429 else openai.InternalServerError
+    return error_class(error.message, response=response, body=None)
+
+
+def build_llm_simulator() -> LLMSimulator:
+    """Build the simulator from settings."""
+    return LLMSimulator(
+        latency_median=settings.LLM_SIM_LATENCY_MEDIAN_SECONDS,
+        latency_sigma=settings.LLM_SIM_LATENCY_SIGMA,
+        tokens_per_second=settings.LLM_SIM_TOKENS_PER_SECOND,
+        error_rate=settings.LLM_SIM_ERROR_RATE,
+        rate_limit_burst_probability=settings.LLM_SIM_RATE_LIMIT_BURST_PROBABILITY,
+        rate_limit_burst_seconds=settings.LLM_SIM_RATE_LIMIT_BURST_SECONDS,
+        seed=settings.LLM_SIM_SEED
+    )
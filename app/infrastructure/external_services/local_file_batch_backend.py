@@ -0,0 +1,124 @@
+import json
+import uuid
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from app.application.evaluation.ports.batch_llm_backend_port import (
+    BatchLLMBackendPort,
+    BATCH_IN_PROGRESS,
+    BATCH_COMPLETED
+)
+from app.application.evaluation.ports.llm_service_port import LLMServicePort
+from app.core.exceptions.evaluation_exceptions import LLMException
+from app.domain.value_objects.cefr_level import CEFRLevel
+
+
+class LocalFileBatchBackend(BatchLLMBackendPort):
+    """
+    File-based stand-in for a batch LLM provider, for tests and local runs.
+
+    Each batch is a directory holding ``input.jsonl``; the first poll processes
+    it into ``output.jsonl``. Items are evaluated with the given LLM service, or
+    with a deterministic length-based heuristic when none is given.
+    """
+
+    def __init__(self, directory: str, evaluator: Optional[LLMServicePort] = None):
+        self.directory = Path(directory)
+        self.evaluator = evaluator
+
+    async def submit_evaluations(
+        self,
+        submissions: Dict[str, Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> str:
+        """Write the submissions to a new batch directory."""
+        batch_id = f"batch_{uuid.uuid4().hex}"
+        batch_dir = self.directory / batch_id
+        batch_dir.mkdir(parents=True)
+
+        with open(batch_dir / "input.jsonl", "w", encoding="utf-8") as file:
+            for custom_id, (questions_dict, answers_dict) in submissions.items():
+                file.write(json.dumps({
+                    "custom_id": custom_id,
+                    "questions": questions_dict,
+                    "answers": answers_dict
+                }, ensure_ascii=False) + "\n")
+
+        return batch_id
+
+    async def get_status(self, batch_id: str) -> str:
+        """Process the batch on first poll and report it as completed."""
+        batch_dir = self._batch_dir(batch_id)
+        if (batch_dir / "output.jsonl").exists():
+            return BATCH_COMPLETED
+
+        await self._process(batch_dir)
+        return BATCH_IN_PROGRESS
+
+    async def fetch_results(self, batch_id: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Read the evaluations written to the batch output file."""
+        output_path = self._batch_dir(batch_id) / "output.jsonl"
+        if not output_path.exists():
+            raise LLMException(f"Batch {batch_id} has not completed")
+
+        results = {}
+        with open(output_path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    item = json.loads(line)
+                    results[item["custom_id"]] = item["evaluation"]
+        return results
+
+    async def _process(self, batch_dir: Path) -> None:
+        """Evaluate every input line and write the output file atomically."""
+        lines = []
+        with open(batch_dir / "input.jsonl", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                questions_dict = {int(key): value for key, value in item["questions"].items()}
+                answers_dict = {int(key): value for key, value in item["answers"].items()}
+                try:
+                    evaluation = await self._evaluate(questions_dict, answers_dict)
+                except LLMException:
+                    evaluation = None
+                lines.append(json.dumps({"custom_id": item["custom_id"], "evaluation": evaluation}))
+
+        partial_path = batch_dir / "output.jsonl.partial"
+        partial_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        partial_path.rename(batch_dir / "output.jsonl")
+
+    async def _evaluate(self, questions_dict: Dict[int, str], answers_dict: Dict[int, str]) -> Dict[str, Any]:
+        """Evaluate one submission with the configured evaluator or the heuristic."""
+        if self.evaluator is not None:
+            return await self.evaluator.evaluate_answers(questions_dict, answers_dict)
+
+        levels = CEFRLevel.get_all_levels()
+        feedback = []
+        for question_id, answer in answers_dict.items():
+            level_index = min(len(answer.split()) // 12, len(levels) - 1)
+            score = round(3.0 + level_index * 1.2, 1)
+            feedback.append({
+                "question_id": question_id,
+                "question": questions_dict.get(question_id, ""),
+                "answer": answer,
+                "estimated_level": levels[level_index],
+                "scores": {"grammar": score, "vocabulary": score, "fluency": score},
+                "mistakes": ["Heuristic evaluation: no linguistic analysis performed"],
+                "suggestions": ["Write longer answers to demonstrate a wider range of language"]
+            })
+
+        return {
+            "level": feedback[0]["estimated_level"] if feedback else CEFRLevel.A1.value,
+            "scores": feedback[0]["scores"] if feedback else {"grammar": 0.0, "vocabulary": 0.0, "fluency": 0.0},
+            "reason": "Estimated by the local batch backend from answer length",
+            "feedback": feedback,
+            "next_questions": []
+        }
+
+    def _batch_dir(self, batch_id: str) -> Path:
+        """Directory of a batch, validating that it exists."""
+        batch_dir = self.directory / batch_id
+        if not (batch_dir / "input.jsonl").exists():
+            raise LLMException(f"Unknown batch {batch_id}")
+        return batch_dir
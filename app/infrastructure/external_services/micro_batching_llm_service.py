@@ -0,0 +1,127 @@
+import asyncio
+import time
+from typing import Dict, Any, List, Optional
+
+from app.application.evaluation.ports.llm_service_port import LLMServicePort
+from app.core.metrics import metrics
+from app.infrastructure.external_services.llm_service_decorator import LLMServiceDecorator
+
+batch_size_histogram = metrics.histogram(
+    "llm_micro_batch_size",
+    "Number of evaluation requests packed into one LLM call",
+    buckets=(1, 2, 4, 8, 16, 32, 64)
+)
+queue_delay_histogram = metrics.histogram(
+    "llm_micro_batch_queue_delay_seconds",
+    "Time an evaluation request waited for its micro-batch to be flushed",
+    buckets=(0.001, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5)
+)
+batch_fallbacks = metrics.counter(
+    "llm_micro_batch_fallbacks_total",
+    "Submissions re-evaluated individually because the batch output lacked them"
+)
+
+
+class _PendingEvaluation:
+    """Evaluation request waiting in the micro-batch queue."""
+
+    __slots__ = ("questions_dict", "answers_dict", "future", "enqueued_at")
+
+    def __init__(self, questions_dict: Dict[int, str], answers_dict: Dict[int, str]):
+        self.questions_dict = questions_dict
+        self.answers_dict = answers_dict
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.enqueued_at = time.monotonic()
+
+
+class MicroBatchingLLMService(LLMServiceDecorator):
+    """
+    Collects concurrent evaluate_answers calls for a short window and sends
+    them as one multi-user completion, so the static rubric is paid once per
+    batch instead of once per user. Other calls are forwarded unchanged.
+    """
+
+    def __init__(self, inner: LLMServicePort, window_ms: float = 30.0, max_batch_size: int = 8):
+        super().__init__(inner)
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._pending: List[_PendingEvaluation] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+    async def evaluate_answers(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> Dict[str, Any]:
+        """Queue the evaluation and wait for its micro-batch result."""
+        pending = _PendingEvaluation(questions_dict, answers_dict)
+        self._pending.append(pending)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self._flush)
+
+        return await pending.future
+
+    async def aclose(self) -> None:
+        """Flush queued requests, wait for in-flight batches and close the wrapped service."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await super().aclose()
+
+    def _flush(self) -> None:
+        """Take the queued requests and dispatch them as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[_PendingEvaluation]) -> None:
+        """Evaluate a batch and resolve each caller's future."""
+        now = time.monotonic()
+        batch_size_histogram.observe(len(batch))
+        for pending in batch:
+            queue_delay_histogram.observe(now - pending.enqueued_at)
+
+        try:
+            if len(batch) == 1:
+                results = [await self.inner.evaluate_answers(batch[0].questions_dict, batch[0].answers_dict)]
+            else:
+                results = await self.inner.evaluate_answers_batch(
+                    [(pending.questions_dict, pending.answers_dict) for pending in batch]
+                )
+        except Exception as e:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        missing = [pending for pending, result in zip(batch, results) if result is None]
+        for pending, result in zip(batch, results):
+            if result is not None and not pending.future.done():
+                pending.future.set_result(result)
+
+        if missing:
+            batch_fallbacks.inc(len(missing))
+            await asyncio.gather(*(self._evaluate_individually(pending) for pending in missing))
+
+    async def _evaluate_individually(self, pending: _PendingEvaluation) -> None:
+        """Fall back to a single-user call for a submission the batch could not split out."""
+        try:
+            result = await self.inner.evaluate_answers(pending.questions_dict, pending.answers_dict)
+        except Exception as e:
+            if not pending.future.done():
+                pending.future.set_exception(e)
+            return
+        if not pending.future.done():
+            pending.future.set_result(result)
@@ -0,0 +1,87 @@
+from typing import Dict, List, Optional
+
+from app.core.config.settings import settings
+from app.domain.value_objects.cefr_level import CEFRLevel
+
+# Model tiers, from cheapest to strongest
+FAST_TIER = "fast"
+STRONG_TIER = "strong"
+TIER_ORDER = [FAST_TIER, STRONG_TIER]
+
+# LLM sub-tasks
+EVALUATION_TASK = "evaluation"
+BATCH_EVALUATION_TASK = "batch_evaluation"
+ANSWER_EVALUATION_TASK = "answer_evaluation"
+NEXT_QUESTIONS_TASK = "next_questions"
+QUESTION_GENERATION_TASK = "question_generation"
+FINAL_EVALUATION_TASK = "final_evaluation"
+
+
+class ModelRouter:
+    """
+    Maps each LLM sub-task, and optionally the learner's level, to a model tier.
+
+    The fast tier is trusted up to ``fast_tier_max_level``: a learner known to
+    be at or below it is routed to the fast tier, and a fast-tier result rated
+    above it is treated as low confidence and escalated to the next tier.
+    """
+
+    def __init__(
+        self,
+        models: Dict[str, str],
+        task_tiers: Dict[str, str],
+        fast_tier_max_level: str = CEFRLevel.A2.value
+    ):
+        self.models = models
+        self.task_tiers = task_tiers
+        self.fast_tier_max_level = fast_tier_max_level
+
+    @property
+    def tiers(self) -> List[str]:
+        """Configured tiers, from cheapest to strongest."""
+        return [tier for tier in TIER_ORDER if tier in self.models]
+
+    def route(self, task: str, level: Optional[str] = None) -> str:
+        """Tier a sub-task starts on."""
+        tier = self.task_tiers.get(task, self.tiers[-1])
+        if level is not None and FAST_TIER in self.models and self._level_index(level) is not None:
+            if self._level_index(level) <= self._level_index(self.fast_tier_max_level):
+                return FAST_TIER
+        return tier
+
+    def model(self, tier: str) -> str:
+        """Model name of a tier."""
+        return self.models[tier]
+
+    def escalation(self, tier: str) -> Optional[str]:
+        """Next stronger tier with a different model, or None at the top."""
+        tiers = self.tiers
+        for next_tier in tiers[tiers.index(tier) + 1:]:
+            if self.models[next_tier] != self.models[tier]:
+                return next_tier
+        return None
+
+    def exceeds_tier(self, tier: str, level: Optional[str]) -> bool:
+        """Whether a result level is beyond what the tier is trusted to rate."""
+        if tier != FAST_TIER or level is None:
+            return False
+        index = self._level_index(level)
+        return index is not None and index > self._level_index(self.fast_tier_max_level)
+
+    @staticmethod
+    def _level_index(level: str) -> Optional[int]:
+        """Position of a CEFR level, None if invalid."""
+        levels = CEFRLevel.get_all_levels()
+        return levels.index(level) if level in levels else None
+
+
+def build_model_router() -> ModelRouter:
+    """Build the router from settings; with routing disabled every task uses OPENAI_MODEL."""
+    if not settings.LLM_ROUTING_ENABLED:
+        return ModelRouter({STRONG_TIER: settings.OPENAI_MODEL}, {})
+
+    return ModelRouter(
+        {FAST_TIER: settings.LLM_FAST_MODEL, STRONG_TIER: settings.OPENAI_MODEL},
+        settings.LLM_TASK_TIERS,
+        settings.LLM_FAST_TIER_MAX_LEVEL
+    )
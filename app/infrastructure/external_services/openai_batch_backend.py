@@ -0,0 +1,117 @@
+import json
+from typing import Dict, Any, Optional, Tuple
+
+from app.application.evaluation.ports.batch_llm_backend_port import (
+    BatchLLMBackendPort,
+    BATCH_IN_PROGRESS,
+    BATCH_COMPLETED,
+    BATCH_FAILED
+)
+from app.core.exceptions.evaluation_exceptions import LLMException, InvalidResponseException
+from app.infrastructure.external_services.langchain_llm_service import LangchainLLMService
+from app.infrastructure.external_services.response_schemas import INITIAL_EVALUATION_SCHEMA
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+
+class OpenAIBatchBackend(BatchLLMBackendPort):
+    """Batch backend using the OpenAI Batch API (JSONL upload, asynchronous processing)."""
+
+    # Final statuses without (complete) output; "cancelling" batches can still complete
+    FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+    def __init__(self, llm_service: Optional[LangchainLLMService] = None, completion_window: str = "24h"):
+        # A service created here is owned, and closed, by the backend
+        self._owns_llm_service = llm_service is None
+        self.llm_service = llm_service or LangchainLLMService()
+        self.client = self.llm_service.client
+        self.completion_window = completion_window
+
+    async def aclose(self) -> None:
+        """Close the LLM service (and its client) if the backend created it."""
+        if self._owns_llm_service:
+            await self.llm_service.aclose()
+
+    async def submit_evaluations(
+        self,
+        submissions: Dict[str, Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> str:
+        """Upload the requests as a JSONL file and create a batch job."""
+        try:
+            lines = [
+                json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": CHAT_COMPLETIONS_ENDPOINT,
+                    "body": self._request_body(questions_dict, answers_dict)
+                }, ensure_ascii=False)
+                for custom_id, (questions_dict, answers_dict) in submissions.items()
+            ]
+
+            input_file = await self.client.files.create(
+                file=("evaluations.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=CHAT_COMPLETIONS_ENDPOINT,
+                completion_window=self.completion_window
+            )
+            return batch.id
+
+        except Exception as e:
+            raise LLMException(f"Failed to submit evaluation batch: {str(e)}")
+
+    def _request_body(self, questions_dict: Dict[int, str], answers_dict: Dict[int, str]) -> Dict[str, Any]:
+        """Chat completion body of one evaluation, with the adapter's prompt and response format."""
+        body = {
+            "model": self.llm_service.model,
+            "temperature": self.llm_service.temperature,
+            "messages": self.llm_service.build_evaluation_messages(questions_dict, answers_dict)
+        }
+        response_format = self.llm_service.response_format(INITIAL_EVALUATION_SCHEMA)
+        if response_format:
+            body["response_format"] = response_format
+        return body
+
+    async def get_status(self, batch_id: str) -> str:
+        """Map the OpenAI batch status to the port statuses."""
+        try:
+            batch = await self.client.batches.retrieve(batch_id)
+        except Exception as e:
+            raise LLMException(f"Failed to retrieve batch {batch_id}: {str(e)}")
+
+        if batch.status == "completed":
+            return BATCH_COMPLETED
+        if batch.status in self.FAILED_STATUSES:
+            return BATCH_FAILED
+        return BATCH_IN_PROGRESS
+
+    async def fetch_results(self, batch_id: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Download the output file and parse each completion."""
+        try:
+            batch = await self.client.batches.retrieve(batch_id)
+            if not batch.output_file_id:
+                return {}
+            output = await self.client.files.content(batch.output_file_id)
+        except Exception as e:
+            raise LLMException(f"Failed to fetch results of batch {batch_id}: {str(e)}")
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            results[item["custom_id"]] = self._parse_item(item)
+        return results
+
+    def _parse_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse one output line; None if the request failed or returned invalid JSON."""
+        response = item.get("response") or {}
+        if item.get("error") or response.get("status_code") != 200:
+            return None
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+            return self.llm_service.parse_evaluation(content)
+        except (KeyError, IndexError, InvalidResponseException):
+            return None
@@ -0,0 +1,26 @@
+import httpx
+import openai
+
+from app.core.config.settings import settings
+
+
+def build_async_openai_client() -> openai.AsyncOpenAI:
+    """Build the process-wide async OpenAI client with a pooled HTTP connection."""
+    http_client = openai.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY
+        ),
+        timeout=httpx.Timeout(
+            settings.LLM_REQUEST_TIMEOUT,
+            connect=settings.LLM_CONNECT_TIMEOUT
+        )
+    )
+
+    return openai.AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        base_url=settings.OPENAI_BASE_URL,
+        http_client=http_client,
+        max_retries=settings.LLM_MAX_RETRIES
+    )
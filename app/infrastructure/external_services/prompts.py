@@ -0,0 +1,191 @@
+"""
+Prompt templates for the LLM service.
+
+Every prompt is a static system message followed by a small user message
+holding only the per-request data, so the provider can cache the shared
+prefix across calls. Bump a template's version whenever its text changes;
+the version is part of the response cache key.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+EVALUATION_PROMPT_VERSION = "evaluation-v4"
+BATCH_EVALUATION_PROMPT_VERSION = "batch-evaluation-v4"
+ANSWER_EVALUATION_PROMPT_VERSION = "answer-evaluation-v3"
+NEXT_QUESTIONS_PROMPT_VERSION = "next-questions-v2"
+QUESTION_GENERATION_PROMPT_VERSION = "question-generation-v1"
+FINAL_EVALUATION_PROMPT_VERSION = "final-evaluation-v3"
+
+JSON_ONLY = "Return ONLY valid JSON. DO NOT include any extra text.\n"
+
+# Static rubric shared by the single-user and multi-user evaluation prompts
+EVALUATION_FRAMEWORK = """You are an expert English language evaluator.
+Your analysis must be grounded in established linguistic and pedagogical principles.
+--- EVALUATION FRAMEWORK AND SCIENTIFIC BASIS: You must adhere to the following framework, which is based on the Common European Framework of Reference for Languages (CEFR)
+and principles of language acquisition.
+
+1. **Multi-component Competence Assessment:** Your evaluation of scores must break down proficiency into its core components, as defined by communicative competence models (Canale & Swain, 1980):
+* **Grammar (Accuracy):** The ability to use syntactic and morphological rules correctly.
+* **Vocabulary (Lexical Resource):** The range and precision of the user's lexicon.
+* **Fluency:** The ability to produce language at a natural pace with minimal hesitation, reflecting cognitive automaticity.
+
+2. **CEFR-Aligned Question Analysis:** The provided questions are designed to elicit responses that correspond to specific CEFR levels. You must use this understanding to estimate the estimated_level:
+* **A1-A2 Level Questions (e.g., 'What did you do last weekend?'):** Assess the ability to use basic tenses for familiar topics.
+* **B1 Level Questions (e.g., 'Describe a challenge you overcame'):** Assess narrative structure, use of connectors, and expression of opinions on concrete topics.
+* **B2 Level Questions (e.g., 'How has technology changed your life?'):** Assess the ability to develop clear arguments on complex/abstract topics and use a wider range of language.
+* **C1-C2 Level Questions (e.g., Discussing abstract quotes or ethical dilemmas):** Assess advanced skills like interpreting figurative language, constructing counterfactual arguments, and expressing nuanced ideas with precision.
+
+3. **Formative Feedback Principle (Mistakes & Suggestions):**
+** Your feedback must facilitate learning. Based on Schmidt's "Noticing Hypothesis" (1990), you must explicitly identify mistakes and provide clear suggestions to help the user notice the gap between their output and the correct form. ALWAYS provide at least one mistake or suggestion, even for advanced levels (C1/C2) - focus on subtle improvements, style refinements, or advanced constructions.
+
+"""
+
+# Feedback never echoes the question or answer texts (the largest share of the
+# output tokens); multi-answer outputs reference each answer by its question id
+FEEDBACK_FIELDS_FORMAT = """"estimated_level": "A1-C2", "scores": {"grammar": 0.0, "vocabulary": 0.0, "fluency": 0.0}, "mistakes": ["string"], "suggestions": ["string"]"""
+FEEDBACK_ITEM_FORMAT = """{ "question_id": 0, """ + FEEDBACK_FIELDS_FORMAT + """ }"""
+ANSWER_FEEDBACK_FORMAT = """{ """ + FEEDBACK_FIELDS_FORMAT + """ }"""
+
+EVALUATION_SYSTEM_PROMPT = JSON_ONLY + EVALUATION_FRAMEWORK + """Instructions: - Guided strictly by the EVALUATION FRAMEWORK above, evaluate each answer in the user message individually.
+- Do not skip any answer. Evaluate **all provided answers**, even if there are more than 5.
+- For each answer, provide feedback with these fields:
+    - question_id: The key of the answer in the user message. Do NOT repeat the question or the answer text.
+    - estimated_level (A1-C2): Justified by the CEFR-Aligned Question Analysis.
+    - scores: {grammar, vocabulary, fluency}: Assessed according to the Multi-component Competence model.
+    - mistakes: A list of specific errors (REQUIRED - even for advanced levels, identify subtle issues or areas for refinement)
+    - suggestions: A list of concrete corrections or better alternatives (REQUIRED - always provide constructive feedback)
+- Provide an overall level, average scores, and a short reason that explicitly references the framework.
+
+Return strictly in this format:
+{ "level": "A1-C2", "scores": {"grammar": 0.0, "vocabulary": 0.0, "fluency": 0.0}, "reason": "string", "feedback": [ """ + FEEDBACK_ITEM_FORMAT + """ ] }"""
+
+EVALUATION_USER_PROMPT = "--- User answers (JSON): {payload}"
+
+BATCH_EVALUATION_SYSTEM_PROMPT = JSON_ONLY + EVALUATION_FRAMEWORK + """Instructions: - The user message holds a JSON array of submissions. Each submission belongs to a DIFFERENT user. Evaluate every submission independently, guided strictly by the EVALUATION FRAMEWORK above.
+- For each submission, evaluate ALL of its answers. For each answer provide: question_id (its key in the submission; do NOT repeat the question or the answer text), estimated_level (A1-C2), scores {grammar, vocabulary, fluency}, mistakes (REQUIRED) and suggestions (REQUIRED).
+- For each submission, provide an overall level, average scores and a short reason that references the framework.
+- Return one result per submission, echoing its submission_id.
+
+Return strictly in this format:
+{ "results": [ { "submission_id": 0, "level": "A1-C2", "scores": {"grammar": 0.0, "vocabulary": 0.0, "fluency": 0.0}, "reason": "string", "feedback": [ """ + FEEDBACK_ITEM_FORMAT + """ ] } ] }"""
+
+BATCH_EVALUATION_USER_PROMPT = "--- Submissions (JSON array, one per user): {payload}"
+
+ANSWER_EVALUATION_SYSTEM_PROMPT = JSON_ONLY + """You are an expert English language evaluator. Evaluate the ONE answer to ONE question in the user message, grounded in the CEFR and principles of language acquisition.
+
+1. **Multi-component Competence Assessment** (Canale & Swain, 1980): score grammar (accuracy), vocabulary (lexical resource) and fluency (natural pace, automaticity) from 0.0 to 10.0.
+2. **CEFR-Aligned Question Analysis:** A1-A2 questions assess basic tenses on familiar topics; B1 narrative structure, connectors and opinions on concrete topics; B2 clear arguments on complex/abstract topics; C1-C2 figurative language, counterfactual arguments and nuanced precision. Use this to estimate estimated_level.
+3. **Formative Feedback Principle** (Schmidt's Noticing Hypothesis, 1990): ALWAYS list at least one mistake and one suggestion, even for C1/C2 (subtle improvements, style refinements, advanced constructions).
+
+Do NOT repeat the question or the answer text.
+
+Return strictly in this format:
+""" + ANSWER_FEEDBACK_FORMAT
+
+ANSWER_EVALUATION_USER_PROMPT = "--- Question and answer (JSON): {payload}"
+
+NEXT_QUESTIONS_SYSTEM_PROMPT = JSON_ONLY + """You are an expert English language evaluator. Based on the answers in the user message, estimate the user's overall CEFR level and generate 5 new English questions targeted at that level.
+Following Vygotsky's "Zone of Proximal Development", the questions must challenge the user appropriately to stimulate further learning.
+
+Return strictly in this format:
+{ "next_questions": [ "Question 1", "Question 2", "...", "Question 5" ] }"""
+
+NEXT_QUESTIONS_USER_PROMPT = "--- User answers (JSON): {payload}"
+
+QUESTION_GENERATION_SYSTEM_PROMPT = JSON_ONLY + """You are an expert English language evaluator writing open questions for a placement test grounded in the CEFR.
+The user message holds a target CEFR level, a topic and a number of questions. Write that many distinct English questions on the topic that elicit answers showing the target level:
+* A1-A2: basic tenses on familiar, concrete situations.
+* B1: narratives, connectors and opinions on concrete topics.
+* B2: clear arguments on complex or abstract topics.
+* C1-C2: figurative language, counterfactual arguments and nuanced, precise ideas.
+Following Vygotsky's "Zone of Proximal Development", the questions must challenge a learner at that level appropriately.
+
+Return strictly in this format:
+{ "next_questions": [ "Question 1", "Question 2", "..." ] }"""
+
+QUESTION_GENERATION_USER_PROMPT = "--- Target (JSON): {payload}"
+
+FINAL_EVALUATION_SYSTEM_PROMPT = """You are an expert English language evaluator acting as a final arbiter. Your task is to determine a definitive CEFR level and provide reasoning.
+
+--- SCIENTIFIC BASIS FOR FINAL JUDGMENT ---
+Your final decision must be a holistic synthesis based on the principles established in the first evaluation:
+1. CEFR Level Confirmation/Adjustment: Analyze the user's performance on these new, targeted questions.
+2. Trend Analysis (Communicative Competence): Compare performance in the second round against the first round's scores (grammar, vocabulary, fluency).
+
+The user message holds a compact summary of the initial evaluation (overall level, per-skill average scores, number of answers per level and the most frequent mistake categories) and the second round answers.
+
+--- FINAL INSTRUCTION ---
+Return your response in this EXACT JSON format:
+{
+  "final_level": "B2",
+  "reason": "Detailed explanation of why this level was chosen, referencing specific evidence from both evaluations"
+}
+
+Valid levels: 'A1', 'A2', 'B1', 'B2', 'C1', 'C2'.
+The reason should be comprehensive and reference specific linguistic evidence."""
+
+FINAL_EVALUATION_USER_PROMPT = """--- CONTEXT: INITIAL EVALUATION SUMMARY ---
+{previous_evaluation}
+
+--- DATA: SECOND ROUND ANSWERS ---
+{new_answers_with_questions}"""
+
+
+def to_prompt_json(data: Any) -> str:
+    """Serialize prompt data as compact JSON."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_messages(system_prompt: str, user_prompt: str) -> List[Dict[str, str]]:
+    """Chat messages with the static prefix first and the per-request data last."""
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def evaluation_messages(questions_dict: Dict[int, str], answers_dict: Dict[int, str]) -> List[Dict[str, str]]:
+    """Messages of a single-user evaluation."""
+    payload = to_prompt_json({"answers": answers_dict, "questions": questions_dict})
+    return build_messages(EVALUATION_SYSTEM_PROMPT, EVALUATION_USER_PROMPT.format(payload=payload))
+
+
+def batch_evaluation_messages(
+    submissions: List[Tuple[Dict[int, str], Dict[int, str]]]
+) -> List[Dict[str, str]]:
+    """Messages of a multi-user evaluation; submission ids are list positions."""
+    payload = to_prompt_json([
+        {"submission_id": index, "answers": answers_dict, "questions": questions_dict}
+        for index, (questions_dict, answers_dict) in enumerate(submissions)
+    ])
+    return build_messages(BATCH_EVALUATION_SYSTEM_PROMPT, BATCH_EVALUATION_USER_PROMPT.format(payload=payload))
+
+
+def answer_evaluation_messages(question: str, answer: str) -> List[Dict[str, str]]:
+    """Messages of a single-answer evaluation."""
+    payload = to_prompt_json({"question": question, "answer": answer})
+    return build_messages(ANSWER_EVALUATION_SYSTEM_PROMPT, ANSWER_EVALUATION_USER_PROMPT.format(payload=payload))
+
+
+def next_questions_messages(questions_dict: Dict[int, str], answers_dict: Dict[int, str]) -> List[Dict[str, str]]:
+    """Messages of a follow-up question generation."""
+    payload = to_prompt_json({"answers": answers_dict, "questions": questions_dict})
+    return build_messages(NEXT_QUESTIONS_SYSTEM_PROMPT, NEXT_QUESTIONS_USER_PROMPT.format(payload=payload))
+
+
+def question_generation_messages(level: str, topic: str, count: int) -> List[Dict[str, str]]:
+    """Messages generating question-pool entries for a level and topic."""
+    payload = to_prompt_json({"level": level, "topic": topic, "count": count})
+    return build_messages(QUESTION_GENERATION_SYSTEM_PROMPT, QUESTION_GENERATION_USER_PROMPT.format(payload=payload))
+
+
+def final_evaluation_messages(
+    previous_evaluation: Dict[str, Any],
+    new_answers: List[Dict[str, str]]
+) -> List[Dict[str, str]]:
+    """Messages of a final evaluation."""
+    return build_messages(FINAL_EVALUATION_SYSTEM_PROMPT, FINAL_EVALUATION_USER_PROMPT.format(
+        previous_evaluation=to_prompt_json(previous_evaluation),
+        new_answers_with_questions=to_prompt_json(new_answers)
+    ))
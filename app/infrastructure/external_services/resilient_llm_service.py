@@ -0,0 +1,203 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from app.application.evaluation.ports.llm_service_port import LLMServicePort
+from app.core.deadline import remaining_time
+from app.core.exceptions.evaluation_exceptions import TransientLLMException, LLMTimeoutException
+from app.core.metrics import metrics
+from app.infrastructure.external_services.llm_service_decorator import LLMServiceDecorator
+
+T = TypeVar("T")
+
+hedged_requests = metrics.counter(
+    "llm_hedged_requests_total",
+    "Duplicate LLM requests sent because the primary exceeded the latency percentile",
+    ("operation",)
+)
+hedge_wins = metrics.counter(
+    "llm_hedge_wins_total",
+    "Hedged LLM requests that answered before the primary",
+    ("operation",)
+)
+retries = metrics.counter(
+    "llm_retries_total",
+    "LLM calls retried after a transient error",
+    ("operation",)
+)
+deadline_exceeded = metrics.counter(
+    "llm_deadline_exceeded_total",
+    "LLM calls abandoned because the request deadline ran out",
+    ("operation",)
+)
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies per operation."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def observe(self, operation: str, seconds: float) -> None:
+        """Record the latency of a successful call."""
+        self._samples.setdefault(operation, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, operation: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """Latency percentile of an operation; None until enough samples exist."""
+        samples = self._samples.get(operation)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class ResilientLLMService(LLMServiceDecorator):
+    """
+    Hedges slow LLM calls and retries transient failures within the request deadline.
+
+    When a call runs longer than the recent latency percentile of its
+    operation, a duplicate request is sent and the first successful answer
+    wins. Transient errors are retried with full-jitter exponential backoff,
+    but only while the deadline (see app.core.deadline) leaves time for it.
+    Streams are forwarded untouched, since their events cannot be replayed.
+    """
+
+    def __init__(
+        self,
+        inner: LLMServicePort,
+        hedge_percentile: float = 95.0,
+        hedge_min_samples: int = 20,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        latency_tracker: Optional[LatencyTracker] = None
+    ):
+        super().__init__(inner)
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.latency_tracker = latency_tracker or LatencyTracker()
+
+    async def evaluate_answers(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> Dict[str, Any]:
+        """Evaluate answers with hedging and retries."""
+        return await self._call(
+            "evaluate_answers",
+            lambda: self.inner.evaluate_answers(questions_dict, answers_dict)
+        )
+
+    async def evaluate_answers_batch(
+        self,
+        submissions: List[Tuple[Dict[int, str], Dict[int, str]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Evaluate several submissions with hedging and retries."""
+        return await self._call(
+            "evaluate_answers_batch",
+            lambda: self.inner.evaluate_answers_batch(submissions)
+        )
+
+    async def evaluate_single_answer(self, question: str, answer: str) -> Dict[str, Any]:
+        """Evaluate a single answer with hedging and retries."""
+        return await self._call(
+            "evaluate_single_answer",
+            lambda: self.inner.evaluate_single_answer(question, answer)
+        )
+
+    async def generate_next_questions(
+        self,
+        questions_dict: Dict[int, str],
+        answers_dict: Dict[int, str]
+    ) -> List[str]:
+        """Generate next questions with hedging and retries."""
+        return await self._call(
+            "generate_next_questions",
+            lambda: self.inner.generate_next_questions(questions_dict, answers_dict)
+        )
+
+    async def generate_questions(self, level: str, topic: str, count: int) -> List[str]:
+        """Generate questions for a level and topic with hedging and retries."""
+        return await self._call(
+            "generate_questions",
+            lambda: self.inner.generate_questions(level, topic, count)
+        )
+
+    async def final_evaluation(
+        self,
+        previous_evaluation: Dict[str, Any],
+        new_answers: List[Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Perform the final evaluation with hedging and retries."""
+        return await self._call(
+            "final_evaluation",
+            lambda: self.inner.final_evaluation(previous_evaluation, new_answers)
+        )
+
+    async def _call(self, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a call, retrying transient errors while the deadline allows."""
+        attempt = 0
+        while True:
+            timeout = remaining_time()
+            if timeout is not None and timeout <= 0:
+                deadline_exceeded.inc(operation=operation)
+                raise LLMTimeoutException(f"Request deadline exceeded before {operation} could run")
+
+            try:
+                return await self._hedged(operation, call, timeout)
+            except TransientLLMException:
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+                timeout = remaining_time()
+                if attempt >= self.max_retries or (timeout is not None and delay >= timeout):
+                    raise
+                attempt += 1
+                retries.inc(operation=operation)
+                await asyncio.sleep(delay)
+
+    async def _hedged(self, operation: str, call: Callable[[], Awaitable[T]], timeout: Optional[float]) -> T:
+        """Run a call, sending a duplicate once it exceeds the latency percentile; first success wins."""
+        started = {asyncio.ensure_future(call()): time.monotonic()}
+        primary = next(iter(started))
+        hedge_delay = self.latency_tracker.percentile(operation, self.hedge_percentile, self.hedge_min_samples)
+
+        try:
+            if hedge_delay is not None and (timeout is None or hedge_delay < timeout):
+                await asyncio.wait({primary}, timeout=hedge_delay)
+                if not primary.done():
+                    hedged_requests.inc(operation=operation)
+                    started[asyncio.ensure_future(call())] = time.monotonic()
+
+            pending = set(started)
+            error: Optional[BaseException] = None
+            while pending:
+                wait_timeout = None if timeout is None else timeout - (time.monotonic() - started[primary])
+                if wait_timeout is not None and wait_timeout <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    self.latency_tracker.observe(operation, time.monotonic() - started[task])
+                    if task is not primary:
+                        hedge_wins.inc(operation=operation)
+                    return task.result()
+
+            if error is not None and not pending:
+                raise error
+            deadline_exceeded.inc(operation=operation)
+            raise LLMTimeoutException(f"{operation} did not complete before the request deadline")
+
+        finally:
+            for task in started:
+                if not task.done():
+                    task.cancel()
@@ -0,0 +1,145 @@
+"""Local repair of common defects in LLM JSON output, avoiding a new LLM round-trip."""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.exceptions.evaluation_exceptions import InvalidResponseException
+from app.domain.value_objects.cefr_level import CEFRLevel
+
+SCORE_FIELDS = ("grammar", "vocabulary", "fluency")
+
+_CODE_FENCE = re.compile(r"^\s*```[a-zA-Z]*\s*\n?|\n?\s*```\s*$")
+_LEVEL = re.compile(r"\b([ABC][12])\b")
+
+
+def parse_json_lenient(content: str) -> Tuple[Any, bool]:
+    """
+    Parse JSON, repairing code fences, surrounding prose and trailing commas.
+    Returns the value and whether a repair was needed.
+    """
+    try:
+        return json.loads(content), False
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    text = _CODE_FENCE.sub("", content or "").strip()
+    start = min((index for index in (text.find("{"), text.find("[")) if index >= 0), default=-1)
+    end = max(text.rfind("}"), text.rfind("]"))
+    if start < 0 or end < start:
+        raise InvalidResponseException(f"LLM returned no JSON: {content}")
+
+    text = remove_trailing_commas(text[start:end + 1])
+    try:
+        return json.loads(text), True
+    except json.JSONDecodeError as e:
+        raise InvalidResponseException(f"LLM returned invalid JSON that could not be repaired ({str(e)}): {content}")
+
+
+def remove_trailing_commas(text: str) -> str:
+    """Remove commas directly before a closing bracket, ignoring string contents."""
+    output: List[str] = []
+    in_string = False
+    escape = False
+
+    for char in text:
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "}]":
+            # Drop a pending trailing comma (and the whitespace after it)
+            index = len(output) - 1
+            while index >= 0 and output[index] in " \t\r\n":
+                index -= 1
+            if index >= 0 and output[index] == ",":
+                del output[index]
+        output.append(char)
+
+    return "".join(output)
+
+
+def unwrap_evaluation(result: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """Flatten the nested ``{"evaluation": {...}, "next_questions": [...]}`` layout."""
+    if not isinstance(result.get("evaluation"), dict):
+        return result, False
+
+    flattened = {key: value for key, value in result.items() if key != "evaluation"}
+    flattened.update(result["evaluation"])
+    return flattened, True
+
+
+def normalize_level(value: Any) -> Optional[str]:
+    """Normalize a CEFR level such as ``"b2"`` or ``"B2+"``; None if unrecognizable."""
+    if not isinstance(value, str):
+        return None
+    if CEFRLevel.is_valid_level(value):
+        return value
+    match = _LEVEL.search(value.upper())
+    return match.group(1) if match else None
+
+
+def normalize_question_id(value: Any) -> Optional[int]:
+    """Question id of a feedback item, also when returned as a string such as ``"3"``."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
+def repair_feedback_item(item: Any) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    Repair one feedback item: normalize the level and question id, coerce and
+    clamp scores, and default missing mistakes/suggestions. Returns None if the
+    level or any score is unrecoverable, since those cannot be invented locally.
+    """
+    if not isinstance(item, dict):
+        return None, False
+
+    repaired = dict(item)
+    if "question_id" in item:
+        repaired["question_id"] = normalize_question_id(item["question_id"])
+    level = normalize_level(item.get("estimated_level"))
+    if level is None:
+        return None, False
+    repaired["estimated_level"] = level
+
+    scores = item.get("scores")
+    if not isinstance(scores, dict):
+        return None, False
+    fixed_scores = {}
+    for field in SCORE_FIELDS:
+        try:
+            fixed_scores[field] = min(max(float(scores[field]), 0.0), 10.0)
+        except (KeyError, TypeError, ValueError):
+            return None, False
+    repaired["scores"] = fixed_scores
+
+    for field in ("mistakes", "suggestions"):
+        value = item.get(field)
+        if value is None:
+            repaired[field] = []
+        elif isinstance(value, str):
+            repaired[field] = [value]
+        elif isinstance(value, list):
+            repaired[field] = [str(entry) for entry in value]
+        else:
+            repaired[field] = []
+
+    return repaired, repaired != item
+
+
+def repair_next_questions(value: Any) -> Optional[List[str]]:
+    """Return a clean list of question strings, or None if absent."""
+    if isinstance(value, dict):
+        value = value.get("next_questions")
+    if not isinstance(value, list):
+        return None
+    questions = [str(question).strip() for question in value if str(question).strip()]
+    return questions or None
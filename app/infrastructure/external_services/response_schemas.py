@@ -0,0 +1,129 @@
+"""JSON schemas of the LLM outputs, derived from the response DTOs, for schema-enforced decoding."""
+
+import copy
+from typing import Any, Dict, Optional
+
+from app.application.evaluation.dtos.initial_evaluation_dto import (
+    InitialEvaluationResponseDTO,
+    FeedbackDTO
+)
+from app.application.evaluation.dtos.final_evaluation_dto import FinalEvaluationResponseDTO
+from app.domain.value_objects.cefr_level import CEFRLevel
+
+# Values of the LLM_RESPONSE_FORMAT setting
+JSON_SCHEMA_FORMAT = "json_schema"  # decoding constrained to the schema
+JSON_OBJECT_FORMAT = "json_object"  # decoding constrained to any JSON object
+TEXT_FORMAT = "text"                # unconstrained; relies on the prompt alone
+
+# Schema names
+INITIAL_EVALUATION_SCHEMA = "initial_evaluation"
+BATCH_EVALUATION_SCHEMA = "batch_evaluation"
+FEEDBACK_ITEM_SCHEMA = "feedback_item"
+NEXT_QUESTIONS_SCHEMA = "next_questions"
+FINAL_EVALUATION_SCHEMA = "final_evaluation"
+
+SCORES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "grammar": {"type": "number"},
+        "vocabulary": {"type": "number"},
+        "fluency": {"type": "number"},
+    },
+    "required": ["grammar", "vocabulary", "fluency"],
+    "additionalProperties": False,
+}
+
+LEVEL_FIELDS = ("level", "estimated_level", "final_level")
+
+
+def _tighten(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Make a pydantic schema usable in strict mode: close every object, give
+    ``scores`` its fixed keys and restrict level fields to the CEFR levels.
+    """
+    schema = copy.deepcopy(schema)
+
+    def visit(node: Any) -> None:
+        if isinstance(node, dict):
+            properties = node.get("properties")
+            if isinstance(properties, dict):
+                node["additionalProperties"] = False
+                for name in list(properties):
+                    if name == "scores":
+                        properties[name] = dict(SCORES_SCHEMA)
+                    elif name in LEVEL_FIELDS:
+                        properties[name] = {**properties[name], "enum": CEFRLevel.get_all_levels()}
+            for value in node.values():
+                visit(value)
+        elif isinstance(node, list):
+            for value in node:
+                visit(value)
+
+    visit(schema)
+    return schema
+
+
+def _feedback_item_schema(keyed: bool) -> Dict[str, Any]:
+    """
+    Feedback item as produced by the LLM: the question and answer texts are
+    known locally and not echoed; items of multi-answer outputs (``keyed``)
+    reference their answer by question_id instead.
+    """
+    schema = _tighten(FeedbackDTO.model_json_schema())
+    for name in ("question", "answer"):
+        del schema["properties"][name]
+    schema["required"] = [name for name in schema["required"] if name not in ("question", "answer")]
+    if keyed:
+        schema["properties"] = {"question_id": {"type": "integer"}, **schema["properties"]}
+        schema["required"] = ["question_id"] + schema["required"]
+    return schema
+
+
+def _initial_evaluation_schema() -> Dict[str, Any]:
+    """Initial evaluation as produced by the LLM: next questions come from the question pool."""
+    schema = _tighten(InitialEvaluationResponseDTO.model_json_schema())
+    schema["$defs"]["FeedbackDTO"] = _feedback_item_schema(keyed=True)
+    del schema["properties"]["next_questions"]
+    schema["required"] = [name for name in schema["required"] if name != "next_questions"]
+    return schema
+
+
+def _batch_evaluation_schema() -> Dict[str, Any]:
+    """Multi-user evaluation: the initial evaluation schema plus submission_id, per result."""
+    evaluation = _initial_evaluation_schema()
+    definitions = evaluation.pop("$defs", {})
+    evaluation["properties"]["submission_id"] = {"type": "integer"}
+    evaluation["required"] = ["submission_id"] + evaluation["required"]
+    return {
+        "$defs": definitions,
+        "type": "object",
+        "properties": {"results": {"type": "array", "items": evaluation}},
+        "required": ["results"],
+        "additionalProperties": False,
+    }
+
+
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    INITIAL_EVALUATION_SCHEMA: _initial_evaluation_schema(),
+    BATCH_EVALUATION_SCHEMA: _batch_evaluation_schema(),
+    FEEDBACK_ITEM_SCHEMA: _feedback_item_schema(keyed=False),
+    NEXT_QUESTIONS_SCHEMA: {
+        "type": "object",
+        "properties": {"next_questions": {"type": "array", "items": {"type": "string"}}},
+        "required": ["next_questions"],
+        "additionalProperties": False,
+    },
+    FINAL_EVALUATION_SCHEMA: _tighten(FinalEvaluationResponseDTO.model_json_schema()),
+}
+
+
+def build_response_format(mode: str, schema_name: str) -> Optional[Dict[str, Any]]:
+    """The ``response_format`` request parameter for a schema; None for plain text."""
+    if mode == JSON_SCHEMA_FORMAT:
+        return {
+            "type": "json_schema",
+            "json_schema": {"name": schema_name, "schema": SCHEMAS[schema_name], "strict": True},
+        }
+    if mode == JSON_OBJECT_FORMAT:
+        return {"type": "json_object"}
+    return None
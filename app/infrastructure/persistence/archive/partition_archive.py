@@ -0,0 +1,196 @@
+import asyncio
+import io
+import json
+import os
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+import zstandard
+
+from app.core.metrics import metrics
+
+archived_month_scans = metrics.counter(
+    "evaluation_archive_month_scans_total",
+    "Archived months decompressed to answer a query, by table",
+    ("table",)
+)
+
+# Columns stored as ISO strings and parsed back on read
+DATETIME_COLUMNS = ("created_at", "updated_at")
+
+
+@dataclass(frozen=True)
+class ArchiveManifest:
+    """Summary of an archived month, used to skip months that cannot match a query."""
+    rows: int
+    min_id: Optional[int]
+    max_id: Optional[int]
+    user_ids: FrozenSet[int]
+
+
+class ArchiveWriter:
+    """Streams the rows of one month to a temporary file; ``commit`` publishes it."""
+
+    def __init__(self, data_path: str, manifest_path: str, compression_level: int):
+        self.data_path = data_path
+        self.manifest_path = manifest_path
+        self.rows = 0
+        self._min_id: Optional[int] = None
+        self._max_id: Optional[int] = None
+        self._user_ids = set()
+        self._file = open(f"{data_path}.tmp", "wb")
+        self._writer = zstandard.ZstdCompressor(level=compression_level).stream_writer(self._file, closefd=False)
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Append one row as a JSON line."""
+        self._writer.write(json.dumps(row, default=_encode, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.rows += 1
+        self._user_ids.add(row["user_id"])
+        self._min_id = row["id"] if self._min_id is None else min(self._min_id, row["id"])
+        self._max_id = row["id"] if self._max_id is None else max(self._max_id, row["id"])
+
+    def commit(self) -> int:
+        """Flush to disk and publish the month (data first, then its manifest); return the row count."""
+        self._writer.close()  # ends the zstd frame
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(f"{self.data_path}.tmp", self.data_path)
+        manifest = {"rows": self.rows, "min_id": self._min_id, "max_id": self._max_id, "user_ids": sorted(self._user_ids)}
+        with open(f"{self.manifest_path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{self.manifest_path}.tmp", self.manifest_path)
+        return self.rows
+
+    def abort(self) -> None:
+        """Discard the partial file."""
+        self._writer.close()
+        self._file.close()
+        if os.path.exists(f"{self.data_path}.tmp"):
+            os.remove(f"{self.data_path}.tmp")
+
+
+class PartitionArchive:
+    """
+    Archive of detached monthly partitions on local disk: one zstd-compressed
+    JSONL file per table and month, next to a small JSON manifest (row count,
+    ID range and user IDs). A month is archived once its manifest exists;
+    archived files are immutable, so manifests are cached in process.
+    """
+
+    def __init__(self, directory: str, compression_level: int = 9):
+        self.directory = directory
+        self.compression_level = compression_level
+        self._manifests: Dict[str, ArchiveManifest] = {}
+
+    def months(self, table: str) -> List[date]:
+        """Archived months of a table, oldest first."""
+        pattern = re.compile(rf"^{re.escape(table)}_(\d{{4}})_(\d{{2}})\.manifest\.json$")
+        try:
+            names = os.listdir(os.path.join(self.directory, table))
+        except FileNotFoundError:
+            return []
+        matches = (pattern.match(name) for name in names)
+        return sorted(date(int(match[1]), int(match[2]), 1) for match in matches if match)
+
+    def writer(self, table: str, month: date) -> ArchiveWriter:
+        """Writer for the rows of a month, replacing any previous archive of it once committed."""
+        os.makedirs(os.path.join(self.directory, table), exist_ok=True)
+        self._manifests.pop(self._manifest_path(table, month), None)
+        return ArchiveWriter(self._data_path(table, month), self._manifest_path(table, month), self.compression_level)
+
+    def manifest(self, table: str, month: date) -> ArchiveManifest:
+        """Manifest of an archived month."""
+        path = self._manifest_path(table, month)
+        if path not in self._manifests:
+            with open(path, encoding="utf-8") as file:
+                content = json.load(file)
+            self._manifests[path] = ArchiveManifest(
+                rows=content["rows"],
+                min_id=content["min_id"],
+                max_id=content["max_id"],
+                user_ids=frozenset(content["user_ids"])
+            )
+        return self._manifests[path]
+
+    def read(self, table: str, month: date) -> Iterator[Dict[str, Any]]:
+        """Stream the rows of an archived month."""
+        with open(self._data_path(table, month), "rb") as file:
+            reader = zstandard.ZstdDecompressor().stream_reader(file, read_across_frames=True)
+            for line in io.TextIOWrapper(reader, encoding="utf-8"):
+                yield _decode(json.loads(line))
+
+    async def find_by_user_id(self, table: str, user_id: int) -> List[Dict[str, Any]]:
+        """Archived rows of a user, from the months whose manifest lists them."""
+        return await self._scan(
+            table,
+            lambda manifest: user_id in manifest.user_ids,
+            lambda row: row["user_id"] == user_id
+        )
+
+    async def find_history_page(
+        self, table: str, user_id: int, limit: int, before: Optional[Tuple[datetime, int]]
+    ) -> List[Dict[str, Any]]:
+        """Up to ``limit`` archived rows of a user older than the (created_at, id) position ``before``, newest first."""
+        def position(created_at: datetime, row_id: int) -> Tuple[datetime, int]:
+            # Compared as naive UTC, whether the column stores offsets or not
+            if created_at.tzinfo is not None:
+                created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+            return created_at, row_id
+
+        rows = [
+            row for row in await self.find_by_user_id(table, user_id)
+            if before is None or position(row["created_at"], row["id"]) < position(*before)
+        ]
+        rows.sort(key=lambda row: position(row["created_at"], row["id"]), reverse=True)
+        return rows[:limit]
+
+    async def find_by_id(self, table: str, row_id: int) -> Optional[Dict[str, Any]]:
+        """Archived row with the given ID, from the month whose ID range covers it."""
+        rows = await self._scan(
+            table,
+            lambda manifest: manifest.rows > 0 and manifest.min_id <= row_id <= manifest.max_id,
+            lambda row: row["id"] == row_id
+        )
+        return rows[0] if rows else None
+
+    async def _scan(
+        self,
+        table: str,
+        month_filter: Callable[[ArchiveManifest], bool],
+        row_filter: Callable[[Dict[str, Any]], bool]
+    ) -> List[Dict[str, Any]]:
+        """Matching rows of the matching months, decompressed off the event loop."""
+        def scan() -> List[Dict[str, Any]]:
+            rows = []
+            for month in self.months(table):
+                if not month_filter(self.manifest(table, month)):
+                    continue
+                archived_month_scans.inc(table=table)
+                rows.extend(row for row in self.read(table, month) if row_filter(row))
+            return rows
+
+        return await asyncio.to_thread(scan)
+
+    def _data_path(self, table: str, month: date) -> str:
+        return os.path.join(self.directory, table, f"{table}_{month:%Y_%m}.jsonl.zst")
+
+    def _manifest_path(self, table: str, month: date) -> str:
+        return os.path.join(self.directory, table, f"{table}_{month:%Y_%m}.manifest.json")
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot archive value of type {type(value).__name__}")
+
+
+def _decode(row: Dict[str, Any]) -> Dict[str, Any]:
+    for column in DATETIME_COLUMNS:
+        if row.get(column) is not None:
+            row[column] = datetime.fromisoformat(row[column])
+    return row
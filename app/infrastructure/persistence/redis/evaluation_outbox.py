@@ -0,0 +1,164 @@
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from app.application.evaluation.ports.evaluation_outbox_port import EvaluationOutboxPort, OutboxMessage
+from app.core.config.settings import settings
+from app.core.exceptions.evaluation_exceptions import CacheException
+
+
+class RedisEvaluationOutbox(EvaluationOutboxPort):
+    """
+    Redis Stream outbox read through a consumer group. Persisted messages are
+    acknowledged and deleted, so the stream only holds the backlog; messages
+    that cannot be persisted are moved to a capped dead-letter stream.
+    Durability across Redis restarts requires AOF persistence (appendonly).
+    """
+
+    STREAM_KEY = "evaluation_outbox"
+    GROUP = "evaluation_writers"
+    DEAD_LETTER_KEY = "evaluation_outbox:dead"
+    DEAD_LETTER_MAX_LENGTH = 10000
+
+    def __init__(self):
+        self.redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+        self._group_ready = False
+
+    async def publish(self, kind: str, payload: Dict[str, Any]) -> str:
+        """Append a message to the stream."""
+        try:
+            return await self.redis_client.xadd(self.STREAM_KEY, {"kind": kind, "payload": json.dumps(payload)})
+        except Exception as e:
+            raise CacheException(f"Failed to publish to evaluation outbox: {str(e)}")
+
+    async def read(self, consumer: str, count: int, block_ms: Optional[int]) -> List[OutboxMessage]:
+        """Read new messages for a consumer of the group."""
+        try:
+            await self._ensure_group()
+            response = await self.redis_client.xreadgroup(
+                self.GROUP, consumer, {self.STREAM_KEY: ">"}, count=count, block=block_ms
+            )
+            return [self._decode(message_id, fields) for _, entries in response or [] for message_id, fields in entries]
+        except ResponseError as e:
+            if "NOGROUP" in str(e):
+                # Stream or group deleted while running
+                self._group_ready = False
+            raise CacheException(f"Failed to read evaluation outbox: {str(e)}")
+        except Exception as e:
+            raise CacheException(f"Failed to read evaluation outbox: {str(e)}")
+
+    async def claim_stale(self, consumer: str, min_idle_ms: int, count: int) -> List[OutboxMessage]:
+        """Claim messages left unacknowledged (failed writes, crashed consumers)."""
+        try:
+            await self._ensure_group()
+            pending = await self.redis_client.xpending_range(
+                self.STREAM_KEY, self.GROUP, min="-", max="+", count=count, idle=min_idle_ms
+            )
+            if not pending:
+                return []
+
+            deliveries = {entry["message_id"]: entry["times_delivered"] for entry in pending}
+            claimed = await self.redis_client.xclaim(
+                self.STREAM_KEY, self.GROUP, consumer, min_idle_ms, list(deliveries)
+            )
+            messages = []
+            for message_id, fields in claimed:
+                if fields is None:
+                    # Deleted while pending
+                    await self.redis_client.xack(self.STREAM_KEY, self.GROUP, message_id)
+                    continue
+                message = self._decode(message_id, fields)
+                message.deliveries = deliveries.get(message_id, 0) + 1
+                messages.append(message)
+            return messages
+        except Exception as e:
+            raise CacheException(f"Failed to claim evaluation outbox messages: {str(e)}")
+
+    async def ack(self, messages: List[OutboxMessage]) -> None:
+        """Acknowledge and delete persisted messages."""
+        if not messages:
+            return
+        try:
+            ids = [message.id for message in messages]
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.xack(self.STREAM_KEY, self.GROUP, *ids)
+                pipe.xdel(self.STREAM_KEY, *ids)
+                await pipe.execute()
+        except Exception as e:
+            raise CacheException(f"Failed to acknowledge evaluation outbox messages: {str(e)}")
+
+    async def dead_letter(self, messages: List[OutboxMessage], reason: str) -> None:
+        """Copy messages to the dead-letter stream, then acknowledge and delete them."""
+        if not messages:
+            return
+        try:
+            ids = [message.id for message in messages]
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                for message in messages:
+                    pipe.xadd(
+                        self.DEAD_LETTER_KEY,
+                        {
+                            "message_id": message.id,
+                            "kind": message.kind or "",
+                            "payload": json.dumps(message.payload),
+                            "deliveries": message.deliveries,
+                            "reason": reason
+                        },
+                        maxlen=self.DEAD_LETTER_MAX_LENGTH,
+                        approximate=True
+                    )
+                pipe.xack(self.STREAM_KEY, self.GROUP, *ids)
+                pipe.xdel(self.STREAM_KEY, *ids)
+                await pipe.execute()
+        except Exception as e:
+            raise CacheException(f"Failed to dead-letter evaluation outbox messages: {str(e)}")
+
+    async def stats(self) -> Dict[str, float]:
+        """Backlog, pending count and age of the oldest message not yet persisted."""
+        try:
+            await self._ensure_group()
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.xlen(self.STREAM_KEY)
+                pipe.xpending(self.STREAM_KEY, self.GROUP)
+                pipe.xrange(self.STREAM_KEY, count=1)
+                backlog, pending, oldest = await pipe.execute()
+            oldest_age = time.time() - self._published_at(oldest[0][0]) if oldest else 0.0
+            return {"backlog": backlog, "pending": pending["pending"], "oldest_age_seconds": max(oldest_age, 0.0)}
+        except Exception as e:
+            raise CacheException(f"Failed to read evaluation outbox stats: {str(e)}")
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis_client.aclose()
+
+    async def _ensure_group(self) -> None:
+        """Create the stream and its consumer group if missing."""
+        if self._group_ready:
+            return
+        try:
+            await self.redis_client.xgroup_create(self.STREAM_KEY, self.GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def _decode(self, message_id: str, fields: Dict[str, str]) -> OutboxMessage:
+        """Outbox message of a stream entry; undecodable payloads are returned as None."""
+        kind, payload = self._parse(fields)
+        return OutboxMessage(id=message_id, kind=kind, payload=payload, published_at=self._published_at(message_id))
+
+    @staticmethod
+    def _parse(fields: Dict[str, str]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        try:
+            payload = json.loads(fields["payload"])
+            return fields.get("kind"), payload if isinstance(payload, dict) else None
+        except (KeyError, TypeError, json.JSONDecodeError):
+            return fields.get("kind"), None
+
+    @staticmethod
+    def _published_at(message_id: str) -> float:
+        """Publication time encoded in a stream entry ID (milliseconds-sequence)."""
+        return int(message_id.split("-", 1)[0]) / 1000
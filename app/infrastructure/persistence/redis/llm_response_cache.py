@@ -0,0 +1,121 @@
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+import redis.asyncio as redis
+
+from app.core.config.settings import settings
+from app.core.exceptions.evaluation_exceptions import CacheException
+from app.core.interfaces.cache_interface import CacheInterface
+from app.core.metrics import metrics
+
+cache_requests = metrics.counter(
+    "llm_cache_requests_total",
+    "LLM response cache lookups by result (hit/miss)",
+    ["result"]
+)
+cache_evictions = metrics.counter(
+    "llm_cache_evictions_total",
+    "LLM response cache entries evicted to respect the size bound"
+)
+
+
+def build_cache_key(request: Dict[str, Any]) -> str:
+    """Content-address an LLM request (model, prompt version, messages, parameters)."""
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RedisLLMResponseCache(CacheInterface):
+    """Redis cache of LLM responses with TTL and a size-bounded LRU index."""
+
+    KEY_PREFIX = "llm_cache:entry:"
+    LRU_KEY = "llm_cache:lru"
+
+    def __init__(
+        self,
+        ttl: int = settings.LLM_CACHE_TTL_SECONDS,
+        max_entries: int = settings.LLM_CACHE_MAX_ENTRIES
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached response and mark it as recently used."""
+        try:
+            value = await self.redis_client.get(self._entry_key(key))
+            if value is None:
+                # The entry expired (or was evicted): drop it from the LRU index too
+                await self.redis_client.zrem(self.LRU_KEY, key)
+                cache_requests.inc(result="miss")
+                return None
+
+            await self.redis_client.zadd(self.LRU_KEY, {key: time.time()})
+            cache_requests.inc(result="hit")
+            return value
+
+        except Exception as e:
+            raise CacheException(f"Failed to read LLM response cache: {str(e)}")
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
+        """
+        Store a response, evicting the least recently used entries beyond the
+        size bound. Index members unused for longer than the TTL belong to
+        expired entries and are pruned first, so they do not count.
+        """
+        try:
+            now = time.time()
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.set(self._entry_key(key), value, ex=ttl or self.ttl)
+                pipe.zadd(self.LRU_KEY, {key: now})
+                pipe.zremrangebyscore(self.LRU_KEY, "-inf", f"({now - self.ttl}")
+                pipe.zcard(self.LRU_KEY)
+                stored, _, _, size = await pipe.execute()
+
+            if size > self.max_entries:
+                evicted = await self.redis_client.zpopmin(self.LRU_KEY, size - self.max_entries)
+                if evicted:
+                    await self.redis_client.delete(*(self._entry_key(member) for member, _ in evicted))
+                    cache_evictions.inc(len(evicted))
+
+            return bool(stored)
+
+        except Exception as e:
+            raise CacheException(f"Failed to write LLM response cache: {str(e)}")
+
+    async def delete(self, key: str) -> bool:
+        """Delete a cached response."""
+        try:
+            await self.redis_client.zrem(self.LRU_KEY, key)
+            return bool(await self.redis_client.delete(self._entry_key(key)))
+        except Exception as e:
+            raise CacheException(f"Failed to delete LLM response cache entry: {str(e)}")
+
+    async def exists(self, key: str) -> bool:
+        """Check if a response is cached."""
+        try:
+            return bool(await self.redis_client.exists(self._entry_key(key)))
+        except Exception as e:
+            raise CacheException(f"Failed to check LLM response cache: {str(e)}")
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters of this process."""
+        hits = cache_requests.value(result="hit")
+        misses = cache_requests.value(result="miss")
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "evictions": cache_evictions.value()
+        }
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis_client.aclose()
+
+    def _entry_key(self, key: str) -> str:
+        """Generate Redis key for a cache entry."""
+        return f"{self.KEY_PREFIX}{key}"
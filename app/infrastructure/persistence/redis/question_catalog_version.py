@@ -0,0 +1,64 @@
+import asyncio
+from typing import Callable, Optional
+
+import redis.asyncio as redis
+
+from app.core.config.settings import settings
+from app.core.exceptions.evaluation_exceptions import CacheException
+
+
+class RedisQuestionCatalogVersion:
+    """
+    Version of the question catalog shared by every worker: a counter bumped on
+    each write, announced on a pub/sub channel so other workers drop their
+    cached catalog at once. The counter itself catches changes whose
+    announcement a worker missed (e.g. while reconnecting).
+    """
+
+    VERSION_KEY = "question_catalog:version"
+    CHANNEL = "question_catalog:changed"
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self):
+        self.redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+
+    async def current(self) -> Optional[str]:
+        """The current version; None until the catalog is first written."""
+        try:
+            return await self.redis_client.get(self.VERSION_KEY)
+        except Exception as e:
+            raise CacheException(f"Failed to read question catalog version: {str(e)}")
+
+    async def bump(self) -> str:
+        """Record a change of the catalog and announce it to the other workers."""
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.incr(self.VERSION_KEY)
+                pipe.publish(self.CHANNEL, "changed")
+                version, _ = await pipe.execute()
+            return str(version)
+        except Exception as e:
+            raise CacheException(f"Failed to bump question catalog version: {str(e)}")
+
+    async def listen(self, on_change: Callable[[], None]) -> None:
+        """Call ``on_change`` on every announced change until cancelled, resubscribing after errors."""
+        resubscribing = False
+        while True:
+            try:
+                async with self.redis_client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    if resubscribing:
+                        # Changes announced while disconnected were missed
+                        on_change()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            on_change()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                resubscribing = True
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis_client.aclose()
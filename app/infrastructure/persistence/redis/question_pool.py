@@ -0,0 +1,104 @@
+import random
+from typing import Dict, List
+
+import redis.asyncio as redis
+
+from app.application.evaluation.ports.question_pool_port import QuestionPoolPort
+from app.core.config.settings import settings
+from app.core.exceptions.evaluation_exceptions import CacheException
+
+
+class RedisQuestionPool(QuestionPoolPort):
+    """
+    Redis question pool: one set per (level, topic), a set of the topics of
+    each level, and one set per user of the questions already served to them
+    (expiring after ``served_ttl`` seconds).
+    """
+
+    KEY_PREFIX = "question_pool:"
+    # Candidates sampled per topic and requested question, to skip served ones
+    SAMPLE_FACTOR = 4
+
+    def __init__(self, served_ttl: int = settings.QUESTION_POOL_SERVED_TTL_SECONDS):
+        self.served_ttl = served_ttl
+        self.redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+
+    async def take(self, level: str, user_id: int, count: int) -> List[str]:
+        """Sample unseen questions of a level round-robin across its topics."""
+        try:
+            topics = list(await self.redis_client.smembers(self._topics_key(level)))
+            if not topics or count <= 0:
+                return []
+            random.shuffle(topics)
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for topic in topics:
+                    pipe.srandmember(self._topic_key(level, topic), count * self.SAMPLE_FACTOR)
+                samples = await pipe.execute()
+
+            candidates: List[str] = []
+            for position in range(max(len(sample) for sample in samples)):
+                for sample in samples:
+                    if position < len(sample) and sample[position] not in candidates:
+                        candidates.append(sample[position])
+            if not candidates:
+                return []
+
+            served_key = self._served_key(user_id)
+            served = await self.redis_client.smismember(served_key, candidates)
+            questions = [question for question, seen in zip(candidates, served) if not seen][:count]
+
+            if questions:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.sadd(served_key, *questions)
+                    pipe.expire(served_key, self.served_ttl)
+                    await pipe.execute()
+            return questions
+
+        except Exception as e:
+            raise CacheException(f"Failed to take questions from the pool: {str(e)}")
+
+    async def add(self, level: str, topic: str, questions: List[str]) -> int:
+        """Add questions to a level and topic."""
+        if not questions:
+            return 0
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.sadd(self._topic_key(level, topic), *questions)
+                pipe.sadd(self._topics_key(level), topic)
+                added, _ = await pipe.execute()
+            return int(added)
+
+        except Exception as e:
+            raise CacheException(f"Failed to add questions to the pool: {str(e)}")
+
+    async def sizes(self, level: str) -> Dict[str, int]:
+        """Number of questions of a level per topic."""
+        try:
+            topics = sorted(await self.redis_client.smembers(self._topics_key(level)))
+            if not topics:
+                return {}
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for topic in topics:
+                    pipe.scard(self._topic_key(level, topic))
+                counts = await pipe.execute()
+            return dict(zip(topics, counts))
+
+        except Exception as e:
+            raise CacheException(f"Failed to read question pool sizes: {str(e)}")
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis_client.aclose()
+
+    def _topics_key(self, level: str) -> str:
+        """Redis key of the set of topics of a level."""
+        return f"{self.KEY_PREFIX}{level}:topics"
+
+    def _topic_key(self, level: str, topic: str) -> str:
+        """Redis key of the questions of a level and topic."""
+        return f"{self.KEY_PREFIX}{level}:topic:{topic}"
+
+    def _served_key(self, user_id: int) -> str:
+        """Redis key of the questions already served to a user."""
+        return f"{self.KEY_PREFIX}served:{user_id}"
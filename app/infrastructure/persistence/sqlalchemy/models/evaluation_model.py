@@ -1,23 +1,44 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import JSON, Column, Integer, String, Float, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from app.core.config.database import Base
 
+# JSONB on PostgreSQL; plain JSON on SQLite (benchmarks)
+FeedbackList = JSONB().with_variant(JSON(), "sqlite")
+
 
 class EvaluationModel(Base):
     """SQLAlchemy model for evaluations."""
     __tablename__ = "evaluations"
+    # Range-partitioned by month on created_at (see create_tables.sql), so the
+    # database primary key and unique indexes also include created_at
+    __table_args__ = (
+        Index("uq_evaluations_dedup_key", "dedup_key", "created_at", unique=True),
+        # Serves lookups by user and keyset pages ordered by (created_at, id)
+        Index("idx_evaluations_user_history", "user_id", "created_at", "id"),
+        # jsonb_path_ops GIN indexes serve containment (@>) filters on the feedback lists
+        Index(
+            "idx_evaluations_mistakes", "mistakes",
+            postgresql_using="gin", postgresql_ops={"mistakes": "jsonb_path_ops"}
+        ),
+        Index(
+            "idx_evaluations_suggestions", "suggestions",
+            postgresql_using="gin", postgresql_ops={"suggestions": "jsonb_path_ops"}
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=False)
     question = Column(String, nullable=False)
     answer = Column(String, nullable=False)
     estimated_level = Column(String, nullable=False)
     grammar = Column(Float, nullable=False)
     vocabulary = Column(Float, nullable=False)
     fluency = Column(Float, nullable=False)
-    mistakes = Column(String, nullable=False)  # JSON string
-    suggestions = Column(String, nullable=False)  # JSON string
+    mistakes = Column(FeedbackList, nullable=False)  # JSON array of strings
+    suggestions = Column(FeedbackList, nullable=False)  # JSON array of strings
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    dedup_key = Column(String(64), nullable=True)  # idempotency key of write-behind persistence
 
     def __repr__(self) -> str:
-        return f"<EvaluationModel(id={self.id}, user_id={self.user_id}, level={self.estimated_level})>"
\ No newline at end of file
+        return f"<EvaluationModel(id={self.id}, user_id={self.user_id}, level={self.estimated_level})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.sql import func
 from app.core.config.database import Base
 
@@ -6,14 +6,22 @@ from app.core.config.database import Base
 class FinalEvaluationModel(Base):
     """SQLAlchemy model for final evaluations."""
     __tablename__ = "final_evaluations"
+    # Range-partitioned by month on created_at (see create_tables.sql), so the
+    # database primary key and unique indexes also include created_at
+    __table_args__ = (
+        Index("uq_final_evaluations_dedup_key", "dedup_key", "created_at", unique=True),
+        # Serves lookups by user and keyset pages ordered by (created_at, id)
+        Index("idx_final_evaluations_user_history", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=False)
     initial_level = Column(String(10), nullable=True)  # Nivel de la evaluación inicial
     final_level = Column(String(10), nullable=False)   # Nivel final determinado
     reason = Column(Text, nullable=True)               # Razón del LLM para el nivel final
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    dedup_key = Column(String(64), nullable=True)  # idempotency key of write-behind persistence
 
     def __repr__(self) -> str:
         return f"<FinalEvaluationModel(user_id={self.user_id}, final_level='{self.final_level}')>"
\ No newline at end of file
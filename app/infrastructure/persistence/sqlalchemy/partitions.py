@@ -0,0 +1,136 @@
+import re
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.persistence.archive.partition_archive import PartitionArchive
+from app.core.exceptions.evaluation_exceptions import RepositoryException
+
+# Tables range-partitioned by month on created_at
+PARTITIONED_TABLES = ("evaluations", "final_evaluations")
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month ``months`` after (or before) the given month."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def current_month() -> date:
+    """First day of the current month (UTC)."""
+    return datetime.utcnow().date().replace(day=1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition holding a month of a table."""
+    return f"{table}_{month:%Y_%m}"
+
+
+def partition_month(table: str, name: str) -> Optional[date]:
+    """Month held by a partition, or None for the default partition and foreign tables."""
+    match = re.fullmatch(rf"{re.escape(table)}_(\d{{4}})_(\d{{2}})", name)
+    return date(int(match[1]), int(match[2]), 1) if match else None
+
+
+def create_partition_sql(table: str, month: date, parent: Optional[str] = None) -> str:
+    """DDL of a month's partition; bounds are UTC midnights (the offset is ignored by TIMESTAMP columns)."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} PARTITION OF {parent or table} "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{add_months(month, 1).isoformat()} 00:00:00+00');"
+    )
+
+
+def create_default_partition_sql(table: str, parent: Optional[str] = None) -> str:
+    """DDL of the partition catching rows outside every monthly partition."""
+    return f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {parent or table} DEFAULT;"
+
+
+class PartitionMaintenance:
+    """
+    Creates upcoming monthly partitions and archives old ones.
+
+    A month is archived by streaming its partition to the archive, then, in
+    one transaction, detaching the partition, checking its row count against
+    the archived one and dropping it. A failure leaves the partition attached
+    and its archive is overwritten on the next run; rows present in both
+    places meanwhile are deduplicated by ID on read.
+    """
+
+    def __init__(self, engine: AsyncEngine, archive: Optional[PartitionArchive] = None):
+        self.engine = engine
+        self.archive = archive
+
+    async def partitions(self, table: str) -> List[Tuple[str, Optional[date]]]:
+        """Partitions of a table with their month (None for the default one), oldest first."""
+        async with self.engine.connect() as conn:
+            names = (await conn.execute(text("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = :table
+            """), {"table": table})).scalars().all()
+        partitions = [(name, partition_month(table, name)) for name in names]
+        return sorted(partitions, key=lambda partition: (partition[1] is None, partition[1] or date.min))
+
+    async def default_partition_rows(self, table: str) -> int:
+        """Rows that fell into the default partition (months missing a partition)."""
+        async with self.engine.connect() as conn:
+            return (await conn.execute(text(f"SELECT COUNT(*) FROM {table}_default"))).scalar()
+
+    async def ensure_partitions(self, table: str, months_ahead: int, today: Optional[date] = None) -> List[str]:
+        """Create the partitions of the current month and the next ``months_ahead``; return the new ones."""
+        month = (today or current_month()).replace(day=1)
+        existing = {name for name, _ in await self.partitions(table)}
+        created = []
+        async with self.engine.begin() as conn:
+            for offset in range(months_ahead + 1):
+                upcoming = add_months(month, offset)
+                if partition_name(table, upcoming) not in existing:
+                    await conn.execute(text(create_partition_sql(table, upcoming)))
+                    created.append(partition_name(table, upcoming))
+            if f"{table}_default" not in existing:
+                await conn.execute(text(create_default_partition_sql(table)))
+        return created
+
+    async def expired_partitions(
+        self, table: str, retention_months: int, today: Optional[date] = None
+    ) -> List[Tuple[str, date]]:
+        """Partitions of months before the last ``retention_months`` (counting the current one), oldest first."""
+        oldest_kept = add_months((today or current_month()).replace(day=1), 1 - retention_months)
+        return [
+            (name, month) for name, month in await self.partitions(table)
+            if month is not None and month < oldest_kept
+        ]
+
+    async def archive_partition(self, table: str, month: date) -> int:
+        """Archive a month's partition, then detach and drop it; return the archived row count."""
+        if self.archive is None:
+            raise RepositoryException("No partition archive configured")
+        name = partition_name(table, month)
+
+        writer = self.archive.writer(table, month)
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.stream(text(f"SELECT * FROM {name} ORDER BY id"))
+                async for rows in result.mappings().partitions(1000):
+                    for row in rows:
+                        writer.write(dict(row))
+        except Exception as e:
+            writer.abort()
+            raise RepositoryException(f"Failed to archive partition {name}: {str(e)}")
+        archived_rows = writer.commit()
+
+        try:
+            async with self.engine.begin() as conn:
+                # Detaching locks the table, so no row can reach the partition after the count
+                await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                rows = (await conn.execute(text(f"SELECT COUNT(*) FROM {name}"))).scalar()
+                if rows != archived_rows:
+                    raise RepositoryException(f"{rows} rows in the partition but {archived_rows} archived")
+                await conn.execute(text(f"DROP TABLE {name}"))
+        except Exception as e:
+            raise RepositoryException(f"Failed to drop archived partition {name}: {str(e)}")
+        return archived_rows
@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
+
+from app.domain.repositories.question_repository import QuestionRepositoryInterface
+from app.domain.entities.questions import Question
+from app.infrastructure.persistence.redis.question_catalog_version import RedisQuestionCatalogVersion
+from app.core.exceptions.evaluation_exceptions import CacheException, RepositoryException
+from app.core.metrics import metrics
+
+catalog_loads = metrics.counter(
+    "question_catalog_loads_total",
+    "Question catalog snapshots loaded from the database"
+)
+catalog_invalidations = metrics.counter(
+    "question_catalog_invalidations_total",
+    "Question catalog snapshots invalidated, by origin of the change",
+    ("origin",)
+)
+catalog_version_check_failures = metrics.counter(
+    "question_catalog_version_check_failures_total",
+    "Failed reads or bumps of the shared question catalog version"
+)
+catalog_size = metrics.gauge(
+    "question_catalog_size",
+    "Questions in the cached catalog snapshot"
+)
+
+
+@dataclass(frozen=True)
+class QuestionCatalogSnapshot:
+    """Immutable, id-indexed copy of the question catalog; entries must not be mutated."""
+    questions: Tuple[Question, ...]
+    by_id: Mapping[int, Question]
+    version: str                   # content hash, identical on every worker holding the same catalog
+    shared_version: Optional[str]  # shared version counter when the snapshot was loaded
+
+    @classmethod
+    def build(cls, questions: List[Question], shared_version: Optional[str]) -> "QuestionCatalogSnapshot":
+        """Snapshot of the given questions, ordered by ID."""
+        ordered = tuple(sorted(questions, key=lambda question: question.id))
+        content = json.dumps([[question.id, question.question] for question in ordered], ensure_ascii=False)
+        return cls(
+            questions=ordered,
+            by_id=MappingProxyType({question.id: question for question in ordered}),
+            version=hashlib.sha256(content.encode("utf-8")).hexdigest()[:16],
+            shared_version=shared_version
+        )
+
+
+class CachedQuestionRepository(QuestionRepositoryInterface):
+    """
+    Read-through, in-process cache of the question catalog in front of a
+    question repository.
+
+    Reads are served from an immutable snapshot, with no database round trip.
+    Writes go to the wrapped repository and bump the shared catalog version.
+    That version reaches other workers through pub/sub, so they drop their
+    snapshot; each worker also rechecks it every ``check_interval`` seconds
+    to catch missed announcements. Without a version store the snapshot only
+    follows this worker's writes.
+    """
+
+    def __init__(
+        self,
+        repository: QuestionRepositoryInterface,
+        version_store: Optional[RedisQuestionCatalogVersion] = None,
+        check_interval: float = 30.0
+    ):
+        self.repository = repository
+        self.version_store = version_store
+        self.check_interval = check_interval
+        self._snapshot: Optional[QuestionCatalogSnapshot] = None
+        self._checked_at = float("-inf")
+        self._stale = True
+        self._lock = asyncio.Lock()
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Load the catalog and follow changes made by other workers."""
+        if self.version_store is not None and self._listener is None:
+            self._listener = asyncio.ensure_future(self.version_store.listen(self._on_remote_change))
+        try:
+            await self.snapshot()
+        except RepositoryException:
+            # Loaded on first use instead
+            pass
+
+    async def aclose(self) -> None:
+        """Stop following changes and release the version store's connections."""
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        if self.version_store is not None:
+            await self.version_store.aclose()
+
+    async def snapshot(self) -> QuestionCatalogSnapshot:
+        """The current catalog snapshot, (re)loaded when invalidated or changed elsewhere."""
+        if self._is_fresh():
+            return self._snapshot
+
+        async with self._lock:
+            if self._is_fresh():
+                return self._snapshot
+            shared_version = await self._shared_version()
+            if not self._stale and self._snapshot.shared_version == shared_version:
+                self._checked_at = time.monotonic()
+                return self._snapshot
+            return await self._load(shared_version)
+
+    async def find_all_versioned(self) -> Tuple[Optional[str], List[Question]]:
+        """Get all questions with the content version of the same catalog snapshot."""
+        snapshot = await self.snapshot()
+        return snapshot.version, list(snapshot.questions)
+
+    async def find_all(self) -> List[Question]:
+        """Get all questions."""
+        return list((await self.snapshot()).questions)
+
+    async def find_by_id(self, question_id: int) -> Optional[Question]:
+        """Find question by ID."""
+        return (await self.snapshot()).by_id.get(question_id)
+
+    async def find_by_ids(self, question_ids: List[int]) -> List[Question]:
+        """Find questions by multiple IDs."""
+        by_id = (await self.snapshot()).by_id
+        return [by_id[question_id] for question_id in dict.fromkeys(question_ids) if question_id in by_id]
+
+    async def create(self, question: Question) -> Question:
+        """Create a new question."""
+        created = await self.repository.create(question)
+        await self._changed()
+        return created
+
+    async def update(self, question: Question) -> Question:
+        """Update existing question."""
+        updated = await self.repository.update(question)
+        await self._changed()
+        return updated
+
+    async def delete(self, question_id: int) -> bool:
+        """Delete question by ID."""
+        deleted = await self.repository.delete(question_id)
+        if deleted:
+            await self._changed()
+        return deleted
+
+    def _is_fresh(self) -> bool:
+        """Whether the snapshot can be served without checking the shared version."""
+        if self._stale or self._snapshot is None:
+            return False
+        return self.version_store is None or time.monotonic() - self._checked_at < self.check_interval
+
+    async def _load(self, shared_version: Optional[str]) -> QuestionCatalogSnapshot:
+        """Load a new snapshot; an invalidation arriving meanwhile keeps it stale."""
+        self._stale = False
+        try:
+            questions = await self.repository.find_all()
+        except Exception:
+            self._stale = True
+            raise
+        self._snapshot = QuestionCatalogSnapshot.build(questions, shared_version)
+        self._checked_at = time.monotonic()
+        catalog_loads.inc()
+        catalog_size.set(len(questions))
+        return self._snapshot
+
+    async def _shared_version(self) -> Optional[str]:
+        """The shared catalog version; on failure, the snapshot's (served until the next check)."""
+        if self.version_store is None:
+            return None
+        try:
+            return await self.version_store.current()
+        except CacheException:
+            catalog_version_check_failures.inc()
+            return self._snapshot.shared_version if self._snapshot is not None else None
+
+    async def _changed(self) -> None:
+        """Invalidate the local snapshot after a write and announce the change."""
+        self._invalidate("local")
+        if self.version_store is not None:
+            try:
+                await self.version_store.bump()
+            except CacheException:
+                catalog_version_check_failures.inc()
+
+    def _on_remote_change(self) -> None:
+        self._invalidate("remote")
+
+    def _invalidate(self, origin: str) -> None:
+        self._stale = True
+        catalog_invalidations.inc(origin=origin)
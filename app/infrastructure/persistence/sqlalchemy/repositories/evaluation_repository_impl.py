@@ -1,106 +1,272 @@
-import json
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any, AsyncContextManager, Dict, List, Optional, Tuple
+from sqlalchemy import desc, func, insert, select, true, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.repositories.evaluation_repository import EvaluationRepositoryInterface
 from app.domain.entities.evaluation import Evaluation
 from app.infrastructure.persistence.sqlalchemy.models.evaluation_model import EvaluationModel
-from app.core.config.database import get_db
+from app.infrastructure.persistence.archive.partition_archive import PartitionArchive
+from app.core.config.database import repository_session
 from app.core.exceptions.evaluation_exceptions import RepositoryException
 
 
 class SqlAlchemyEvaluationRepository(EvaluationRepositoryInterface):
-    """SQLAlchemy implementation of evaluation repository."""
+    """
+    SQLAlchemy implementation of evaluation repository. With an archive,
+    lookups by user and by ID also read the archived monthly partitions.
+    """
 
-    def __init__(self, db_session: Session = None):
+    TABLE = "evaluations"
+
+    def __init__(self, db_session: AsyncSession = None, archive: Optional[PartitionArchive] = None):
         self.db_session = db_session
+        self.archive = archive
 
-    def _get_session(self) -> Session:
-        """Get database session."""
-        if self.db_session:
-            return self.db_session
-        return next(get_db())
+    def _session(self) -> AsyncContextManager[AsyncSession]:
+        """Get database session: the injected one, else the request's unit of work, else a new one."""
+        return repository_session(self.db_session)
 
-    def save(self, evaluation: Evaluation) -> Evaluation:
+    async def save(self, evaluation: Evaluation) -> Evaluation:
         """Save evaluation to repository."""
         try:
-            session = self._get_session()
-            model = EvaluationModel(
-                user_id=evaluation.user_id,
-                question=evaluation.question,
-                answer=evaluation.answer,
-                estimated_level=evaluation.estimated_level,
-                grammar=evaluation.grammar,
-                vocabulary=evaluation.vocabulary,
-                fluency=evaluation.fluency,
-                mistakes=evaluation.mistakes,
-                suggestions=evaluation.suggestions
-            )
-            session.add(model)
-            session.commit()
-            session.refresh(model)
-            return self._model_to_entity(model)
+            async with self._session() as session:
+                model = self._entity_to_model(evaluation)
+                session.add(model)
+                await session.commit()
+                await session.refresh(model)
+                return self._model_to_entity(model)
         except Exception as e:
-            session.rollback()
             raise RepositoryException(f"Failed to save evaluation: {str(e)}")
 
-    def find_by_user_id(self, user_id: int) -> List[Evaluation]:
-        """Find evaluations by user ID."""
+    async def save_many(self, evaluations: List[Evaluation]) -> List[Evaluation]:
+        """
+        Save several evaluations in a single transaction with one multi-row
+        INSERT ... RETURNING, instead of a round trip and refresh per row.
+        """
+        if not evaluations:
+            return []
+
+        try:
+            async with self._session() as session:
+                result = await session.execute(
+                    insert(EvaluationModel).returning(
+                        EvaluationModel.id,
+                        EvaluationModel.created_at,
+                        sort_by_parameter_order=True
+                    ),
+                    [self._entity_to_row(evaluation) for evaluation in evaluations]
+                )
+                saved = [
+                    evaluation.model_copy(update={"id": row.id, "created_at": row.created_at})
+                    for evaluation, row in zip(evaluations, result.all())
+                ]
+                await session.commit()
+                return saved
+        except Exception as e:
+            raise RepositoryException(f"Failed to save evaluations: {str(e)}")
+
+    async def save_many_deduplicated(self, evaluations: List[Evaluation]) -> int:
+        """
+        Save several evaluations in one INSERT ... ON CONFLICT (dedup_key,
+        created_at) DO NOTHING, so writes retried with the same dedup keys and
+        creation times are not duplicated.
+        """
+        if not evaluations:
+            return 0
+
         try:
-            session = self._get_session()
-            models = session.query(EvaluationModel).filter(EvaluationModel.user_id == user_id).all()
-            return [self._model_to_entity(model) for model in models]
+            async with self._session() as session:
+                result = await session.execute(
+                    pg_insert(EvaluationModel)
+                    .on_conflict_do_nothing(index_elements=[EvaluationModel.dedup_key, EvaluationModel.created_at])
+                    .returning(EvaluationModel.id),
+                    [self._entity_to_row(evaluation) for evaluation in evaluations]
+                )
+                saved = len(result.all())
+                await session.commit()
+                return saved
+        except Exception as e:
+            raise RepositoryException(f"Failed to save evaluations: {str(e)}")
+
+    async def find_by_user_id(self, user_id: int) -> List[Evaluation]:
+        """Find evaluations by user ID, including archived months."""
+        try:
+            async with self._session() as session:
+                models = (await session.scalars(
+                    select(EvaluationModel).where(EvaluationModel.user_id == user_id)
+                )).all()
+                evaluations = [self._model_to_entity(model) for model in models]
+            if self.archive is not None:
+                # A month being archived can briefly be in both places
+                stored_ids = {evaluation.id for evaluation in evaluations}
+                evaluations += [
+                    Evaluation(**row) for row in await self.archive.find_by_user_id(self.TABLE, user_id)
+                    if row["id"] not in stored_ids
+                ]
+            return evaluations
         except Exception as e:
             raise RepositoryException(f"Failed to find evaluations for user {user_id}: {str(e)}")
 
-    def find_by_id(self, evaluation_id: int) -> Optional[Evaluation]:
-        """Find evaluation by ID."""
+    async def find_history_page(
+        self, user_id: int, limit: int, before: Optional[Tuple[datetime, int]], fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Keyset page of a user's evaluations, newest first: one range scan of the
+        (user_id, created_at, id) index reading only the requested columns.
+        Archived months, all older than the stored ones, follow once these run out.
+        """
+        try:
+            query = (
+                select(*[getattr(EvaluationModel, name) for name in fields])
+                .where(EvaluationModel.user_id == user_id)
+            )
+            if before is not None:
+                query = query.where(tuple_(EvaluationModel.created_at, EvaluationModel.id) < tuple_(*before))
+            query = query.order_by(EvaluationModel.created_at.desc(), EvaluationModel.id.desc()).limit(limit)
+            async with self._session() as session:
+                rows = [dict(row) for row in (await session.execute(query)).mappings().all()]
+
+            if self.archive is not None and len(rows) < limit:
+                position = (rows[-1]["created_at"], rows[-1]["id"]) if rows else before
+                archived = await self.archive.find_history_page(self.TABLE, user_id, limit - len(rows), position)
+                rows += [{name: row.get(name) for name in fields} for row in archived]
+            return rows
+        except Exception as e:
+            raise RepositoryException(f"Failed to find evaluation history for user {user_id}: {str(e)}")
+
+    async def find_by_id(self, evaluation_id: int) -> Optional[Evaluation]:
+        """Find evaluation by ID, falling back to archived months."""
         try:
-            session = self._get_session()
-            model = session.query(EvaluationModel).filter(EvaluationModel.id == evaluation_id).first()
-            return self._model_to_entity(model) if model else None
+            async with self._session() as session:
+                model = await session.get(EvaluationModel, evaluation_id)
+                if model:
+                    return self._model_to_entity(model)
+            if self.archive is not None:
+                row = await self.archive.find_by_id(self.TABLE, evaluation_id)
+                return Evaluation(**row) if row else None
+            return None
         except Exception as e:
             raise RepositoryException(f"Failed to find evaluation by ID {evaluation_id}: {str(e)}")
 
-    def update(self, evaluation: Evaluation) -> Evaluation:
+    async def find_by_mistake(
+        self, mistake: str, estimated_level: Optional[str] = None, limit: int = 100
+    ) -> List[Evaluation]:
+        """
+        Find the latest evaluations whose mistakes contain the given text
+        (JSONB containment, served by the GIN index), optionally at one level.
+        """
+        try:
+            async with self._session() as session:
+                query = select(EvaluationModel).where(EvaluationModel.mistakes.contains([mistake]))
+                if estimated_level is not None:
+                    query = query.where(EvaluationModel.estimated_level == estimated_level)
+                models = (await session.scalars(
+                    query.order_by(EvaluationModel.created_at.desc(), EvaluationModel.id.desc()).limit(limit)
+                )).all()
+                return [self._model_to_entity(model) for model in models]
+        except Exception as e:
+            raise RepositoryException(f"Failed to find evaluations by mistake: {str(e)}")
+
+    async def most_common_mistakes(
+        self, estimated_level: Optional[str] = None, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Most frequent mistakes with their occurrences, counted in the database."""
+        try:
+            return await self._most_common(EvaluationModel.mistakes, estimated_level, limit)
+        except Exception as e:
+            raise RepositoryException(f"Failed to aggregate mistakes: {str(e)}")
+
+    async def most_common_suggestions(
+        self, estimated_level: Optional[str] = None, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Most frequent suggestions with their occurrences, counted in the database."""
+        try:
+            return await self._most_common(EvaluationModel.suggestions, estimated_level, limit)
+        except Exception as e:
+            raise RepositoryException(f"Failed to aggregate suggestions: {str(e)}")
+
+    async def _most_common(self, column, estimated_level: Optional[str], limit: int) -> List[Tuple[str, int]]:
+        """Unnest a JSONB feedback list and count its items, most frequent first."""
+        items = func.jsonb_array_elements_text(column).table_valued("value").render_derived(name="item")
+        occurrences = func.count().label("occurrences")
+        query = select(items.c.value, occurrences).select_from(EvaluationModel).join(items, true())
+        if estimated_level is not None:
+            query = query.where(EvaluationModel.estimated_level == estimated_level)
+        query = query.group_by(items.c.value).order_by(desc(occurrences), items.c.value).limit(limit)
+        async with self._session() as session:
+            return [(row.value, row.occurrences) for row in (await session.execute(query)).all()]
+
+    async def update(self, evaluation: Evaluation) -> Evaluation:
         """Update existing evaluation."""
         try:
-            session = self._get_session()
-            model = session.query(EvaluationModel).filter(EvaluationModel.id == evaluation.id).first()
-            if not model:
-                raise RepositoryException(f"Evaluation with ID {evaluation.id} not found")
-            
-            model.question = evaluation.question
-            model.answer = evaluation.answer
-            model.estimated_level = evaluation.estimated_level
-            model.grammar = evaluation.grammar
-            model.vocabulary = evaluation.vocabulary
-            model.fluency = evaluation.fluency
-            model.mistakes = evaluation.mistakes
-            model.suggestions = evaluation.suggestions
-            
-            session.commit()
-            session.refresh(model)
-            return self._model_to_entity(model)
+            async with self._session() as session:
+                model = await session.get(EvaluationModel, evaluation.id)
+                if not model:
+                    raise RepositoryException(f"Evaluation with ID {evaluation.id} not found")
+
+                model.question = evaluation.question
+                model.answer = evaluation.answer
+                model.estimated_level = evaluation.estimated_level
+                model.grammar = evaluation.grammar
+                model.vocabulary = evaluation.vocabulary
+                model.fluency = evaluation.fluency
+                model.mistakes = evaluation.mistakes
+                model.suggestions = evaluation.suggestions
+
+                await session.commit()
+                await session.refresh(model)
+                return self._model_to_entity(model)
         except Exception as e:
-            session.rollback()
             raise RepositoryException(f"Failed to update evaluation: {str(e)}")
 
-    def delete(self, evaluation_id: int) -> bool:
+    async def delete(self, evaluation_id: int) -> bool:
         """Delete evaluation by ID."""
         try:
-            session = self._get_session()
-            model = session.query(EvaluationModel).filter(EvaluationModel.id == evaluation_id).first()
-            if not model:
-                return False
-            
-            session.delete(model)
-            session.commit()
-            return True
+            async with self._session() as session:
+                model = await session.get(EvaluationModel, evaluation_id)
+                if not model:
+                    return False
+
+                await session.delete(model)
+                await session.commit()
+                return True
         except Exception as e:
-            session.rollback()
             raise RepositoryException(f"Failed to delete evaluation: {str(e)}")
 
+    def _entity_to_model(self, evaluation: Evaluation) -> EvaluationModel:
+        """Convert entity to a new model."""
+        return EvaluationModel(
+            user_id=evaluation.user_id,
+            question=evaluation.question,
+            answer=evaluation.answer,
+            estimated_level=evaluation.estimated_level,
+            grammar=evaluation.grammar,
+            vocabulary=evaluation.vocabulary,
+            fluency=evaluation.fluency,
+            mistakes=evaluation.mistakes,
+            suggestions=evaluation.suggestions,
+            dedup_key=evaluation.dedup_key
+        )
+
+    def _entity_to_row(self, evaluation: Evaluation) -> Dict[str, Any]:
+        """Convert entity to the column values of a bulk insert."""
+        return {
+            "user_id": evaluation.user_id,
+            "question": evaluation.question,
+            "answer": evaluation.answer,
+            "estimated_level": evaluation.estimated_level,
+            "grammar": evaluation.grammar,
+            "vocabulary": evaluation.vocabulary,
+            "fluency": evaluation.fluency,
+            "mistakes": evaluation.mistakes,
+            "suggestions": evaluation.suggestions,
+            # Part of the partition key and of the dedup index, so set before inserting
+            "created_at": evaluation.created_at or datetime.utcnow(),
+            "dedup_key": evaluation.dedup_key
+        }
+
     def _model_to_entity(self, model: EvaluationModel) -> Evaluation:
         """Convert model to entity."""
         return Evaluation(
@@ -114,5 +280,6 @@ class SqlAlchemyEvaluationRepository(EvaluationRepositoryInterface):
             fluency=model.fluency,
             mistakes=model.mistakes,
             suggestions=model.suggestions,
-            created_at=model.created_at
+            created_at=model.created_at,
+            dedup_key=model.dedup_key
         )
\ No newline at end of file
@@ -1,116 +1,171 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+import dataclasses
+from datetime import datetime, timezone
+from typing import Any, AsyncContextManager, Dict, Optional, List, Tuple
+from sqlalchemy import desc, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.repositories.final_evaluation_repository import FinalEvaluationRepositoryInterface
 from app.domain.entities.final_evaluation import FinalEvaluation
 from app.infrastructure.persistence.sqlalchemy.models.final_evaluation_model import FinalEvaluationModel
-from app.core.database import get_db
+from app.infrastructure.persistence.archive.partition_archive import PartitionArchive
+from app.core.config.database import repository_session
 
 
 class SqlAlchemyFinalEvaluationRepository(FinalEvaluationRepositoryInterface):
-    """SQLAlchemy implementation of final evaluation repository."""
+    """
+    SQLAlchemy implementation of final evaluation repository. With an archive,
+    lookups by user and by ID also read the archived monthly partitions.
+    """
 
-    def __init__(self):
-        self.db_session = next(get_db())
+    TABLE = "final_evaluations"
 
-    def save(self, final_evaluation: FinalEvaluation) -> FinalEvaluation:
+    def __init__(self, db_session: AsyncSession = None, archive: Optional[PartitionArchive] = None):
+        self.db_session = db_session
+        self.archive = archive
+
+    def _session(self) -> AsyncContextManager[AsyncSession]:
+        """Get database session: the injected one, else the request's unit of work, else a new one."""
+        return repository_session(self.db_session)
+
+    async def save(self, final_evaluation: FinalEvaluation) -> FinalEvaluation:
         """Save a final evaluation."""
-        try:
+        async with self._session() as session:
             # Convert domain entity to model
             model = FinalEvaluationModel(
                 user_id=final_evaluation.user_id,
                 initial_level=final_evaluation.initial_level,
                 final_level=final_evaluation.final_level,
-                reason=final_evaluation.reason
+                reason=final_evaluation.reason,
+                dedup_key=final_evaluation.dedup_key
             )
-            
-            self.db_session.add(model)
-            self.db_session.commit()
-            self.db_session.refresh(model)
-            
+
+            session.add(model)
+            await session.commit()
+            # created_at is set by the database
+            await session.refresh(model)
+
             # Convert back to domain entity
-            return FinalEvaluation(
-                id=model.id,
-                user_id=model.user_id,
-                initial_level=model.initial_level,
-                final_level=model.final_level,
-                reason=model.reason,
-                created_at=model.created_at,
-                updated_at=model.updated_at
+            return self._model_to_entity(model)
+
+    async def save_many_deduplicated(self, final_evaluations: List[FinalEvaluation]) -> int:
+        """
+        Save several final evaluations in one INSERT ... ON CONFLICT (dedup_key,
+        created_at) DO NOTHING, so writes retried with the same dedup keys and
+        creation times are not duplicated.
+        """
+        if not final_evaluations:
+            return 0
+
+        async with self._session() as session:
+            result = await session.execute(
+                pg_insert(FinalEvaluationModel)
+                .on_conflict_do_nothing(
+                    index_elements=[FinalEvaluationModel.dedup_key, FinalEvaluationModel.created_at]
+                )
+                .returning(FinalEvaluationModel.id),
+                [
+                    {
+                        "user_id": final_evaluation.user_id,
+                        "initial_level": final_evaluation.initial_level,
+                        "final_level": final_evaluation.final_level,
+                        "reason": final_evaluation.reason,
+                        # Part of the partition key and of the dedup index, so set before inserting
+                        "created_at": final_evaluation.created_at or datetime.now(timezone.utc),
+                        "dedup_key": final_evaluation.dedup_key
+                    }
+                    for final_evaluation in final_evaluations
+                ]
             )
-        except Exception as e:
-            self.db_session.rollback()
-            raise e
-        finally:
-            self.db_session.close()
-
-    def find_by_user_id(self, user_id: int) -> Optional[FinalEvaluation]:
-        """Find the most recent final evaluation by user ID."""
-        try:
-            model = (
-                self.db_session.query(FinalEvaluationModel)
-                .filter(FinalEvaluationModel.user_id == user_id)
+            saved = len(result.all())
+            await session.commit()
+            return saved
+
+    async def find_by_user_id(self, user_id: int) -> Optional[FinalEvaluation]:
+        """Find the most recent final evaluation by user ID; archived months are read only if none is stored."""
+        async with self._session() as session:
+            model = (await session.scalars(
+                select(FinalEvaluationModel)
+                .where(FinalEvaluationModel.user_id == user_id)
                 .order_by(desc(FinalEvaluationModel.created_at))
-                .first()
-            )
-            
+                .limit(1)
+            )).first()
             if model:
-                return FinalEvaluation(
-                    id=model.id,
-                    user_id=model.user_id,
-                    initial_level=model.initial_level,
-                    final_level=model.final_level,
-                    reason=model.reason,
-                    created_at=model.created_at,
-                    updated_at=model.updated_at
-                )
-            return None
-        finally:
-            self.db_session.close()
-
-    def find_all_by_user_id(self, user_id: int) -> List[FinalEvaluation]:
-        """Find all final evaluations by user ID."""
-        try:
-            models = (
-                self.db_session.query(FinalEvaluationModel)
-                .filter(FinalEvaluationModel.user_id == user_id)
+                return self._model_to_entity(model)
+        archived = await self._find_archived_by_user_id(user_id, set())
+        return archived[0] if archived else None
+
+    async def find_all_by_user_id(self, user_id: int) -> List[FinalEvaluation]:
+        """Find all final evaluations by user ID, including archived months."""
+        async with self._session() as session:
+            models = (await session.scalars(
+                select(FinalEvaluationModel)
+                .where(FinalEvaluationModel.user_id == user_id)
                 .order_by(desc(FinalEvaluationModel.created_at))
-                .all()
-            )
-            
-            return [
-                FinalEvaluation(
-                    id=model.id,
-                    user_id=model.user_id,
-                    initial_level=model.initial_level,
-                    final_level=model.final_level,
-                    reason=model.reason,
-                    created_at=model.created_at,
-                    updated_at=model.updated_at
-                )
-                for model in models
-            ]
-        finally:
-            self.db_session.close()
-
-    def find_by_id(self, evaluation_id: int) -> Optional[FinalEvaluation]:
-        """Find final evaluation by ID."""
-        try:
-            model = self.db_session.query(FinalEvaluationModel).filter(
-                FinalEvaluationModel.id == evaluation_id
-            ).first()
-            
+            )).all()
+            final_evaluations = [self._model_to_entity(model) for model in models]
+        # Archived months are older than every stored one
+        return final_evaluations + await self._find_archived_by_user_id(
+            user_id, {final_evaluation.id for final_evaluation in final_evaluations}
+        )
+
+    async def find_history_page(
+        self, user_id: int, limit: int, before: Optional[Tuple[datetime, int]], fields: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Keyset page of a user's final evaluations, newest first: one range scan of the
+        (user_id, created_at, id) index reading only the requested columns.
+        Archived months, all older than the stored ones, follow once these run out.
+        """
+        query = (
+            select(*[getattr(FinalEvaluationModel, name) for name in fields])
+            .where(FinalEvaluationModel.user_id == user_id)
+        )
+        if before is not None:
+            query = query.where(tuple_(FinalEvaluationModel.created_at, FinalEvaluationModel.id) < tuple_(*before))
+        query = query.order_by(desc(FinalEvaluationModel.created_at), desc(FinalEvaluationModel.id)).limit(limit)
+        async with self._session() as session:
+            rows = [dict(row) for row in (await session.execute(query)).mappings().all()]
+
+        if self.archive is not None and len(rows) < limit:
+            position = (rows[-1]["created_at"], rows[-1]["id"]) if rows else before
+            archived = await self.archive.find_history_page(self.TABLE, user_id, limit - len(rows), position)
+            rows += [{name: row.get(name) for name in fields} for row in archived]
+        return rows
+
+    async def find_by_id(self, evaluation_id: int) -> Optional[FinalEvaluation]:
+        """Find final evaluation by ID, falling back to archived months."""
+        async with self._session() as session:
+            model = await session.get(FinalEvaluationModel, evaluation_id)
             if model:
-                return FinalEvaluation(
-                    id=model.id,
-                    user_id=model.user_id,
-                    initial_level=model.initial_level,
-                    final_level=model.final_level,
-                    reason=model.reason,
-                    created_at=model.created_at,
-                    updated_at=model.updated_at
-                )
+                return self._model_to_entity(model)
+        if self.archive is None:
             return None
-        finally:
-            self.db_session.close()
\ No newline at end of file
+        row = await self.archive.find_by_id(self.TABLE, evaluation_id)
+        return self._row_to_entity(row) if row else None
+
+    async def _find_archived_by_user_id(self, user_id: int, stored_ids: set) -> List[FinalEvaluation]:
+        """Archived final evaluations of a user, newest first, skipping the stored ones."""
+        if self.archive is None:
+            return []
+        # A month being archived can briefly be in both places
+        rows = [row for row in await self.archive.find_by_user_id(self.TABLE, user_id) if row["id"] not in stored_ids]
+        rows.sort(key=lambda row: row["created_at"], reverse=True)
+        return [self._row_to_entity(row) for row in rows]
+
+    def _row_to_entity(self, row: Dict[str, Any]) -> FinalEvaluation:
+        """Convert an archived row to entity."""
+        return FinalEvaluation(**{field.name: row.get(field.name) for field in dataclasses.fields(FinalEvaluation)})
+
+    def _model_to_entity(self, model: FinalEvaluationModel) -> FinalEvaluation:
+        """Convert model to entity."""
+        return FinalEvaluation(
+            id=model.id,
+            user_id=model.user_id,
+            initial_level=model.initial_level,
+            final_level=model.final_level,
+            reason=model.reason,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            dedup_key=model.dedup_key
+        )
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from app.application.evaluation.use_cases.initial_evaluation_use_case import InitialEvaluationUseCase
     from app.application.evaluation.use_cases.final_evaluation_use_case import FinalEvaluationUseCase
+    from app.application.evaluation.use_cases.evaluation_history_use_case import EvaluationHistoryUseCase
     from app.application.questions.use_cases.list_questions_use_case import ListQuestionsUseCase
 
 # Contenedor global que se inicializará desde main.py
@@ -27,6 +28,13 @@ def get_final_evaluation_use_case() -> "FinalEvaluationUseCase":
     return _container.final_evaluation_use_case()
 
 
+def get_evaluation_history_use_case() -> "EvaluationHistoryUseCase":
+    """Dependency injection for evaluation history use case."""
+    if _container is None:
+        raise RuntimeError("Container not initialized")
+    return _container.evaluation_history_use_case()
+
+
 def get_list_questions_use_case() -> "ListQuestionsUseCase":
     """Dependency injection for list questions use case."""
     if _container is None:
@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+import math
+from typing import Any, AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from app.application.evaluation.use_cases.initial_evaluation_use_case import InitialEvaluationUseCase
 from app.application.evaluation.use_cases.final_evaluation_use_case import FinalEvaluationUseCase
+from app.application.evaluation.use_cases.evaluation_history_use_case import EvaluationHistoryUseCase
 from app.application.evaluation.dtos.initial_evaluation_dto import (
     InitialEvaluationRequestDTO,
     InitialEvaluationResponseDTO
@@ -10,20 +16,66 @@ from app.application.evaluation.dtos.final_evaluation_dto import (
     FinalEvaluationRequestDTO,
     FinalEvaluationResponseDTO
 )
-from app.presentation.api.dependencies import get_initial_evaluation_use_case, get_final_evaluation_use_case
+from app.application.evaluation.dtos.evaluation_history_dto import EvaluationHistoryPageDTO
+from app.presentation.api.dependencies import (
+    get_initial_evaluation_use_case,
+    get_final_evaluation_use_case,
+    get_evaluation_history_use_case
+)
+from app.core.config.settings import settings
 from app.core.exceptions.evaluation_exceptions import (
     EvaluationException,
     EvaluationNotFoundException,
     LLMException,
-    InvalidResponseException
+    LLMUnavailableException,
+    InvalidResponseException,
+    RepositoryException
 )
 
 router = APIRouter(tags=["evaluation"])
 
 
+def _unavailable(e: LLMUnavailableException) -> HTTPException:
+    """503 telling the client when the LLM provider may be available again."""
+    return HTTPException(
+        status_code=503,
+        detail=f"LLM service unavailable: {str(e)}",
+        headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+    )
+
+
+def _format_sse(event: str, data: Any) -> str:
+    """Format a Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _stream_initial_evaluation(
+    request: InitialEvaluationRequestDTO,
+    use_case: InitialEvaluationUseCase
+) -> AsyncIterator[str]:
+    """Relay use case events as SSE, reporting failures as an error event."""
+    try:
+        async for event in use_case.execute_stream(request):
+            yield _format_sse(event["event"], event["data"])
+        yield _format_sse("done", {})
+    except LLMUnavailableException as e:
+        yield _format_sse("error", {
+            "status_code": 503,
+            "detail": f"LLM service unavailable: {str(e)}",
+            "retry_after": max(1, math.ceil(e.retry_after))
+        })
+    except LLMException as e:
+        yield _format_sse("error", {"status_code": 503, "detail": f"LLM service error: {str(e)}"})
+    except EvaluationException as e:
+        yield _format_sse("error", {"status_code": 400, "detail": str(e)})
+    except Exception:
+        yield _format_sse("error", {"status_code": 500, "detail": "Internal server error"})
+
+
 @router.post("/initial", response_model=InitialEvaluationResponseDTO)
 async def initial_evaluation(
     request: InitialEvaluationRequestDTO,
+    http_request: Request,
     use_case: InitialEvaluationUseCase = Depends(get_initial_evaluation_use_case)
 ) -> InitialEvaluationResponseDTO:
     """
@@ -31,9 +83,22 @@ async def initial_evaluation(
     
     Evaluates user's answers to determine their current language level
     and provides feedback with suggestions for improvement.
+
+    Send `Accept: text/event-stream` to receive the result as Server-Sent
+    Events instead: one `feedback` event per answer as soon as it is ready,
+    then `evaluation` (level, scores, reason), `next_questions` and `done`.
     """
+    if "text/event-stream" in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_initial_evaluation(request, use_case),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
     try:
         return await use_case.execute(request)
+    except LLMUnavailableException as e:
+        raise _unavailable(e)
     except LLMException as e:
         raise HTTPException(status_code=503, detail=f"LLM service error: {str(e)}")
     except InvalidResponseException as e:
@@ -59,9 +124,59 @@ async def final_evaluation(
         return await use_case.execute(request)
     except EvaluationNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except LLMUnavailableException as e:
+        raise _unavailable(e)
     except LLMException as e:
         raise HTTPException(status_code=503, detail=f"LLM service error: {str(e)}")
     except EvaluationException as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/history/{user_id}/initial", response_model=EvaluationHistoryPageDTO)
+async def initial_evaluation_history(
+    user_id: int,
+    limit: int = Query(settings.HISTORY_PAGE_DEFAULT_LIMIT, ge=1, le=settings.HISTORY_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (id and created_at are always included)"),
+    use_case: EvaluationHistoryUseCase = Depends(get_evaluation_history_use_case)
+) -> EvaluationHistoryPageDTO:
+    """
+    Page through a user's per-answer initial evaluations, newest first.
+
+    Pass the returned `next_cursor` to get the following page; it is null
+    on the last page.
+    """
+    try:
+        return await use_case.initial_history(user_id, limit, cursor, fields)
+    except EvaluationException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RepositoryException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/history/{user_id}/final", response_model=EvaluationHistoryPageDTO)
+async def final_evaluation_history(
+    user_id: int,
+    limit: int = Query(settings.HISTORY_PAGE_DEFAULT_LIMIT, ge=1, le=settings.HISTORY_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (id and created_at are always included)"),
+    use_case: EvaluationHistoryUseCase = Depends(get_evaluation_history_use_case)
+) -> EvaluationHistoryPageDTO:
+    """
+    Page through a user's final evaluations, newest first.
+
+    Pass the returned `next_cursor` to get the following page; it is null
+    on the last page.
+    """
+    try:
+        return await use_case.final_history(user_id, limit, cursor, fields)
+    except EvaluationException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RepositoryException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
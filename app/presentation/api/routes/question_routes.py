@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from typing import Optional
 
 from app.application.questions.use_cases.list_questions_use_case import ListQuestionsUseCase
 from app.application.questions.dtos.questions_dto import QuestionListResponseDTO
@@ -9,18 +9,42 @@ from app.core.exceptions.evaluation_exceptions import RepositoryException
 router = APIRouter(tags=["questions"])
 
 
-@router.get("/", response_model=QuestionListResponseDTO)
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+@router.get(
+    "/",
+    response_model=QuestionListResponseDTO,
+    responses={304: {"description": "Question catalog unchanged since the ETag sent in If-None-Match"}}
+)
 async def list_questions(
+    request: Request,
+    response: Response,
     use_case: ListQuestionsUseCase = Depends(get_list_questions_use_case)
 ) -> QuestionListResponseDTO:
     """
     Get all available questions for evaluation.
     
     Returns a list of questions that users can answer for language evaluation.
+    Responses carry an ETag of the question catalog version; a request whose
+    If-None-Match holds the current one gets 304 Not Modified.
     """
     try:
-        return use_case.execute()
+        # The ETag and the body come from the same catalog snapshot
+        version, questions = await use_case.execute_versioned()
+        if version is not None:
+            etag = f'"{version}"'
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
+        return questions
     except RepositoryException as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Internal server error")
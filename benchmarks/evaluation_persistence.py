@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark de persistencia de evaluaciones por respuesta.
+
+Compara el guardado fila a fila (add → commit → refresh por cada respuesta)
+con save_many (un único INSERT multi-fila con RETURNING en una transacción)
+para envíos de 5, 20 y 100 respuestas, e informa de las filas por segundo.
+Por defecto usa SQLite en memoria (requiere aiosqlite), que mantiene una
+sentencia por fila dentro de la transacción; con --database-url se mide contra
+PostgreSQL (postgresql+asyncpg://...), donde las filas van en un único INSERT
+multi-fila y cada commit implica un fsync.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.config.database import Base  # noqa: E402
+from app.domain.entities.evaluation import Evaluation  # noqa: E402
+from app.infrastructure.persistence.sqlalchemy.models.evaluation_model import EvaluationModel  # noqa: E402
+from app.infrastructure.persistence.sqlalchemy.repositories.evaluation_repository_impl import (  # noqa: E402
+    SqlAlchemyEvaluationRepository
+)
+
+ANSWER_COUNTS = (5, 20, 100)
+SAMPLE_ANSWER = (
+    "Last weekend I went to the mountains with my family. We was walking for many hours and "
+    "the views were amazing, but I was very tired at the end because I don't exercise often."
+)
+
+
+def sample_evaluations(user_id: int, answer_count: int) -> List[Evaluation]:
+    """Per-answer evaluations of one representative submission."""
+    return [
+        Evaluation(
+            user_id=user_id,
+            question=f"Sample question {index}?",
+            answer=SAMPLE_ANSWER,
+            estimated_level="B1",
+            grammar=6.5,
+            vocabulary=7.0,
+            fluency=6.8,
+            mistakes=["'We was walking' should be 'We were walking'"],
+            suggestions=["Use a wider range of connectors"]
+        )
+        for index in range(answer_count)
+    ]
+
+
+async def save_one_by_one(repository: SqlAlchemyEvaluationRepository, evaluations: List[Evaluation]) -> None:
+    """Previous behaviour: one transaction and refresh per row."""
+    for evaluation in evaluations:
+        await repository.save(evaluation)
+
+
+async def save_in_bulk(repository: SqlAlchemyEvaluationRepository, evaluations: List[Evaluation]) -> None:
+    """One multi-row insert per submission."""
+    await repository.save_many(evaluations)
+
+
+async def rows_per_second(
+    session_factory: Callable,
+    save: Callable[[SqlAlchemyEvaluationRepository, List[Evaluation]], Awaitable[None]],
+    answer_count: int,
+    submissions: int
+) -> float:
+    """Rows per second saving ``submissions`` submissions of ``answer_count`` answers each."""
+    async with session_factory() as session:
+        repository = SqlAlchemyEvaluationRepository(session)
+        batches = [sample_evaluations(user_id, answer_count) for user_id in range(submissions)]
+        started = time.perf_counter()
+        for evaluations in batches:
+            await save(repository, evaluations)
+        elapsed = time.perf_counter() - started
+        return answer_count * submissions / elapsed
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Rows/s of per-row saves versus save_many")
+    parser.add_argument(
+        "--database-url",
+        default="sqlite+aiosqlite://",
+        help="Database to benchmark against (default: in-memory SQLite); the evaluations table is created if missing"
+    )
+    parser.add_argument("--submissions", type=int, default=50, help="Submissions saved per case (default 50)")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Create the table if missing and measure every case."""
+    engine = create_async_engine(args.database_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[EvaluationModel.__table__])
+    session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    print(f"🗄️  Database: {engine.url.render_as_string(hide_password=True)}, {args.submissions} submissions per case")
+    print(f"{'answers':>8} {'save rows/s':>12} {'save_many rows/s':>17} {'speedup':>8}")
+    for answer_count in ANSWER_COUNTS:
+        one_by_one = await rows_per_second(session_factory, save_one_by_one, answer_count, args.submissions)
+        bulk = await rows_per_second(session_factory, save_in_bulk, answer_count, args.submissions)
+        print(f"{answer_count:>8} {one_by_one:>12.0f} {bulk:>17.0f} {bulk / one_by_one:>7.1f}x")
+
+    await engine.dispose()
+
+
+def main():
+    """Función principal"""
+    asyncio.run(run(parse_args()))
+    print("✅ Benchmark finished")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark de presupuesto de tokens de entrada por plantilla de prompt.
+
+Cuenta los tokens del prefijo estático (cacheable por el proveedor) y del
+sufijo variable para payloads representativos, y termina con código distinto
+de cero si algún total supera el presupuesto registrado en
+prompt_token_budget.json.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.application.evaluation.services.evaluation_context_compactor import EvaluationContextCompactor  # noqa: E402
+from app.infrastructure.external_services import prompts  # noqa: E402
+
+BUDGET_PATH = Path(__file__).with_name("prompt_token_budget.json")
+
+SAMPLE_QUESTIONS = [
+    "What did you do last weekend?",
+    "Describe a challenge you overcame and how you did it.",
+    "How has technology changed the way you communicate with friends?",
+    "Do you think working from home is better than working in an office? Why?",
+    "'The limits of my language mean the limits of my world.' What does this quote mean to you?",
+]
+SAMPLE_ANSWER = (
+    "Last weekend I went to the mountains with my family. We was walking for many hours and "
+    "the views were amazing, but I was very tired at the end because I don't exercise often."
+)
+
+
+def build_token_counter(tokenizer: str) -> Callable[[str], int]:
+    """Token counter: tiktoken's encoding when requested and installed, else ~4 characters per token."""
+    if tokenizer != "heuristic":
+        try:
+            import tiktoken
+            encoding = tiktoken.get_encoding(tokenizer)
+            return lambda text: len(encoding.encode(text))
+        except ImportError:
+            print("⚠️  tiktoken is not installed; falling back to the heuristic counter")
+    return lambda text: (len(text) + 3) // 4
+
+
+def sample_submission(answer_count: int):
+    """Representative (questions_dict, answers_dict) with the given number of answers."""
+    questions = {index + 1: SAMPLE_QUESTIONS[index % len(SAMPLE_QUESTIONS)] for index in range(answer_count)}
+    answers = {question_id: SAMPLE_ANSWER for question_id in questions}
+    return questions, answers
+
+
+def build_cases() -> Dict[str, List[Dict[str, str]]]:
+    """Rendered messages of every template for representative payloads."""
+    questions_5, answers_5 = sample_submission(5)
+    questions_20, answers_20 = sample_submission(20)
+    initial_evaluation = {
+        "level": "B1",
+        "scores": {"grammar": 6.5, "vocabulary": 7.0, "fluency": 6.8},
+        "reason": "Consistent B1 performance with occasional tense errors and limited range on abstract topics",
+        "feedback": [
+            {
+                "question": question,
+                "answer": SAMPLE_ANSWER,
+                "estimated_level": "B1",
+                "scores": {"grammar": 6.5, "vocabulary": 7.0, "fluency": 6.8},
+                "mistakes": ["'We was walking' should be 'We were walking' (subject-verb agreement)"],
+                "suggestions": ["Use a wider range of connectors such as 'however' or 'although'"],
+            }
+            for question in SAMPLE_QUESTIONS
+        ],
+        "next_questions": SAMPLE_QUESTIONS,
+    }
+    previous_evaluation = EvaluationContextCompactor().compact(initial_evaluation)
+    new_answers = [{"question": question, "answer": SAMPLE_ANSWER} for question in SAMPLE_QUESTIONS]
+
+    return {
+        "evaluation/5_answers": prompts.evaluation_messages(questions_5, answers_5),
+        "evaluation/20_answers": prompts.evaluation_messages(questions_20, answers_20),
+        "batch_evaluation/8_users": prompts.batch_evaluation_messages([(questions_5, answers_5)] * 8),
+        "answer_evaluation/1_answer": prompts.answer_evaluation_messages(SAMPLE_QUESTIONS[0], SAMPLE_ANSWER),
+        "next_questions/5_answers": prompts.next_questions_messages(questions_5, answers_5),
+        "question_generation/1_topic": prompts.question_generation_messages("B1", "travel", 5),
+        "final_evaluation/5_answers": prompts.final_evaluation_messages(previous_evaluation, new_answers),
+    }
+
+
+def measure(count_tokens: Callable[[str], int]) -> Dict[str, Dict[str, int]]:
+    """Static and variable token counts per case."""
+    results = {}
+    for name, messages in build_cases().items():
+        static = sum(count_tokens(message["content"]) for message in messages if message["role"] == "system")
+        variable = sum(count_tokens(message["content"]) for message in messages if message["role"] != "system")
+        results[name] = {"static": static, "variable": variable, "total": static + variable}
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Check prompt input tokens against the recorded budget")
+    parser.add_argument("--update", action="store_true", help="Record the current counts as the new budget")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.02,
+        help="Allowed growth over the budget before failing (fraction, default 0.02)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Función principal"""
+    args = parse_args()
+    budget = json.loads(BUDGET_PATH.read_text()) if BUDGET_PATH.exists() else {"tokenizer": "heuristic", "cases": {}}
+    results = measure(build_token_counter(budget["tokenizer"]))
+
+    print(f"{'template':<30} {'static':>8} {'variable':>9} {'total':>8} {'budget':>8}")
+    regressions = []
+    for name, counts in results.items():
+        limit = budget["cases"].get(name)
+        print(f"{name:<30} {counts['static']:>8} {counts['variable']:>9} {counts['total']:>8} {limit or '-':>8}")
+        if limit is not None and counts["total"] > limit * (1 + args.tolerance):
+            regressions.append(name)
+
+    if args.update:
+        budget["cases"] = {name: counts["total"] for name, counts in results.items()}
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2) + "\n")
+        print(f"💾 Budget updated: {BUDGET_PATH}")
+        return
+
+    if regressions:
+        print(f"❌ Token budget exceeded by: {', '.join(regressions)}")
+        sys.exit(1)
+    print("✅ All prompt templates are within the token budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Script para evaluar en lote archivos JSONL de respuestas ({user_id, answers} por línea)
+usando un backend de LLM por lotes.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.core.config.settings import settings
+from app.core.container import Container
+from app.infrastructure.external_services.llm_service_factory import build_batch_llm_backend
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Bulk-score placement answers from a JSONL file")
+    parser.add_argument("input", help="JSONL file with one {user_id, answers} object per line")
+    parser.add_argument(
+        "--checkpoint",
+        help="Checkpoint file used to resume an interrupted run (default: <input>.checkpoint.json)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["openai", "local"],
+        default=settings.LLM_BATCH_BACKEND,
+        help="Batch backend: OpenAI Batch API or the local file-based stand-in"
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.BULK_BATCH_SIZE)
+    parser.add_argument("--poll-interval", type=float, default=settings.BULK_POLL_INTERVAL_SECONDS)
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run the bulk evaluation use case and print a summary."""
+    container = Container()
+    batch_backend = build_batch_llm_backend(args.backend)
+    use_case = container.bulk_evaluation_use_case(
+        batch_backend=batch_backend,
+        batch_size=args.batch_size,
+        poll_interval=args.poll_interval
+    )
+
+    print(f"🚀 Bulk scoring {args.input} with the '{args.backend}' batch backend...")
+    try:
+        summary = await use_case.execute(args.input, args.checkpoint or f"{args.input}.checkpoint.json")
+    finally:
+        await batch_backend.aclose()
+
+    print(f"✅ Completed: {summary.completed}/{summary.total}")
+    print(f"⏭️  Skipped (previous runs): {summary.skipped}")
+    print(f"📦 Batches submitted: {summary.batches_submitted}")
+    if summary.failed:
+        print(f"❌ Failed: {summary.failed} (see checkpoint file for details)")
+        return 1
+    return 0
+
+
+def main():
+    """Función principal"""
+    sys.exit(asyncio.run(run(parse_args())))
+
+
+if __name__ == "__main__":
+    main()
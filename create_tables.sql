@@ -27,9 +27,12 @@ COMMENT ON COLUMN questions.question IS 'Texto de la pregunta';
 -- =============================================================================
 -- TABLA: evaluations
 -- =============================================================================
--- Almacena los resultados de las evaluaciones iniciales de los usuarios
+-- Almacena los resultados de las evaluaciones iniciales de los usuarios.
+-- Particionada por mes sobre created_at: la clave primaria y los índices únicos
+-- incluyen created_at. Las tablas existentes sin particionar se convierten con
+-- migrate_db.py, y manage_partitions.py crea los meses siguientes y archiva los antiguos.
 CREATE TABLE IF NOT EXISTS evaluations (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     user_id INTEGER NOT NULL,
     question TEXT NOT NULL,
     answer TEXT NOT NULL,
@@ -37,16 +40,24 @@ CREATE TABLE IF NOT EXISTS evaluations (
     grammar FLOAT NOT NULL,
     vocabulary FLOAT NOT NULL,
     fluency FLOAT NOT NULL,
-    mistakes TEXT NOT NULL,  -- JSON string
-    suggestions TEXT NOT NULL,  -- JSON string
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
+    mistakes JSONB NOT NULL,  -- JSON array of strings
+    suggestions JSONB NOT NULL,  -- JSON array of strings
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    dedup_key VARCHAR(64),  -- idempotency key of write-behind persistence (unique index below)
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
 
--- Índices para tabla evaluations
-CREATE INDEX IF NOT EXISTS idx_evaluations_user_id ON evaluations(user_id);
+-- Índices para tabla evaluations (se crean en cada partición)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_evaluations_dedup_key ON evaluations(dedup_key, created_at);
+-- Historial por usuario, paginado por (created_at, id)
+CREATE INDEX IF NOT EXISTS idx_evaluations_user_history ON evaluations(user_id, created_at, id);
 CREATE INDEX IF NOT EXISTS idx_evaluations_level ON evaluations(estimated_level);
 CREATE INDEX IF NOT EXISTS idx_evaluations_created_at ON evaluations(created_at);
 
+-- Índices GIN para filtrar por contenido de los errores y sugerencias (operador @>)
+CREATE INDEX IF NOT EXISTS idx_evaluations_mistakes ON evaluations USING GIN (mistakes jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_evaluations_suggestions ON evaluations USING GIN (suggestions jsonb_path_ops);
+
 -- Comentarios para documentación
 COMMENT ON TABLE evaluations IS 'Almacena los resultados detallados de las evaluaciones iniciales';
 COMMENT ON COLUMN evaluations.user_id IS 'ID del usuario que realizó la evaluación';
@@ -56,25 +67,31 @@ COMMENT ON COLUMN evaluations.estimated_level IS 'Nivel CEFR estimado para esta
 COMMENT ON COLUMN evaluations.grammar IS 'Puntuación de gramática (0.0-10.0)';
 COMMENT ON COLUMN evaluations.vocabulary IS 'Puntuación de vocabulario (0.0-10.0)';
 COMMENT ON COLUMN evaluations.fluency IS 'Puntuación de fluidez (0.0-10.0)';
-COMMENT ON COLUMN evaluations.mistakes IS 'Lista de errores identificados (JSON)';
-COMMENT ON COLUMN evaluations.suggestions IS 'Lista de sugerencias de mejora (JSON)';
+COMMENT ON COLUMN evaluations.mistakes IS 'Lista de errores identificados (JSONB)';
+COMMENT ON COLUMN evaluations.suggestions IS 'Lista de sugerencias de mejora (JSONB)';
+COMMENT ON COLUMN evaluations.dedup_key IS 'Clave de idempotencia de la escritura diferida desde el outbox';
 
 -- =============================================================================
 -- TABLA: final_evaluations
 -- =============================================================================
--- Almacena los resultados de las evaluaciones finales de los usuarios
+-- Almacena los resultados de las evaluaciones finales de los usuarios.
+-- Particionada por mes sobre created_at, igual que evaluations.
 CREATE TABLE IF NOT EXISTS final_evaluations (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     user_id INTEGER NOT NULL,
     initial_level VARCHAR(10),
     final_level VARCHAR(10) NOT NULL,
     reason TEXT,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP WITH TIME ZONE
-);
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    dedup_key VARCHAR(64),  -- idempotency key of write-behind persistence (unique index below)
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
 
--- Índices para tabla final_evaluations
-CREATE INDEX IF NOT EXISTS idx_final_evaluations_user_id ON final_evaluations(user_id);
+-- Índices para tabla final_evaluations (se crean en cada partición)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_final_evaluations_dedup_key ON final_evaluations(dedup_key, created_at);
+-- Historial por usuario, paginado por (created_at, id)
+CREATE INDEX IF NOT EXISTS idx_final_evaluations_user_history ON final_evaluations(user_id, created_at, id);
 CREATE INDEX IF NOT EXISTS idx_final_evaluations_created_at ON final_evaluations(created_at);
 CREATE INDEX IF NOT EXISTS idx_final_evaluations_final_level ON final_evaluations(final_level);
 
@@ -84,6 +101,34 @@ COMMENT ON COLUMN final_evaluations.user_id IS 'ID del usuario que realizó la e
 COMMENT ON COLUMN final_evaluations.initial_level IS 'Nivel determinado en la evaluación inicial';
 COMMENT ON COLUMN final_evaluations.final_level IS 'Nivel final determinado por el LLM';
 COMMENT ON COLUMN final_evaluations.reason IS 'Explicación del LLM para el nivel final asignado';
+COMMENT ON COLUMN final_evaluations.dedup_key IS 'Clave de idempotencia de la escritura diferida desde el outbox';
+
+-- =============================================================================
+-- PARTICIONES
+-- =============================================================================
+-- Particiones mensuales del mes actual y los tres siguientes (límites en UTC), más
+-- una partición por defecto para las filas de meses sin partición
+DO $$
+DECLARE
+    parent TEXT;
+    month DATE;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['evaluations', 'final_evaluations'] LOOP
+        -- Las tablas sin particionar se convierten con migrate_db.py
+        CONTINUE WHEN (SELECT relkind FROM pg_class WHERE oid = to_regclass(parent)) <> 'p';
+        FOR offset_months IN 0..3 LOOP
+            month := date_trunc('month', now() AT TIME ZONE 'UTC')::date + make_interval(months => offset_months);
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                parent || '_' || to_char(month, 'YYYY_MM'),
+                parent,
+                month::text || ' 00:00:00+00',
+                (month + interval '1 month')::date::text || ' 00:00:00+00'
+            );
+        END LOOP;
+        EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT', parent || '_default', parent);
+    END LOOP;
+END $$;
 
 -- =============================================================================
 -- DATOS INICIALES
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Servidor local compatible con la API de OpenAI (POST /v1/chat/completions)
+que responde con el simulador de LLM, para pruebas de carga y latencia sin
+consumir tokens. Apuntar el servicio con OPENAI_BASE_URL=http://localhost:8089/v1.
+"""
+
+import argparse
+import json
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.core.config.settings import settings
+from app.infrastructure.external_services.llm_simulator import LLMSimulator, SimulatedLLMError
+
+
+def create_app(simulator: LLMSimulator) -> FastAPI:
+    """Build the OpenAI-compatible app around a simulator."""
+    app = FastAPI(title="LLM simulator")
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", settings.OPENAI_MODEL)
+        messages = body.get("messages", [])
+
+        try:
+            simulator.check_failure()
+        except SimulatedLLMError as e:
+            headers = {"Retry-After": str(max(1, round(e.retry_after)))} if e.retry_after else None
+            error_type = "rate_limit_exceeded" if e.status_code == 429 else "server_error"
+            return JSONResponse(
+                status_code=e.status_code,
+                content={"error": {"message": e.message, "type": error_type, "code": error_type}},
+                headers=headers
+            )
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        if body.get("stream"):
+            return StreamingResponse(
+                _stream_events(
+                    simulator,
+                    completion_id,
+                    model,
+                    messages,
+                    bool((body.get("stream_options") or {}).get("include_usage"))
+                ),
+                media_type="text/event-stream"
+            )
+
+        result = await simulator.complete(messages)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": result["content"]},
+                "finish_reason": "stop"
+            }],
+            "usage": result["usage"]
+        }
+
+    return app
+
+
+async def _stream_events(
+    simulator: LLMSimulator,
+    completion_id: str,
+    model: str,
+    messages: Any,
+    include_usage: bool
+) -> AsyncIterator[str]:
+    """Server-sent chat.completion.chunk events, ending with [DONE]."""
+    def event(choices: List[Dict[str, Any]], **extra: Any) -> str:
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": choices,
+            **extra
+        }
+        return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+    content = ""
+    yield event([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])
+    async for text in simulator.stream(messages):
+        content += text
+        yield event([{"index": 0, "delta": {"content": text}, "finish_reason": None}])
+    yield event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+    if include_usage:
+        yield event([], usage=simulator.usage(messages, content))
+    yield "data: [DONE]\n\n"
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments; simulator defaults come from settings."""
+    parser = argparse.ArgumentParser(description="OpenAI-compatible LLM simulator server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-median", type=float, default=settings.LLM_SIM_LATENCY_MEDIAN_SECONDS)
+    parser.add_argument("--latency-sigma", type=float, default=settings.LLM_SIM_LATENCY_SIGMA)
+    parser.add_argument("--tokens-per-second", type=float, default=settings.LLM_SIM_TOKENS_PER_SECOND)
+    parser.add_argument("--error-rate", type=float, default=settings.LLM_SIM_ERROR_RATE)
+    parser.add_argument("--rate-limit-burst-probability", type=float, default=settings.LLM_SIM_RATE_LIMIT_BURST_PROBABILITY)
+    parser.add_argument("--rate-limit-burst-seconds", type=float, default=settings.LLM_SIM_RATE_LIMIT_BURST_SECONDS)
+    parser.add_argument("--seed", type=int, default=settings.LLM_SIM_SEED)
+    return parser.parse_args()
+
+
+def main():
+    """Función principal"""
+    args = parse_args()
+    simulator = LLMSimulator(
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+        rate_limit_burst_probability=args.rate_limit_burst_probability,
+        rate_limit_burst_seconds=args.rate_limit_burst_seconds,
+        seed=args.seed
+    )
+
+    print(f"🤖 LLM simulator listening on http://{args.host}:{args.port}/v1")
+    print(f"⏱️  Median latency {args.latency_median}s, {args.tokens_per_second} tokens/s, error rate {args.error_rate}")
+    uvicorn.run(create_app(simulator), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,16 @@
+import time
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
+from starlette.routing import Match
 
 from app.core.container import Container
 from app.core.config.settings import settings
+from app.core.config.database import engine as database_engine, unit_of_work_scope
+from app.core.deadline import deadline_scope
+from app.core.metrics import metrics, endpoint_scope, PROMETHEUS_CONTENT_TYPE
+from app.domain.value_objects.cefr_level import CEFRLevel
 from app.presentation.api.routes.question_routes import router as question_router
 from app.presentation.api.routes.evaluation_routes import router as evaluation_router
 
@@ -15,6 +22,65 @@ app = FastAPI(
     debug=settings.DEBUG
 )
 
+@app.middleware("http")
+async def request_deadline_middleware(request: Request, call_next):
+    """Give every request a deadline that LLM retries and hedges must respect."""
+    with deadline_scope(settings.REQUEST_DEADLINE_SECONDS):
+        return await call_next(request)
+
+http_requests = metrics.counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code",
+    ("method", "endpoint", "status")
+)
+http_latency = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template",
+    ("method", "endpoint")
+)
+
+def _route_template(request: Request) -> str:
+    """Path template of the route matching a request (keeps metric label values bounded)."""
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+@app.middleware("http")
+async def http_metrics_middleware(request: Request, call_next):
+    """Record request counts and latency, and attribute LLM usage to the endpoint."""
+    endpoint = _route_template(request)
+    started = time.monotonic()
+    status = 500
+    try:
+        with endpoint_scope(endpoint):
+            response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        http_requests.inc(method=request.method, endpoint=endpoint, status=str(status))
+        http_latency.observe(time.monotonic() - started, method=request.method, endpoint=endpoint)
+
+class UnitOfWorkMiddleware:
+    """
+    Share one database session among the repositories of a request and always
+    close it. Pure ASGI, so the scope also covers streamed response bodies.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        async with unit_of_work_scope():
+            await self.app(scope, receive, send)
+
+# Added last, so it is the outermost middleware
+app.add_middleware(UnitOfWorkMiddleware)
+
 @app.exception_handler(RequestValidationError)
 async def request_validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors with detailed messages."""
@@ -33,6 +99,11 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": settings.APP_NAME}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Metrics in the Prometheus text exposition format."""
+    return Response(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 @app.get("/debug")
 async def debug_endpoint():
     """Debug endpoint to test dependencies."""
@@ -43,7 +114,7 @@ async def debug_endpoint():
         # Test direct repository call
         from app.infrastructure.persistence.sqlalchemy.repositories.question_repository_impl import SqlAlchemyQuestionRepository
         repo = SqlAlchemyQuestionRepository()
-        questions = repo.find_all()
+        questions = await repo.find_all()
         
         return {
             "status": "debug_ok",
@@ -66,6 +137,40 @@ from app.presentation.api.dependencies import set_container
 container = Container()
 set_container(container)
 
+
+@app.on_event("startup")
+async def load_question_catalog():
+    """Load the question catalog cache and follow changes made by other workers."""
+    if settings.QUESTION_CATALOG_CACHE_ENABLED:
+        await container.question_repository().start()
+
+
+@app.on_event("startup")
+async def start_evaluation_outbox():
+    """Start persisting queued evaluation results in the background."""
+    if settings.EVALUATION_OUTBOX_ENABLED:
+        container.evaluation_outbox_service().start()
+
+
+@app.on_event("startup")
+async def stock_question_pool():
+    """Top up every level of the question pool in the background so first requests find questions."""
+    if settings.QUESTION_POOL_ENABLED:
+        container.question_pool_service().stock_in_background(CEFRLevel.get_all_levels())
+
+
+@app.on_event("shutdown")
+async def shutdown_services():
+    """Stop background work, then close the LLM client, caches and database pool."""
+    if settings.QUESTION_POOL_ENABLED:
+        await container.question_pool_service().aclose()
+    await container.llm_service().aclose()
+    if settings.QUESTION_CATALOG_CACHE_ENABLED:
+        await container.question_repository().aclose()
+    if settings.EVALUATION_OUTBOX_ENABLED:
+        await container.evaluation_outbox_service().aclose()
+    await database_engine.dispose()
+
 # --- Incluir rutas ---
 app.include_router(question_router, prefix="/api/v1/questions")
 app.include_router(evaluation_router, prefix="/api/v1/evaluation")
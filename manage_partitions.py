@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Script de mantenimiento de las particiones mensuales de evaluations y final_evaluations:
+crea las particiones de los próximos meses y archiva las de los meses más antiguos que
+la retención en ficheros JSONL comprimidos con zstd (pensado para ejecutarse a diario).
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.core.config.settings import settings
+from app.core.config.database import engine
+from app.core.exceptions.evaluation_exceptions import RepositoryException
+from app.infrastructure.persistence.archive.partition_archive import PartitionArchive
+from app.infrastructure.persistence.sqlalchemy.partitions import PARTITIONED_TABLES, PartitionMaintenance
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Create upcoming monthly partitions and archive old ones")
+    parser.add_argument("command", choices=["list", "ensure", "archive"])
+    parser.add_argument("--months-ahead", type=int, default=settings.PARTITION_MONTHS_AHEAD)
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=settings.EVALUATION_ARCHIVE_RETENTION_MONTHS,
+        help="Months kept in the database, counting the current one; older ones are archived"
+    )
+    parser.add_argument("--archive-dir", default=settings.EVALUATION_ARCHIVE_DIR)
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run the maintenance command on every partitioned table."""
+    archive = PartitionArchive(args.archive_dir, settings.EVALUATION_ARCHIVE_COMPRESSION_LEVEL)
+    maintenance = PartitionMaintenance(engine, archive)
+    failed = False
+    try:
+        for table in PARTITIONED_TABLES:
+            if args.command == "list":
+                partitions = await maintenance.partitions(table)
+                print(f"📋 {table}: {len(partitions)} partitions")
+                for name, _ in partitions:
+                    print(f"  - {name}")
+                print(f"  📦 Archived months: {[f'{month:%Y-%m}' for month in archive.months(table)]}")
+                default_rows = await maintenance.default_partition_rows(table)
+                if default_rows:
+                    print(f"  ⚠️  {default_rows} rows in {table}_default: create the missing monthly partitions")
+
+            elif args.command == "ensure":
+                created = await maintenance.ensure_partitions(table, args.months_ahead)
+                print(f"✅ {table}: {len(created)} partitions created {created}")
+
+            else:
+                print(f"🗄️  Archiving {table} months older than {args.retention_months} months...")
+                for name, month in await maintenance.expired_partitions(table, args.retention_months):
+                    try:
+                        rows = await maintenance.archive_partition(table, month)
+                        print(f"  ✅ {name}: {rows} rows archived and partition dropped")
+                    except RepositoryException as e:
+                        print(f"  ❌ {e}")
+                        failed = True
+    finally:
+        await engine.dispose()
+    return 1 if failed else 0
+
+
+def main():
+    """Función principal"""
+    sys.exit(asyncio.run(run(parse_args())))
+
+
+if __name__ == "__main__":
+    main()
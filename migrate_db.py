@@ -4,8 +4,79 @@ Script para crear las tablas necesarias en la base de datos
 """
 
 import sys
+from datetime import date
 from sqlalchemy import create_engine, text
 from app.core.config.settings import settings
+from app.infrastructure.persistence.sqlalchemy.partitions import (
+    PARTITIONED_TABLES, add_months, create_default_partition_sql, create_partition_sql, current_month
+)
+
+# Filas convertidas por transacción al pasar mistakes/suggestions de TEXT a JSONB
+FEEDBACK_BATCH_SIZE = 5000
+
+# Filas copiadas por transacción al particionar una tabla existente
+PARTITION_COPY_BATCH_SIZE = 5000
+
+# Tablas particionadas por mes sobre created_at: la clave primaria y los índices únicos incluyen created_at
+CREATE_TABLES_SQL = {
+    "evaluations": """
+    CREATE TABLE IF NOT EXISTS evaluations (
+        id SERIAL,
+        user_id INTEGER NOT NULL,
+        question TEXT NOT NULL,
+        answer TEXT NOT NULL,
+        estimated_level VARCHAR(10) NOT NULL,
+        grammar FLOAT NOT NULL,
+        vocabulary FLOAT NOT NULL,
+        fluency FLOAT NOT NULL,
+        mistakes JSONB NOT NULL,
+        suggestions JSONB NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        dedup_key VARCHAR(64),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at);
+    """,
+    "final_evaluations": """
+    CREATE TABLE IF NOT EXISTS final_evaluations (
+        id SERIAL,
+        user_id INTEGER NOT NULL,
+        initial_level VARCHAR(10),
+        final_level VARCHAR(10) NOT NULL,
+        reason TEXT,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP WITH TIME ZONE,
+        dedup_key VARCHAR(64),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at);
+    """
+}
+
+# Índices de las tablas particionadas; {table} es la tabla sobre la que se crean
+CREATE_INDEXES_SQL = {
+    "evaluations": """
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_evaluations_dedup_key ON {table}(dedup_key, created_at);
+    CREATE INDEX IF NOT EXISTS idx_evaluations_user_history ON {table}(user_id, created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_evaluations_level ON {table}(estimated_level);
+    CREATE INDEX IF NOT EXISTS idx_evaluations_created_at ON {table}(created_at);
+    CREATE INDEX IF NOT EXISTS idx_evaluations_mistakes ON {table} USING GIN (mistakes jsonb_path_ops);
+    CREATE INDEX IF NOT EXISTS idx_evaluations_suggestions ON {table} USING GIN (suggestions jsonb_path_ops);
+    """,
+    "final_evaluations": """
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_final_evaluations_dedup_key ON {table}(dedup_key, created_at);
+    CREATE INDEX IF NOT EXISTS idx_final_evaluations_user_history ON {table}(user_id, created_at, id);
+    CREATE INDEX IF NOT EXISTS idx_final_evaluations_created_at ON {table}(created_at);
+    CREATE INDEX IF NOT EXISTS idx_final_evaluations_final_level ON {table}(final_level);
+    """
+}
+
+# Índices del historial por usuario (paginación por (created_at, id)), que sustituyen a idx_{table}_user_id
+HISTORY_INDEX_COLUMNS = "user_id, created_at, id"
+
+# Columnas añadidas después de crear las tablas sin particionar (tablas existentes)
+UPGRADE_TABLES_SQL = {
+    "evaluations": "ALTER TABLE evaluations ADD COLUMN IF NOT EXISTS dedup_key VARCHAR(64);",
+    "final_evaluations": "ALTER TABLE final_evaluations ADD COLUMN IF NOT EXISTS dedup_key VARCHAR(64);"
+}
 
 def create_tables():
     """Crear las tablas necesarias en la base de datos"""
@@ -15,42 +86,33 @@ def create_tables():
         # Conectar a la base de datos
         engine = create_engine(settings.database_url)
         
-        # SQL para crear la tabla evaluations
-        create_evaluations_sql = """
-        CREATE TABLE IF NOT EXISTS evaluations (
-            id SERIAL PRIMARY KEY,
-            user_id INTEGER NOT NULL,
-            question TEXT NOT NULL,
-            answer TEXT NOT NULL,
-            estimated_level VARCHAR(10) NOT NULL,
-            grammar FLOAT NOT NULL,
-            vocabulary FLOAT NOT NULL,
-            fluency FLOAT NOT NULL,
-            mistakes TEXT NOT NULL,
-            suggestions TEXT NOT NULL,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-        
-        # SQL para crear índices
-        create_indexes_sql = """
-        CREATE INDEX IF NOT EXISTS idx_evaluations_user_id ON evaluations(user_id);
-        CREATE INDEX IF NOT EXISTS idx_evaluations_level ON evaluations(estimated_level);
-        CREATE INDEX IF NOT EXISTS idx_evaluations_created_at ON evaluations(created_at);
-        """
-        
         # Ejecutar las consultas
         with engine.connect() as conn:
-            # Crear tabla
-            conn.execute(text(create_evaluations_sql))
-            print("✅ Table 'evaluations' created successfully")
-            
-            # Crear índices
-            conn.execute(text(create_indexes_sql))
-            print("✅ Indexes created successfully")
-            
-            # Confirmar cambios
-            conn.commit()
+            for table in PARTITIONED_TABLES:
+                table_kind = conn.execute(
+                    text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table);"), {"table": table}
+                ).scalar()
+
+                if table_kind is None:
+                    # Crear tabla particionada e índices
+                    conn.execute(text(CREATE_TABLES_SQL[table]))
+                    conn.execute(text(CREATE_INDEXES_SQL[table].format(table=table)))
+                    print(f"✅ Table '{table}' created successfully")
+                elif table_kind == "r":
+                    # Tabla existente sin particionar: completar columnas y particionarla
+                    conn.execute(text(UPGRADE_TABLES_SQL[table]))
+                    conn.commit()
+                    if table == "evaluations":
+                        convert_feedback_to_jsonb(conn)
+                    partition_table(conn, table)
+
+                # Particiones del mes actual y los siguientes
+                create_partitions(conn, table, current_month())
+                conn.commit()
+                print(f"✅ Partitions of '{table}' created successfully")
+
+            # Tablas particionadas antes de existir el índice del historial
+            create_history_indexes(engine)
             
             # Verificar que las tablas existen
             result = conn.execute(text("""
@@ -84,6 +146,182 @@ def create_tables():
         print(f"❌ Error creating tables: {e}")
         return False
 
+def convert_feedback_to_jsonb(conn, batch_size: int = FEEDBACK_BATCH_SIZE):
+    """
+    Convertir mistakes/suggestions de TEXT (json.dumps) a JSONB por lotes.
+
+    Un ALTER COLUMN ... TYPE JSONB reescribiría la tabla entera bloqueándola;
+    en su lugar se rellenan columnas JSONB nuevas en lotes de IDs, cada uno en
+    su propia transacción, y al final se intercambian las columnas en una
+    transacción corta que convierte también las filas escritas mientras tanto.
+    Si se interrumpe, se puede volver a ejecutar y continúa donde lo dejó.
+    """
+    data_type = conn.execute(text("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'evaluations' AND column_name = 'mistakes';
+    """)).scalar()
+    if data_type == "jsonb":
+        print("✅ Feedback columns already stored as JSONB")
+        return
+
+    print("🔄 Converting mistakes/suggestions to JSONB...")
+    conn.execute(text("""
+        ALTER TABLE evaluations ADD COLUMN IF NOT EXISTS mistakes_jsonb JSONB;
+        ALTER TABLE evaluations ADD COLUMN IF NOT EXISTS suggestions_jsonb JSONB;
+    """))
+    conn.commit()
+
+    convert_sql = text("""
+        UPDATE evaluations
+        SET mistakes_jsonb = mistakes::jsonb, suggestions_jsonb = suggestions::jsonb
+        WHERE id >= :start AND id < :end AND mistakes_jsonb IS NULL;
+    """)
+    first_id, last_id = conn.execute(text("SELECT MIN(id), MAX(id) FROM evaluations;")).one()
+    converted = 0
+    if first_id is not None:
+        for start in range(first_id, last_id + 1, batch_size):
+            converted += conn.execute(convert_sql, {"start": start, "end": start + batch_size}).rowcount
+            conn.commit()
+            print(f"  - {converted} rows converted (IDs up to {min(start + batch_size - 1, last_id)})")
+
+    # Intercambio de columnas: solo bloquea la tabla durante las filas nuevas y el cambio de nombre
+    conn.execute(text("""
+        LOCK TABLE evaluations IN ACCESS EXCLUSIVE MODE;
+        UPDATE evaluations
+        SET mistakes_jsonb = mistakes::jsonb, suggestions_jsonb = suggestions::jsonb
+        WHERE mistakes_jsonb IS NULL;
+        ALTER TABLE evaluations DROP COLUMN mistakes;
+        ALTER TABLE evaluations DROP COLUMN suggestions;
+        ALTER TABLE evaluations RENAME COLUMN mistakes_jsonb TO mistakes;
+        ALTER TABLE evaluations RENAME COLUMN suggestions_jsonb TO suggestions;
+        ALTER TABLE evaluations ALTER COLUMN mistakes SET NOT NULL;
+        ALTER TABLE evaluations ALTER COLUMN suggestions SET NOT NULL;
+    """))
+    conn.commit()
+    print("✅ Feedback columns converted to JSONB")
+
+def create_partitions(conn, table: str, first_month: date, parent: str = None):
+    """Crear las particiones mensuales desde first_month hasta PARTITION_MONTHS_AHEAD meses después del actual"""
+    last_month = add_months(current_month(), settings.PARTITION_MONTHS_AHEAD)
+    month = first_month
+    while month <= last_month:
+        conn.execute(text(create_partition_sql(table, month, parent)))
+        month = add_months(month, 1)
+    # Recoge las filas de meses sin partición hasta que manage_partitions.py la cree
+    conn.execute(text(create_default_partition_sql(table, parent)))
+
+def partition_table(conn, table: str, batch_size: int = PARTITION_COPY_BATCH_SIZE):
+    """
+    Convertir una tabla existente sin particionar en una tabla particionada por mes.
+
+    Se crea una tabla particionada con las mismas columnas (y la misma secuencia de
+    IDs), se copian las filas por lotes de IDs, cada uno en su propia transacción, y
+    se crean sus índices; al final, en una transacción corta, se copian las filas
+    escritas mientras tanto y se intercambian los nombres. La tabla original se
+    conserva como {table}_unpartitioned para borrarla tras comprobar el resultado.
+    Si se interrumpe antes del intercambio, se puede volver a ejecutar.
+    """
+    new_table = f"{table}_partitioned"
+    print(f"🔄 Partitioning '{table}' by month...")
+
+    # Liberar los nombres de los índices (y de la clave primaria) de la tabla original
+    index_names = conn.execute(text("""
+        SELECT indexname FROM pg_indexes
+        WHERE schemaname = current_schema() AND tablename = :table AND indexname NOT LIKE '%unpartitioned';
+    """), {"table": table}).scalars().all()
+    for index_name in index_names:
+        conn.execute(text(f"ALTER INDEX {index_name} RENAME TO {index_name}_unpartitioned;"))
+
+    conn.execute(text(f"""
+        CREATE TABLE IF NOT EXISTS {new_table} (
+            LIKE {table} INCLUDING DEFAULTS,
+            CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at);
+    """))
+    first_created_at = conn.execute(text(f"SELECT MIN(created_at) FROM {table};")).scalar()
+    first_month = first_created_at.date().replace(day=1) if first_created_at else current_month()
+    create_partitions(conn, table, min(first_month, current_month()), parent=new_table)
+    conn.commit()
+
+    # Copia por lotes; ON CONFLICT permite repetir lotes ya copiados
+    copy_sql = text(f"""
+        INSERT INTO {new_table} SELECT * FROM {table}
+        WHERE id >= :start AND id < :end
+        ON CONFLICT DO NOTHING;
+    """)
+    first_id, last_id = conn.execute(text(f"SELECT MIN(id), MAX(id) FROM {table};")).one()
+    copied = 0
+    if first_id is not None:
+        for start in range(first_id, last_id + 1, batch_size):
+            copied += conn.execute(copy_sql, {"start": start, "end": start + batch_size}).rowcount
+            conn.commit()
+            print(f"  - {copied} rows copied (IDs up to {min(start + batch_size - 1, last_id)})")
+
+    # Índices creados después de la copia, mientras la tabla nueva aún no se usa
+    conn.execute(text(CREATE_INDEXES_SQL[table].format(table=new_table)))
+    conn.commit()
+
+    # Intercambio: solo bloquea la tabla durante la copia de las filas nuevas y el cambio de nombre.
+    # Se repasa el último lote por si alguna transacción con un ID anterior confirmó tarde.
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence(:table, 'id');"), {"table": table}).scalar()
+    conn.execute(text(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE;"))
+    conn.execute(
+        text(f"INSERT INTO {new_table} SELECT * FROM {table} WHERE id >= :start ON CONFLICT DO NOTHING;"),
+        {"start": (last_id or 0) - batch_size}
+    )
+    conn.execute(text(f"ALTER TABLE {table} RENAME TO {table}_unpartitioned;"))
+    conn.execute(text(f"ALTER TABLE {new_table} RENAME TO {table};"))
+    if sequence:
+        # Que la secuencia no se borre con la tabla original
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id;"))
+    conn.commit()
+    print(f"✅ Table '{table}' partitioned; drop '{table}_unpartitioned' once verified")
+
+def create_history_indexes(engine):
+    """
+    Crear idx_{table}_user_history en tablas ya particionadas sin bloquear las escrituras.
+
+    CREATE INDEX CONCURRENTLY no admite tablas particionadas: se crea el índice solo en
+    la tabla padre (inválido hasta tener el de todas las particiones), se crea en cada
+    partición de forma concurrente y se adjunta. Si se interrumpe, se puede volver a
+    ejecutar. Al final se borra el antiguo índice idx_{table}_user_id.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table in PARTITIONED_TABLES:
+            index_name = f"idx_{table}_user_history"
+            index_valid = conn.execute(
+                text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:index);"), {"index": index_name}
+            ).scalar()
+
+            if not index_valid:
+                print(f"🔄 Creating index '{index_name}' partition by partition...")
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON ONLY {table}({HISTORY_INDEX_COLUMNS});"))
+                partitions = conn.execute(text("""
+                    SELECT child.relname
+                    FROM pg_inherits
+                    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                    WHERE parent.relname = :table
+                    ORDER BY child.relname;
+                """), {"table": table}).scalars().all()
+                for partition in partitions:
+                    partition_index = f"{partition}_user_history_idx"
+                    # Restos inválidos de un CREATE INDEX CONCURRENTLY interrumpido
+                    invalid = conn.execute(
+                        text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:index);"),
+                        {"index": partition_index}
+                    ).scalar()
+                    if invalid:
+                        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {partition_index};"))
+                    conn.execute(text(
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} ON {partition}({HISTORY_INDEX_COLUMNS});"
+                    ))
+                    conn.execute(text(f"ALTER INDEX {index_name} ATTACH PARTITION {partition_index};"))
+                    print(f"  - {partition_index}")
+                print(f"✅ Index '{index_name}' created successfully")
+
+            conn.execute(text(f"DROP INDEX IF EXISTS idx_{table}_user_id;"))
+
 def verify_tables():
     """Verificar que todas las tablas necesarias existen"""
     print("\n🔍 Verifying database tables...")
@@ -121,6 +359,7 @@ def main():
         print("\n🎯 Next steps:")
         print("1. Run: python test_endpoints.py")
         print("2. Test the initial evaluation endpoint")
+        print("3. Schedule daily: python manage_partitions.py ensure && python manage_partitions.py archive")
     else:
         print("\n❌ Migration failed!")
         sys.exit(1)
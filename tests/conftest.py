@@ -0,0 +1,14 @@
+import os
+
+# Settings are read at import time; the tests never reach PostgreSQL, Redis or the LLM provider
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("POSTGRES_USER", "test")
+os.environ.setdefault("POSTGRES_PASSWORD", "test")
+os.environ.setdefault("POSTGRES_DB", "test")
+
+import pytest
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
@@ -0,0 +1,72 @@
+import pytest
+
+from app.domain.services.answer_guard import (
+    AnswerGuardService,
+    COPIED_QUESTION,
+    DUPLICATE,
+    EMPTY,
+    GIBBERISH,
+    NON_ENGLISH,
+    REPETITIVE,
+    TOO_SHORT
+)
+
+QUESTION = "What do you usually do in the evening?"
+
+GENUINE_ANSWERS = [
+    "TV and PC",
+    "My TV, PC",
+    "BBC, CNN and NPR",
+    "tv and pc",
+    "I watch the BBC",
+    "NYC is big",
+    "Yes, I do",
+    "I like it",
+    "I go by bus",
+    "Rhythm and blues",
+    "i play fútbol with my freinds",
+    "I usually watch TV in the evening",
+    "Me and my sister cook dinner, then we read books.",
+]
+
+DEGENERATE_ANSWERS = [
+    ("", EMPTY),
+    ("   ", EMPTY),
+    ("yes", TOO_SHORT),
+    ("ok ok", TOO_SHORT),
+    ("12345 !!!", TOO_SHORT),
+    ("sdfgh jklmn qwrtz", GIBBERISH),
+    ("Sdfgh jklmn", GIBBERISH),
+    ("what do you usually do in the evening", COPIED_QUESTION),
+    ("very good very good very good very good", REPETITIVE),
+    ("Me gusta mucho la música porque es divertida", NON_ENGLISH),
+    ("Je regarde la télé avec ma famille", NON_ENGLISH),
+    ("Мне нравится смотреть фильмы", NON_ENGLISH),
+    ("我喜欢看电视", NON_ENGLISH),
+]
+
+
+@pytest.fixture
+def guard():
+    return AnswerGuardService()
+
+
+@pytest.mark.parametrize("answer", GENUINE_ANSWERS)
+def test_genuine_short_answers_pass(guard, answer):
+    assert guard.check_answer(QUESTION, answer) is None
+
+
+@pytest.mark.parametrize("answer, verdict", DEGENERATE_ANSWERS)
+def test_degenerate_answers_are_flagged(guard, answer, verdict):
+    assert guard.check_answer(QUESTION, answer) == verdict
+
+
+def test_same_answer_to_several_questions_is_flagged_as_duplicate(guard):
+    questions = {1: QUESTION, 2: "Where did you go on holiday?", 3: "What is your job?"}
+    answers = {1: "I like to read books.", 2: "i like to read books", 3: "I am a nurse"}
+    assert guard.screen(questions, answers) == {1: DUPLICATE, 2: DUPLICATE}
+
+
+def test_screen_omits_genuine_answers(guard):
+    questions = {1: QUESTION, 2: "What is your job?"}
+    assert guard.screen(questions, {1: "TV and PC", 2: "sdfgh jklmn"}) == {2: GIBBERISH}
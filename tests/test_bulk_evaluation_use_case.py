@@ -0,0 +1,97 @@
+import json
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+
+from app.application.evaluation.use_cases.bulk_evaluation_use_case import BulkEvaluationUseCase
+from app.domain.services.level_calculator import LevelCalculatorService
+from app.infrastructure.external_services.local_file_batch_backend import LocalFileBatchBackend
+from app.infrastructure.external_services.openai_batch_backend import OpenAIBatchBackend
+
+pytestmark = pytest.mark.anyio
+
+QUESTIONS = {1: "What do you do at weekends?", 2: "Describe your home town."}
+SUBMISSIONS = [
+    {"user_id": 1, "answers": [
+        {"question_id": 1, "answer": "I play football with my friends."},
+        {"question_id": 2, "answer": "My town is small and quiet."}
+    ]},
+    {"user_id": 2, "answers": [
+        {"question_id": 1, "answer": "I read books."},
+        {"question_id": 2, "answer": "It is a big city near the sea."}
+    ]}
+]
+
+
+class DroppingEvaluator:
+    """Evaluates every answer except question 2 of user 2's submission, as an LLM dropping an item."""
+
+    async def evaluate_answers(self, questions_dict: Dict[int, str], answers_dict: Dict[int, str]) -> Dict[str, Any]:
+        dropped = 2 if answers_dict.get(1) == "I read books." else None
+        return {
+            "reason": "Simple sentences",
+            "feedback": [
+                {
+                    "question_id": question_id, "estimated_level": "B1",
+                    "scores": {"grammar": 6.0, "vocabulary": 6.0, "fluency": 6.0},
+                    "mistakes": [], "suggestions": []
+                }
+                for question_id in answers_dict if question_id != dropped
+            ]
+        }
+
+
+class FakeQuestionRepository:
+    async def find_by_ids(self, question_ids):
+        return [SimpleNamespace(id=question_id, question=QUESTIONS[question_id]) for question_id in question_ids]
+
+
+class FakeEvaluationRepository:
+    def __init__(self):
+        self.saved = []
+
+    async def save_many(self, evaluations):
+        self.saved += evaluations
+        return evaluations
+
+
+async def test_submission_with_a_dropped_answer_fails_without_persisting(tmp_path):
+    input_path = tmp_path / "submissions.jsonl"
+    input_path.write_text("\n".join(json.dumps(submission) for submission in SUBMISSIONS) + "\n")
+    evaluation_repository = FakeEvaluationRepository()
+    use_case = BulkEvaluationUseCase(
+        batch_backend=LocalFileBatchBackend(str(tmp_path / "batches"), evaluator=DroppingEvaluator()),
+        question_repository=FakeQuestionRepository(),
+        evaluation_repository=evaluation_repository,
+        level_calculator=LevelCalculatorService(),
+        poll_interval=0
+    )
+
+    summary = await use_case.execute(str(input_path), str(tmp_path / "checkpoint.json"))
+
+    assert (summary.completed, summary.failed) == (1, 1)
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert checkpoint["completed"] == ["line-1"]
+    assert checkpoint["failed"] == {"line-2": "LLM returned no evaluation for questions [2]"}
+    assert {evaluation.user_id for evaluation in evaluation_repository.saved} == {1}
+
+
+class FakeLLMService:
+    def __init__(self):
+        self.client = object()
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+async def test_openai_batch_backend_closes_only_the_service_it_owns():
+    shared_service = FakeLLMService()
+    await OpenAIBatchBackend(llm_service=shared_service).aclose()
+    assert not shared_service.closed
+
+    backend = OpenAIBatchBackend.__new__(OpenAIBatchBackend)
+    backend._owns_llm_service, backend.llm_service = True, FakeLLMService()
+    await backend.aclose()
+    assert backend.llm_service.closed
@@ -0,0 +1,156 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.evaluation.use_cases.evaluation_history_use_case import (
+    EvaluationHistoryUseCase,
+    _decode_cursor,
+    _encode_cursor
+)
+from app.core.config.database import Base
+from app.core.exceptions.evaluation_exceptions import EvaluationException
+from app.domain.entities.evaluation import Evaluation
+from app.domain.entities.final_evaluation import FinalEvaluation
+from app.infrastructure.persistence.archive.partition_archive import PartitionArchive
+from app.infrastructure.persistence.sqlalchemy.models.evaluation_model import EvaluationModel
+from app.infrastructure.persistence.sqlalchemy.models.final_evaluation_model import FinalEvaluationModel
+from app.infrastructure.persistence.sqlalchemy.repositories.evaluation_repository_impl import SqlAlchemyEvaluationRepository
+from app.infrastructure.persistence.sqlalchemy.repositories.final_evaluation_repository_impl import (
+    SqlAlchemyFinalEvaluationRepository
+)
+
+pytestmark = pytest.mark.anyio
+
+USER_ID = 7
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'history.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[EvaluationModel.__table__, FinalEvaluationModel.__table__])
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return PartitionArchive(str(tmp_path / "archive"))
+
+
+def evaluation(number: int, created_at: datetime, user_id: int = USER_ID) -> Evaluation:
+    return Evaluation(
+        user_id=user_id, question=f"Question {number}?", answer=f"Answer {number}", estimated_level="B1",
+        grammar=6.0, vocabulary=6.0, fluency=6.0, mistakes=[], suggestions=[],
+        created_at=created_at, dedup_key=f"key-{number}"
+    )
+
+
+def archived_evaluation(row_id: int, created_at: datetime) -> dict:
+    return {
+        "id": row_id, "user_id": USER_ID, "question": "Archived?", "answer": f"Archived {row_id}",
+        "estimated_level": "A2", "grammar": 4.0, "vocabulary": 4.0, "fluency": 4.0,
+        "mistakes": [], "suggestions": [], "created_at": created_at, "dedup_key": None
+    }
+
+
+async def walk(page_of, limit: int, fields=None) -> list:
+    """All items of a history, page by page, checking every page is full except the last."""
+    items, cursor = [], None
+    while True:
+        page = await page_of(USER_ID, limit, cursor, fields)
+        items += page.items
+        if page.next_cursor is None:
+            return items
+        assert len(page.items) == limit
+        cursor = page.next_cursor
+
+
+def test_cursor_round_trips_position():
+    created_at = datetime(2025, 5, 1, 10, 2, 3, 456789)
+    assert _decode_cursor(_encode_cursor({"created_at": created_at, "id": 1874})) == (created_at, 1874)
+
+    aware = created_at.replace(tzinfo=timezone.utc)
+    assert _decode_cursor(_encode_cursor({"created_at": aware, "id": 3})) == (aware, 3)
+    assert _decode_cursor(None) is None
+
+
+@pytest.mark.parametrize("cursor", ["garbage!", "WyJub3QgYSBkYXRlIiwgMV0", "e30"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(EvaluationException):
+        _decode_cursor(cursor)
+
+
+async def test_pages_are_stable_when_created_at_values_are_equal(session):
+    repository = SqlAlchemyEvaluationRepository(session)
+    start = datetime(2025, 5, 1, 10, 0)
+    # Five rows per timestamp, another user's rows in between
+    await repository.save_many_deduplicated(
+        [evaluation(number, start + timedelta(minutes=number // 5)) for number in range(25)]
+        + [evaluation(100 + number, start, user_id=8) for number in range(3)]
+    )
+    await session.commit()
+    use_case = EvaluationHistoryUseCase(repository, SqlAlchemyFinalEvaluationRepository(session))
+
+    items = await walk(use_case.initial_history, 7)
+
+    positions = [(item["created_at"], item["id"]) for item in items]
+    assert len(items) == 25
+    assert len(set(positions)) == 25
+    assert positions == sorted(positions, reverse=True)
+    assert {item["user_id"] for item in items} == {USER_ID}
+
+
+async def test_fields_limit_the_returned_columns(session):
+    repository = SqlAlchemyEvaluationRepository(session)
+    await repository.save_many_deduplicated([evaluation(number, datetime(2025, 5, 1)) for number in range(3)])
+    await session.commit()
+    use_case = EvaluationHistoryUseCase(repository, SqlAlchemyFinalEvaluationRepository(session))
+
+    page = await use_case.initial_history(USER_ID, 2, fields="estimated_level, answer")
+    assert [set(item) for item in page.items] == [{"created_at", "id", "estimated_level", "answer"}] * 2
+    with pytest.raises(EvaluationException):
+        await use_case.initial_history(USER_ID, 2, fields="estimated_level,dedup_key")
+
+
+async def test_page_runs_past_the_last_stored_row_into_the_archive(session, archive):
+    writer = archive.writer("evaluations", date(2024, 1, 1))
+    for row_id in range(1, 6):
+        writer.write(archived_evaluation(row_id, datetime(2024, 1, 10)))
+    writer.commit()
+
+    repository = SqlAlchemyEvaluationRepository(session, archive=archive)
+    await repository.save_many_deduplicated([evaluation(number, datetime(2025, 5, 1)) for number in range(4)])
+    await session.commit()
+    use_case = EvaluationHistoryUseCase(repository, SqlAlchemyFinalEvaluationRepository(session, archive=archive))
+
+    first = await use_case.initial_history(USER_ID, 6, fields="answer")
+    assert [item["answer"] for item in first.items] == [
+        "Answer 3", "Answer 2", "Answer 1", "Answer 0", "Archived 5", "Archived 4"
+    ]
+    second = await use_case.initial_history(USER_ID, 6, first.next_cursor, fields="answer")
+    assert [item["answer"] for item in second.items] == ["Archived 3", "Archived 2", "Archived 1"]
+    assert second.next_cursor is None
+
+
+async def test_final_history_continues_into_the_archive(session, archive):
+    writer = archive.writer("final_evaluations", date(2024, 1, 1))
+    writer.write({
+        "id": 1, "user_id": USER_ID, "initial_level": "A2", "final_level": "B1", "reason": "Archived",
+        "created_at": datetime(2024, 1, 10, tzinfo=timezone.utc), "updated_at": None, "dedup_key": None
+    })
+    writer.commit()
+
+    repository = SqlAlchemyFinalEvaluationRepository(session, archive=archive)
+    await repository.save_many_deduplicated([
+        FinalEvaluation(user_id=USER_ID, final_level="B2", reason=f"Stored {number}",
+                        created_at=datetime(2025, 5, number + 1, tzinfo=timezone.utc), dedup_key=f"final-{number}")
+        for number in range(2)
+    ])
+    await session.commit()
+    use_case = EvaluationHistoryUseCase(SqlAlchemyEvaluationRepository(session, archive=archive), repository)
+
+    items = await walk(use_case.final_history, 2, "reason")
+    assert [item["reason"] for item in items] == ["Stored 1", "Stored 0", "Archived"]
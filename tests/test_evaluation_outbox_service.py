@@ -0,0 +1,171 @@
+import asyncio
+from typing import List
+
+import fakeredis
+import pytest
+
+from app.application.evaluation.services.evaluation_outbox_service import EvaluationOutboxService
+from app.core.exceptions.evaluation_exceptions import CacheException
+from app.domain.entities.evaluation import Evaluation
+from app.domain.entities.final_evaluation import FinalEvaluation
+from app.infrastructure.persistence.redis.evaluation_outbox import RedisEvaluationOutbox
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeEvaluationRepository:
+    """Stores rows once per (dedup_key, created_at), like the ON CONFLICT DO NOTHING insert."""
+
+    def __init__(self):
+        self.rows = {}
+        self.failing_answers = set()
+        self.available = True
+
+    async def save_many_deduplicated(self, entities: List) -> None:
+        if not self.available:
+            raise ConnectionError("database unavailable")
+        if any(getattr(entity, "answer", None) in self.failing_answers for entity in entities):
+            raise ValueError("row rejected")
+        for entity in entities:
+            self.rows.setdefault((entity.dedup_key, entity.created_at), entity)
+
+
+@pytest.fixture
+def outbox():
+    outbox = RedisEvaluationOutbox()
+    outbox.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return outbox
+
+
+@pytest.fixture
+def evaluations():
+    return FakeEvaluationRepository()
+
+
+@pytest.fixture
+def final_evaluations():
+    return FakeEvaluationRepository()
+
+
+def make_service(outbox, evaluations, final_evaluations, **options) -> EvaluationOutboxService:
+    async def database_health_check() -> bool:
+        return evaluations.available
+
+    options.setdefault("claim_idle", 0.05)
+    return EvaluationOutboxService(
+        outbox, evaluations, final_evaluations,
+        consumer_name="test", block_ms=None, stats_interval=0.0,
+        database_health_check=database_health_check, **options
+    )
+
+
+def evaluation(answer: str = "I like music") -> Evaluation:
+    return Evaluation(
+        user_id=1, question="What do you like?", answer=answer, estimated_level="B1",
+        grammar=6.0, vocabulary=6.0, fluency=6.0, mistakes=["like -> likes"], suggestions=[]
+    )
+
+
+async def dead_letters(outbox) -> List[dict]:
+    return [fields for _, fields in await outbox.redis_client.xrange(outbox.DEAD_LETTER_KEY)]
+
+
+async def test_queued_results_are_written_and_acknowledged(outbox, evaluations, final_evaluations):
+    service = make_service(outbox, evaluations, final_evaluations)
+    await service.save_evaluations([evaluation(), evaluation("I play chess")])
+    await service.save_final_evaluation(FinalEvaluation(user_id=1, final_level="B2", initial_level="B1"))
+
+    assert await service.consume_once() == 2
+    assert len(evaluations.rows) == 2
+    assert len(final_evaluations.rows) == 1
+    assert (await outbox.stats())["backlog"] == 0
+
+
+async def test_batch_written_but_not_acknowledged_is_deduplicated_on_replay(
+    outbox, evaluations, final_evaluations, monkeypatch
+):
+    service = make_service(outbox, evaluations, final_evaluations)
+    await service.save_evaluations([evaluation(), evaluation("I play chess")])
+
+    async def lost_ack(messages):
+        raise CacheException("connection lost")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(outbox, "ack", lost_ack)
+        with pytest.raises(CacheException):
+            await service.consume_once()
+    assert len(evaluations.rows) == 2
+
+    await asyncio.sleep(0.1)
+    assert await service.consume_once() == 1
+    assert len(evaluations.rows) == 2
+    assert (await outbox.stats())["backlog"] == 0
+
+
+async def test_unacknowledged_messages_are_reclaimed_after_claim_idle(outbox, evaluations, final_evaluations):
+    crashed = make_service(outbox, evaluations, final_evaluations, claim_idle=0.2)
+    await crashed.save_evaluations([evaluation()])
+    # Delivered to a consumer that never acknowledges them
+    assert len(await outbox.read("crashed", 10, None)) == 1
+
+    service = make_service(outbox, evaluations, final_evaluations, claim_idle=0.2)
+    assert await service.consume_once() == 0
+    assert evaluations.rows == {}
+
+    await asyncio.sleep(0.3)
+    assert await service.consume_once() == 1
+    assert len(evaluations.rows) == 1
+
+
+async def test_message_failing_alone_is_dead_lettered_at_max_deliveries(outbox, evaluations, final_evaluations):
+    service = make_service(outbox, evaluations, final_evaluations, max_deliveries=3)
+    evaluations.failing_answers.add("poison")
+    await service.save_evaluations([evaluation("poison")])
+
+    for _ in range(3):
+        assert await service.consume_once() == 0
+        await asyncio.sleep(0.1)
+
+    letters = await dead_letters(outbox)
+    assert [(letter["reason"], letter["deliveries"]) for letter in letters] == [("write_failed", "3")]
+    assert (await outbox.stats())["backlog"] == 0
+
+
+async def test_messages_are_kept_while_the_database_is_unavailable(outbox, evaluations, final_evaluations):
+    service = make_service(outbox, evaluations, final_evaluations, max_deliveries=2)
+    evaluations.available = False
+    await service.save_evaluations([evaluation()])
+
+    for _ in range(4):
+        assert await service.consume_once() == 0
+        await asyncio.sleep(0.1)
+    assert await dead_letters(outbox) == []
+
+    evaluations.available = True
+    assert await service.consume_once() == 1
+    assert len(evaluations.rows) == 1
+
+
+async def test_undecodable_messages_are_dead_lettered(outbox, evaluations, final_evaluations):
+    service = make_service(outbox, evaluations, final_evaluations)
+    await outbox.redis_client.xadd(outbox.STREAM_KEY, {"kind": "initial_evaluations", "payload": "{not json"})
+    await outbox.publish("unknown_kind", {})
+
+    assert await service.consume_once() == 0
+    assert sorted(letter["reason"] for letter in await dead_letters(outbox)) == ["undecodable", "undecodable"]
+    assert (await outbox.stats())["backlog"] == 0
+
+
+async def test_results_are_written_directly_when_the_outbox_is_unavailable(
+    outbox, evaluations, final_evaluations, monkeypatch
+):
+    async def unavailable(kind, payload):
+        raise CacheException("redis down")
+
+    monkeypatch.setattr(outbox, "publish", unavailable)
+    service = make_service(outbox, evaluations, final_evaluations)
+    await service.save_evaluations([evaluation()])
+    await service.save_final_evaluation(FinalEvaluation(user_id=1, final_level="B2"))
+
+    assert [row.answer for row in evaluations.rows.values()] == ["I like music"]
+    assert [row.final_level for row in final_evaluations.rows.values()] == ["B2"]
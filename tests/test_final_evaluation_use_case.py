@@ -0,0 +1,49 @@
+import pytest
+
+from app.application.evaluation.dtos.final_evaluation_dto import FinalAnswerDTO, FinalEvaluationRequestDTO
+from app.application.evaluation.use_cases.final_evaluation_use_case import FinalEvaluationUseCase
+from app.core.exceptions.evaluation_exceptions import CacheException
+from app.domain.services.level_calculator import LevelCalculatorService
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeLLM:
+    async def final_evaluation(self, previous_evaluation, new_answers):
+        return {"final_level": "B2", "reason": "Consistent complex sentences"}
+
+
+class UnavailableClearMemoryService:
+    """Memory whose cleanup fails, as with Redis going down after the result is saved."""
+
+    async def get_evaluation_context(self, user_id):
+        return {"level": "B1", "reason": "Simple sentences", "feedback": [], "next_questions": ["Why?"]}
+
+    async def clear_evaluation_context(self, user_id):
+        raise CacheException("Failed to clear evaluation context: connection refused")
+
+
+class FakeFinalEvaluationRepository:
+    def __init__(self):
+        self.saved = []
+
+    async def save(self, final_evaluation):
+        self.saved.append(final_evaluation)
+        return final_evaluation
+
+
+async def test_failed_context_cleanup_does_not_fail_a_saved_final_evaluation():
+    repository = FakeFinalEvaluationRepository()
+    use_case = FinalEvaluationUseCase(
+        llm_service=FakeLLM(),
+        memory_service=UnavailableClearMemoryService(),
+        level_calculator=LevelCalculatorService(),
+        final_evaluation_repository=repository
+    )
+
+    response = await use_case.execute(
+        FinalEvaluationRequestDTO(user_id=1, answers=[FinalAnswerDTO(answer="Because I like it.")])
+    )
+
+    assert response.final_level == "B2"
+    assert [(saved.initial_level, saved.final_level) for saved in repository.saved] == [("B1", "B2")]
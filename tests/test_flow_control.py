@@ -0,0 +1,248 @@
+import asyncio
+
+import pytest
+
+from app.core.deadline import deadline_scope
+from app.core.exceptions.evaluation_exceptions import (
+    LLMRateLimitException,
+    LLMTimeoutException,
+    LLMUnavailableException
+)
+from app.infrastructure.external_services import flow_control
+from app.infrastructure.external_services.adaptive_concurrency_llm_service import AdaptiveConcurrencyLLMService
+from app.infrastructure.external_services.flow_control import (
+    AIMDLimiter,
+    CircuitBreaker,
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(flow_control.time, "monotonic", clock)
+    return clock
+
+
+def open_breaker(clock, **options) -> CircuitBreaker:
+    breaker = CircuitBreaker(**options)
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+    return breaker
+
+
+# Circuit breaker
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30.0)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CIRCUIT_CLOSED
+
+    breaker.before_call()
+    breaker.record_success()
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CIRCUIT_CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+
+
+def test_open_breaker_rejects_calls_until_recovery_timeout(clock):
+    breaker = open_breaker(clock, failure_threshold=2, recovery_timeout=30.0)
+    clock.now += 10
+    with pytest.raises(LLMUnavailableException) as rejected:
+        breaker.before_call()
+    assert rejected.value.retry_after == pytest.approx(20.0)
+
+    clock.now += 20
+    assert breaker.before_call() is not None
+    assert breaker.state == CIRCUIT_HALF_OPEN
+
+
+def test_half_open_breaker_lets_one_probe_through(clock):
+    breaker = open_breaker(clock, failure_threshold=1, recovery_timeout=5.0)
+    clock.now += 5
+    breaker.before_call()
+    with pytest.raises(LLMUnavailableException):
+        breaker.before_call()
+
+
+def test_probe_outcome_closes_or_reopens_the_breaker(clock):
+    breaker = open_breaker(clock, failure_threshold=3, recovery_timeout=5.0)
+    clock.now += 5
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+
+    clock.now += 5
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.before_call() is None
+
+
+def test_abandoned_probe_frees_the_half_open_slot(clock):
+    breaker = open_breaker(clock, failure_threshold=1, recovery_timeout=5.0)
+    clock.now += 5
+    probe = breaker.before_call()
+    breaker.record_abandoned(probe)
+    assert breaker.before_call() is not None
+
+
+def test_abandoned_ordinary_call_keeps_the_probe_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5.0)
+    # Started while closed, e.g. a hedge that later loses
+    ordinary = breaker.before_call()
+    breaker.record_failure()
+    clock.now += 5
+
+    probe = breaker.before_call()
+    assert probe is not None
+    breaker.record_abandoned(ordinary)
+    with pytest.raises(LLMUnavailableException):
+        breaker.before_call()
+
+    breaker.record_abandoned(probe)
+    assert breaker.before_call() is not None
+
+
+def test_abandoned_stale_probe_keeps_the_current_probe_slot(clock):
+    breaker = open_breaker(clock, failure_threshold=1, recovery_timeout=5.0)
+    clock.now += 5
+    stale = breaker.before_call()
+    breaker.record_failure()
+    clock.now += 5
+
+    breaker.before_call()
+    breaker.record_abandoned(stale)
+    with pytest.raises(LLMUnavailableException):
+        breaker.before_call()
+
+
+# AIMD limiter
+
+@pytest.mark.anyio
+async def test_limiter_grows_additively_on_fast_successes():
+    limiter = AIMDLimiter(initial_limit=4, max_limit=5, latency_threshold=1.0)
+    for _ in range(4):
+        await limiter.acquire()
+        await limiter.release(0.1, overloaded=False)
+    assert limiter.limit == pytest.approx(5.0, abs=0.1)
+
+    for _ in range(20):
+        await limiter.acquire()
+        await limiter.release(0.1, overloaded=False)
+    assert limiter.limit == 5.0
+
+
+@pytest.mark.anyio
+async def test_limiter_shrinks_multiplicatively_on_overload_and_slow_calls(clock):
+    limiter = AIMDLimiter(initial_limit=16, min_limit=2, backoff_ratio=0.5, latency_threshold=1.0, decrease_cooldown=1.0)
+    await limiter.acquire()
+    await limiter.release(None, overloaded=True)
+    assert limiter.limit == 8.0
+
+    clock.now += 1
+    await limiter.acquire()
+    await limiter.release(5.0, overloaded=False)
+    assert limiter.limit == 4.0
+
+    for _ in range(3):
+        clock.now += 1
+        await limiter.acquire()
+        await limiter.release(None, overloaded=True)
+    assert limiter.limit == 2.0
+
+
+@pytest.mark.anyio
+async def test_limiter_counts_a_burst_of_overloads_within_the_cooldown_once(clock):
+    limiter = AIMDLimiter(initial_limit=16, backoff_ratio=0.5, decrease_cooldown=1.0)
+    for _ in range(5):
+        await limiter.acquire()
+    for _ in range(5):
+        await limiter.release(None, overloaded=True)
+    assert limiter.limit == 8.0
+
+    clock.now += 1
+    await limiter.acquire()
+    await limiter.release(None, overloaded=True)
+    assert limiter.limit == 4.0
+
+
+@pytest.mark.anyio
+async def test_limiter_queues_calls_beyond_the_limit():
+    limiter = AIMDLimiter(initial_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done() and limiter.waiting == 1
+
+    await limiter.release(0.1, overloaded=False)
+    await asyncio.wait_for(waiter, 1.0)
+    assert limiter.in_flight == 1 and limiter.waiting == 0
+
+
+@pytest.mark.anyio
+async def test_limiter_gives_up_waiting_at_the_deadline():
+    limiter = AIMDLimiter(initial_limit=1)
+    await limiter.acquire()
+    with deadline_scope(0.05):
+        with pytest.raises(LLMTimeoutException):
+            await limiter.acquire()
+    assert limiter.waiting == 0
+
+
+# Decorator
+
+class SlowLLM:
+    def __init__(self):
+        self.error = None
+
+    async def evaluate_single_answer(self, question, answer):
+        if self.error:
+            raise self.error
+        await asyncio.sleep(10)
+
+
+@pytest.mark.anyio
+async def test_cancelled_ordinary_call_does_not_admit_a_second_probe():
+    inner = SlowLLM()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    service = AdaptiveConcurrencyLLMService(inner, AIMDLimiter(initial_limit=8), breaker)
+
+    # Started while closed, cancelled once the probe is running (a losing hedge)
+    ordinary = asyncio.ensure_future(service.evaluate_single_answer("q", "a"))
+    await asyncio.sleep(0.01)
+    inner.error = LLMRateLimitException("rate limited")
+    with pytest.raises(LLMRateLimitException):
+        await service.evaluate_single_answer("q", "a")
+    assert breaker.state == CIRCUIT_OPEN
+
+    await asyncio.sleep(0.06)
+    inner.error = None
+    probe = asyncio.ensure_future(service.evaluate_single_answer("q", "a"))
+    await asyncio.sleep(0.01)
+    ordinary.cancel()
+    await asyncio.gather(ordinary, return_exceptions=True)
+
+    with pytest.raises(LLMUnavailableException):
+        await service.evaluate_single_answer("q", "a")
+    probe.cancel()
+    await asyncio.gather(probe, return_exceptions=True)
+    assert service.limiter.in_flight == 0
@@ -0,0 +1,267 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+
+from app.application.evaluation.dtos.initial_evaluation_dto import AnswerDTO, InitialEvaluationRequestDTO
+from app.application.evaluation.use_cases.initial_evaluation_use_case import (
+    InitialEvaluationUseCase,
+    PER_ANSWER_STRATEGY
+)
+from app.core.deadline import deadline_scope
+from app.core.exceptions.evaluation_exceptions import (
+    EvaluationException,
+    InvalidResponseException,
+    LLMException,
+    LLMRateLimitException
+)
+from app.domain.services.level_calculator import LevelCalculatorService
+
+pytestmark = pytest.mark.anyio
+
+LLM_LATENCY = 0.2
+QUESTIONS = {1: "What do you do at weekends?", 2: "Describe your home town."}
+GENERATED_QUESTIONS = [f"Generated question {number}?" for number in range(1, 6)]
+
+
+class FakeLLM:
+    """Evaluation without next questions (as with the current prompt), each call taking LLM_LATENCY."""
+
+    def __init__(self):
+        self.next_question_calls = 0
+
+    async def evaluate_answers(self, questions_dict: Dict[int, str], answers_dict: Dict[int, str]) -> Dict[str, Any]:
+        await asyncio.sleep(LLM_LATENCY)
+        return {
+            "reason": "Simple sentences",
+            "feedback": [
+                {
+                    "question_id": question_id, "estimated_level": "B1",
+                    "scores": {"grammar": 6.0, "vocabulary": 6.0, "fluency": 6.0},
+                    "mistakes": [], "suggestions": []
+                }
+                for question_id in answers_dict
+            ]
+        }
+
+    async def stream_evaluation(self, questions_dict, answers_dict) -> AsyncIterator[Dict[str, Any]]:
+        result = await self.evaluate_answers(questions_dict, answers_dict)
+        yield {"type": "reason", "data": result["reason"]}
+        for feedback in result["feedback"]:
+            yield {"type": "feedback", "data": feedback}
+        yield {"type": "feedback_end", "data": result["feedback"]}
+        yield {"type": "next_questions", "data": []}
+
+    async def generate_next_questions(self, questions_dict, answers_dict) -> List[str]:
+        self.next_question_calls += 1
+        await asyncio.sleep(LLM_LATENCY)
+        return list(GENERATED_QUESTIONS)
+
+
+class FailingNextQuestionsLLM(FakeLLM):
+    """Next-question generation fails after LLM_LATENCY."""
+
+    async def generate_next_questions(self, questions_dict, answers_dict) -> List[str]:
+        await super().generate_next_questions(questions_dict, answers_dict)
+        raise LLMException("Failed to generate next questions")
+
+
+class FailingEvaluationLLM(FakeLLM):
+    """Evaluation fails halfway through next-question generation, which records whether it was cancelled."""
+
+    def __init__(self):
+        super().__init__()
+        self.next_questions_cancelled = False
+
+    async def evaluate_answers(self, questions_dict, answers_dict) -> Dict[str, Any]:
+        await asyncio.sleep(LLM_LATENCY / 2)
+        raise LLMException("Failed to evaluate answers")
+
+    async def generate_next_questions(self, questions_dict, answers_dict) -> List[str]:
+        try:
+            return await super().generate_next_questions(questions_dict, answers_dict)
+        except asyncio.CancelledError:
+            self.next_questions_cancelled = True
+            raise
+
+
+class FailingSingleAnswerLLM(FakeLLM):
+    """Per-answer evaluation that always fails with the given error, counting provider calls."""
+
+    def __init__(self, error: Exception):
+        super().__init__()
+        self.error = error
+        self.single_answer_calls = 0
+
+    async def evaluate_single_answer(self, question: str, answer: str) -> Dict[str, Any]:
+        self.single_answer_calls += 1
+        raise self.error
+
+
+class FakeQuestionRepository:
+    async def find_by_ids(self, question_ids):
+        return [SimpleNamespace(id=question_id, question=QUESTIONS[question_id]) for question_id in question_ids]
+
+
+class FakeMemoryService:
+    async def save_evaluation_context(self, user_id, context):
+        pass
+
+
+class FakeEvaluationRepository:
+    def __init__(self):
+        self.saved = []
+
+    async def save_many(self, evaluations):
+        self.saved += evaluations
+        return evaluations
+
+
+class FakeQuestionPool:
+    """Pool that comes up short, as after a partially failed refill."""
+
+    count = 5
+
+    def __init__(self, questions: List[str]):
+        self.questions = questions
+
+    async def next_questions(self, user_id: int, level: str) -> List[str]:
+        return list(self.questions)
+
+
+def make_use_case(llm: FakeLLM, question_pool=None, evaluation_repository=None, **options) -> InitialEvaluationUseCase:
+    return InitialEvaluationUseCase(
+        llm_service=llm,
+        memory_service=FakeMemoryService(),
+        question_repository=FakeQuestionRepository(),
+        evaluation_repository=evaluation_repository or FakeEvaluationRepository(),
+        level_calculator=LevelCalculatorService(),
+        question_pool=question_pool,
+        **options
+    )
+
+
+def request() -> InitialEvaluationRequestDTO:
+    return InitialEvaluationRequestDTO(user_id=1, answers=[
+        AnswerDTO(question_id=1, answer="I play football with my friends."),
+        AnswerDTO(question_id=2, answer="My town is small and quiet.")
+    ])
+
+
+async def test_without_pool_next_questions_are_generated_alongside_the_evaluation():
+    llm = FakeLLM()
+    started = time.monotonic()
+    response = await make_use_case(llm).execute(request())
+
+    assert time.monotonic() - started < 1.5 * LLM_LATENCY
+    assert response.next_questions == GENERATED_QUESTIONS
+    assert llm.next_question_calls == 1
+
+
+async def test_without_pool_streamed_next_questions_are_generated_alongside_the_evaluation():
+    llm = FakeLLM()
+    started = time.monotonic()
+    events = [event async for event in make_use_case(llm).execute_stream(request())]
+
+    assert time.monotonic() - started < 1.5 * LLM_LATENCY
+    assert [event["event"] for event in events] == ["feedback", "feedback", "evaluation", "next_questions"]
+    assert events[-1]["data"] == GENERATED_QUESTIONS
+    assert llm.next_question_calls == 1
+
+
+async def test_short_pool_is_topped_up_with_generated_questions():
+    llm = FakeLLM()
+    pooled = ["Pooled question 1?", "Generated question 1?"]
+    response = await make_use_case(llm, FakeQuestionPool(pooled)).execute(request())
+
+    assert response.next_questions == [
+        "Pooled question 1?", "Generated question 1?",
+        "Generated question 2?", "Generated question 3?", "Generated question 4?"
+    ]
+
+
+async def test_full_pool_needs_no_generation():
+    llm = FakeLLM()
+    pooled = [f"Pooled question {number}?" for number in range(1, 6)]
+    response = await make_use_case(llm, FakeQuestionPool(pooled)).execute(request())
+
+    assert response.next_questions == pooled
+    assert llm.next_question_calls == 0
+
+
+async def test_failed_next_question_generation_keeps_the_evaluation():
+    llm = FailingNextQuestionsLLM()
+    evaluation_repository = FakeEvaluationRepository()
+    response = await make_use_case(llm, evaluation_repository=evaluation_repository).execute(request())
+
+    assert response.level == "B1"
+    assert response.next_questions == []
+    assert len(evaluation_repository.saved) == len(QUESTIONS)
+    # The failed parallel generation is not attempted again after the evaluation
+    assert llm.next_question_calls == 1
+
+
+async def test_failed_next_question_generation_keeps_the_streamed_evaluation():
+    llm = FailingNextQuestionsLLM()
+    evaluation_repository = FakeEvaluationRepository()
+    use_case = make_use_case(llm, evaluation_repository=evaluation_repository)
+    events = [event async for event in use_case.execute_stream(request())]
+
+    assert [event["event"] for event in events] == ["feedback", "feedback", "evaluation", "next_questions"]
+    assert events[-1]["data"] == []
+    assert len(evaluation_repository.saved) == len(QUESTIONS)
+
+
+async def test_failed_top_up_falls_back_to_the_pooled_questions():
+    pooled = ["Pooled question 1?", "Pooled question 2?"]
+    response = await make_use_case(FailingNextQuestionsLLM(), FakeQuestionPool(pooled)).execute(request())
+
+    assert response.next_questions == pooled
+
+
+@pytest.mark.parametrize("strategy", ["batch", PER_ANSWER_STRATEGY])
+async def test_failed_evaluation_cancels_next_question_generation(strategy):
+    llm = FailingEvaluationLLM()
+    llm.evaluate_single_answer = lambda question, answer: llm.evaluate_answers({}, {})
+
+    with pytest.raises(EvaluationException):
+        await make_use_case(llm, evaluation_strategy=strategy).execute(request())
+
+    await asyncio.sleep(0)
+    assert llm.next_questions_cancelled
+
+
+async def test_transient_failures_are_not_retried_again_per_answer():
+    llm = FailingSingleAnswerLLM(LLMRateLimitException("Rate limited"))
+    use_case = make_use_case(llm, evaluation_strategy=PER_ANSWER_STRATEGY)
+
+    with pytest.raises(EvaluationException):
+        await use_case.execute(request())
+
+    # One provider call per answer: the LLM service owns transient retries
+    assert llm.single_answer_calls == len(QUESTIONS)
+
+
+async def test_invalid_responses_are_retried_per_answer():
+    llm = FailingSingleAnswerLLM(InvalidResponseException("Malformed JSON"))
+    use_case = make_use_case(llm, evaluation_strategy=PER_ANSWER_STRATEGY, max_item_retries=1)
+
+    with pytest.raises(EvaluationException):
+        await use_case.execute(request())
+
+    assert llm.single_answer_calls == 2 * len(QUESTIONS)
+
+
+async def test_invalid_response_retries_stop_at_the_deadline():
+    llm = FailingSingleAnswerLLM(InvalidResponseException("Malformed JSON"))
+    use_case = make_use_case(llm, evaluation_strategy=PER_ANSWER_STRATEGY)
+
+    started = time.monotonic()
+    with deadline_scope(0.3), pytest.raises(EvaluationException):
+        await use_case.execute(request())
+
+    # The first backoff (0.5s) does not fit in the remaining time
+    assert time.monotonic() - started < 0.3
+    assert llm.single_answer_calls == len(QUESTIONS)
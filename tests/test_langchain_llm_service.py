@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from app.core.exceptions.evaluation_exceptions import InvalidResponseException
+from app.infrastructure.external_services.langchain_llm_service import LangchainLLMService
+
+pytestmark = pytest.mark.anyio
+
+QUESTIONS = {
+    1: "What do you do at weekends?",
+    2: "Describe your home town.",
+    3: "What is your favourite food?"
+}
+ANSWERS = {
+    1: "I play football with my friends.",
+    2: "My town is small and quiet.",
+    3: "I like pasta."
+}
+SCORES = {"grammar": 6.0, "vocabulary": 6.0, "fluency": 6.0}
+
+
+def item(level: str = "B1", **fields):
+    return {"estimated_level": level, "scores": dict(SCORES), "mistakes": [], "suggestions": [], **fields}
+
+
+@pytest.fixture
+def service():
+    return LangchainLLMService(client=object())
+
+
+@pytest.mark.parametrize("result, expected_feedback_levels, expected_reason, repaired", [
+    ({"level": "B1", "reason": "Simple", "feedback": [item(question_id=1)]}, ["B1"], "Simple", False),
+    ({"evaluation": {"level": "B1", "reason": "Simple", "feedback": [item(question_id=1)]}}, ["B1"], "Simple", False),
+    ({"level": "B1", "reason": "Simple", "feedback": [item("b2+", question_id="1")]}, ["B2"], "Simple", True),
+    ({"level": "B1", "reason": "Simple", "feedback": [item(question_id=1), item("fluent", question_id=2)]}, ["B1"], "Simple", True),
+    ({"level": "B1", "reason": "Simple", "feedback": "none"}, [], "Simple", True),
+    ({"level": "B1", "reason": " ", "feedback": [item(question_id=1)]}, ["B1"], None, True),
+])
+def test_repair_evaluation(service, result, expected_feedback_levels, expected_reason, repaired):
+    evaluation, was_repaired = service._repair_evaluation(result)
+
+    assert [feedback["estimated_level"] for feedback in evaluation["feedback"]] == expected_feedback_levels
+    assert evaluation["reason"] == expected_reason
+    assert was_repaired == repaired
+
+
+@pytest.mark.parametrize("result", [
+    ["B1"],
+    {"answer": "B1"},
+    {"evaluation": {"answer": "B1"}},
+])
+def test_repair_evaluation_rejects_unexpected_structures(service, result):
+    with pytest.raises(InvalidResponseException):
+        service._repair_evaluation(result)
+
+
+@pytest.mark.parametrize("feedback, expected_levels", [
+    # By question_id, in any order and also as a string
+    ([item("A2", question_id=3), item("B1", question_id="1"), item("B2", question_id=2)], {1: "B1", 2: "B2", 3: "A2"}),
+    # By echoed question text, ignoring case and whitespace
+    (
+        [item("A2", question="what is your  favourite food?"), item("B1", question=QUESTIONS[1]), item("B2", question=QUESTIONS[2])],
+        {1: "B1", 2: "B2", 3: "A2"}
+    ),
+    # By echoed answer text
+    ([item("B2", answer=ANSWERS[2]), item("A2", answer=ANSWERS[3]), item("B1", answer=ANSWERS[1])], {1: "B1", 2: "B2", 3: "A2"}),
+    # By position, for items with neither a known id nor an echoed text
+    ([item("B1"), item("B2", question_id=99), item("A2")], {1: "B1", 2: "B2", 3: "A2"}),
+    # Id first, then text, then position for what is left
+    ([item("A2"), item("B2", question_id=2), item("B1", answer=ANSWERS[1])], {1: "B1", 2: "B2", 3: "A2"}),
+    # A repeated id keeps the first item; the other falls back to position
+    ([item("B1", question_id=1), item("A2", question_id=1), item("B2", question_id=2)], {1: "B1", 2: "B2", 3: "A2"}),
+    # A dropped item leaves its answer unmatched
+    ([item("B1", question_id=1), item("A2", question_id=3)], {1: "B1", 3: "A2"}),
+])
+def test_align_feedback(service, feedback, expected_levels):
+    aligned = service._align_feedback(feedback, QUESTIONS, ANSWERS)
+
+    assert {question_id: aligned_item["estimated_level"] for question_id, aligned_item in aligned.items()} == expected_levels
+    for question_id, aligned_item in aligned.items():
+        assert (aligned_item["question_id"], aligned_item["question"], aligned_item["answer"]) == (
+            question_id, QUESTIONS[question_id], ANSWERS[question_id]
+        )
+
+
+async def test_dropped_feedback_item_is_re_requested_once(service):
+    content = json.dumps({
+        "level": "B1",
+        "reason": "Simple sentences",
+        # The item for question 2 is missing its scores, so it cannot be repaired locally
+        "feedback": [item("B1", question_id=1), {"question_id": 2, "estimated_level": "B2"}, item("A2", question_id=3)]
+    })
+    rerequests = []
+
+    async def complete(messages, prompt_version, parse, *args, **kwargs):
+        return parse(content)
+
+    async def evaluate_single_answer(question, answer):
+        rerequests.append((question, answer))
+        return item("B2")
+
+    service._complete = complete
+    service.evaluate_single_answer = evaluate_single_answer
+
+    result = await service.evaluate_answers(QUESTIONS, ANSWERS)
+
+    assert rerequests == [(QUESTIONS[2], ANSWERS[2])]
+    assert [(feedback["question_id"], feedback["estimated_level"]) for feedback in result["feedback"]] == [
+        (1, "B1"), (2, "B2"), (3, "A2")
+    ]
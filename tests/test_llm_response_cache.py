@@ -0,0 +1,55 @@
+import time
+
+import fakeredis
+import pytest
+
+from app.infrastructure.persistence.redis.llm_response_cache import RedisLLMResponseCache, cache_evictions
+
+pytestmark = pytest.mark.anyio
+
+TTL = 60
+
+
+@pytest.fixture
+def cache():
+    cache = RedisLLMResponseCache(ttl=TTL, max_entries=2)
+    cache.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return cache
+
+
+async def lru_members(cache):
+    return await cache.redis_client.zrange(cache.LRU_KEY, 0, -1)
+
+
+async def test_set_prunes_members_of_expired_entries_before_enforcing_the_bound(cache):
+    # An entry last used more than a TTL ago has expired, but its member is still indexed
+    await cache.redis_client.zadd(cache.LRU_KEY, {"expired": time.time() - TTL - 10})
+    evictions = cache_evictions.value()
+
+    await cache.set("first", "response 1")
+    await cache.set("second", "response 2")
+
+    # Pruned, not evicted: only live entries count against the size bound
+    assert cache_evictions.value() == evictions
+    assert sorted(await lru_members(cache)) == ["first", "second"]
+    assert await cache.get("first") == "response 1"
+    assert await cache.get("second") == "response 2"
+
+
+async def test_set_evicts_least_recently_used_live_entries(cache):
+    await cache.set("first", "response 1")
+    await cache.set("second", "response 2")
+    await cache.get("first")
+    await cache.set("third", "response 3")
+
+    assert sorted(await lru_members(cache)) == ["first", "third"]
+    assert await cache.get("second") is None
+
+
+async def test_get_miss_removes_the_member_of_an_expired_entry(cache):
+    await cache.set("first", "response 1")
+    # Simulate the entry key expiring through its TTL
+    await cache.redis_client.delete(cache._entry_key("first"))
+
+    assert await cache.get("first") is None
+    assert await lru_members(cache) == []
@@ -0,0 +1,148 @@
+import os
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.infrastructure.persistence.archive.partition_archive import ArchiveManifest, PartitionArchive
+from app.infrastructure.persistence.sqlalchemy.partitions import (
+    PartitionMaintenance,
+    add_months,
+    create_partition_sql,
+    partition_month,
+    partition_name
+)
+
+pytestmark = pytest.mark.anyio
+
+JANUARY = date(2024, 1, 1)
+FEBRUARY = date(2024, 2, 1)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return PartitionArchive(str(tmp_path), compression_level=3)
+
+
+def row(row_id: int, user_id: int, created_at: datetime) -> dict:
+    return {
+        "id": row_id, "user_id": user_id, "final_level": "B1", "reason": "Fluent “enough” — ñ",
+        "created_at": created_at, "updated_at": None, "dedup_key": None
+    }
+
+
+def archive_month(archive: PartitionArchive, month: date, rows) -> int:
+    writer = archive.writer("final_evaluations", month)
+    for archived in rows:
+        writer.write(archived)
+    return writer.commit()
+
+
+def files(tmp_path) -> list:
+    return sorted(name for _, _, names in os.walk(tmp_path) for name in names)
+
+
+async def test_committed_month_round_trips_rows(archive):
+    created_at = datetime(2024, 1, 5, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    rows = [row(row_id, 7 if row_id % 2 else 8, created_at + timedelta(hours=row_id)) for row_id in range(10, 16)]
+    assert archive_month(archive, JANUARY, rows) == 6
+
+    assert archive.months("final_evaluations") == [JANUARY]
+    assert archive.manifest("final_evaluations", JANUARY) == ArchiveManifest(
+        rows=6, min_id=10, max_id=15, user_ids=frozenset({7, 8})
+    )
+    assert list(archive.read("final_evaluations", JANUARY)) == rows
+    assert sorted(found["id"] for found in await archive.find_by_user_id("final_evaluations", 7)) == [11, 13, 15]
+    assert await archive.find_by_id("final_evaluations", 12) == rows[2]
+    assert await archive.find_by_id("final_evaluations", 99) is None
+    assert await archive.find_by_user_id("final_evaluations", 9) == []
+
+
+async def test_datetimes_are_decoded_naive_or_aware_as_written(archive):
+    naive = datetime(2024, 1, 5, 10, 0)
+    aware = datetime(2024, 1, 5, 10, 0, tzinfo=timezone(timedelta(hours=2)))
+    archive_month(archive, JANUARY, [row(1, 7, naive), {**row(2, 7, aware), "updated_at": aware}])
+
+    first, second = archive.read("final_evaluations", JANUARY)
+    assert first["created_at"] == naive and first["created_at"].tzinfo is None
+    assert second["created_at"] == aware and second["updated_at"] == aware
+
+
+async def test_history_page_orders_months_newest_first_and_stops_before_the_cursor(archive):
+    archive_month(archive, JANUARY, [row(row_id, 7, datetime(2024, 1, 10)) for row_id in (1, 2, 3)])
+    archive_month(archive, FEBRUARY, [row(row_id, 7, datetime(2024, 2, 10)) for row_id in (4, 5)])
+
+    page = await archive.find_history_page("final_evaluations", 7, 3, None)
+    assert [found["id"] for found in page] == [5, 4, 3]
+
+    page = await archive.find_history_page("final_evaluations", 7, 3, (datetime(2024, 1, 10), 3))
+    assert [found["id"] for found in page] == [2, 1]
+
+
+async def test_history_page_compares_naive_and_aware_positions_as_utc(archive):
+    # 09:30+02:00 is 07:30 UTC: before a naive 08:00 (UTC), after a naive 07:00
+    archive_month(archive, JANUARY, [
+        row(1, 7, datetime(2024, 1, 10, 7, 0)),
+        row(2, 7, datetime(2024, 1, 10, 9, 30, tzinfo=timezone(timedelta(hours=2)))),
+        row(3, 7, datetime(2024, 1, 10, 8, 0, tzinfo=timezone.utc))
+    ])
+
+    page = await archive.find_history_page("final_evaluations", 7, 10, None)
+    assert [found["id"] for found in page] == [3, 2, 1]
+
+    page = await archive.find_history_page("final_evaluations", 7, 10, (datetime(2024, 1, 10, 8, 0), 3))
+    assert [found["id"] for found in page] == [2, 1]
+
+    before = datetime(2024, 1, 10, 9, 30, tzinfo=timezone(timedelta(hours=2)))
+    page = await archive.find_history_page("final_evaluations", 7, 10, (before, 2))
+    assert [found["id"] for found in page] == [1]
+
+
+def test_abort_leaves_no_temporary_file(archive, tmp_path):
+    writer = archive.writer("final_evaluations", JANUARY)
+    writer.write(row(1, 7, datetime(2024, 1, 10)))
+    writer.abort()
+
+    assert files(tmp_path) == []
+    assert archive.months("final_evaluations") == []
+
+
+async def test_aborted_rewrite_keeps_the_committed_month(archive, tmp_path):
+    archive_month(archive, JANUARY, [row(1, 7, datetime(2024, 1, 10))])
+    writer = archive.writer("final_evaluations", JANUARY)
+    writer.write(row(2, 8, datetime(2024, 1, 11)))
+    writer.abort()
+
+    assert files(tmp_path) == ["final_evaluations_2024_01.jsonl.zst", "final_evaluations_2024_01.manifest.json"]
+    assert [found["id"] for found in await archive.find_by_user_id("final_evaluations", 7)] == [1]
+
+
+async def test_committed_rewrite_replaces_the_month_and_its_cached_manifest(archive):
+    archive_month(archive, JANUARY, [row(1, 7, datetime(2024, 1, 10))])
+    assert archive.manifest("final_evaluations", JANUARY).rows == 1
+
+    archive_month(archive, JANUARY, [row(1, 7, datetime(2024, 1, 10)), row(2, 8, datetime(2024, 1, 11))])
+    assert archive.manifest("final_evaluations", JANUARY).rows == 2
+    assert [found["id"] for found in await archive.find_by_user_id("final_evaluations", 8)] == [2]
+
+
+def test_partition_helpers():
+    assert add_months(date(2024, 11, 1), 3) == date(2025, 2, 1)
+    assert add_months(date(2024, 1, 1), -1) == date(2023, 12, 1)
+    assert partition_name("evaluations", FEBRUARY) == "evaluations_2024_02"
+    assert partition_month("evaluations", "evaluations_2024_02") == FEBRUARY
+    assert partition_month("evaluations", "evaluations_default") is None
+    assert partition_month("evaluations", "final_evaluations_2024_02") is None
+    assert create_partition_sql("evaluations", date(2024, 12, 1)) == (
+        "CREATE TABLE IF NOT EXISTS evaluations_2024_12 PARTITION OF evaluations "
+        "FOR VALUES FROM ('2024-12-01 00:00:00+00') TO ('2025-01-01 00:00:00+00');"
+    )
+
+
+async def test_expired_partitions_keep_the_retention_window():
+    class Maintenance(PartitionMaintenance):
+        async def partitions(self, table):
+            months = [date(2024, month, 1) for month in range(1, 13)]
+            return [(partition_name(table, month), month) for month in months] + [(f"{table}_default", None)]
+
+    expired = await Maintenance(engine=None).expired_partitions("evaluations", 3, today=date(2024, 12, 15))
+    assert [name for name, _ in expired] == [f"evaluations_2024_{month:02d}" for month in range(1, 10)]
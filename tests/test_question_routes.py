@@ -0,0 +1,74 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.application.questions.use_cases.list_questions_use_case import ListQuestionsUseCase
+from app.domain.entities.questions import Question
+from app.infrastructure.persistence.sqlalchemy.repositories.cached_question_repository import (
+    CachedQuestionRepository,
+    QuestionCatalogSnapshot
+)
+from app.presentation.api.dependencies import get_list_questions_use_case
+from app.presentation.api.routes.question_routes import router
+
+pytestmark = pytest.mark.anyio
+
+
+class GrowingQuestionRepository:
+    """Catalog that gains a question on every load, as with edits made by other workers."""
+
+    def __init__(self):
+        self.loads = 0
+
+    async def find_all(self):
+        self.loads += 1
+        return [Question(id=number, question=f"Question {number}?") for number in range(1, self.loads + 1)]
+
+
+class ChangingCatalog(CachedQuestionRepository):
+    """Catalog cache invalidated right after every read, so each read loads a new snapshot."""
+
+    async def snapshot(self) -> QuestionCatalogSnapshot:
+        snapshot = await super().snapshot()
+        self._on_remote_change()
+        return snapshot
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/questions")
+    use_case = ListQuestionsUseCase(ChangingCatalog(GrowingQuestionRepository()))
+    app.dependency_overrides[get_list_questions_use_case] = lambda: use_case
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def etag_of(questions):
+    snapshot = QuestionCatalogSnapshot.build(
+        [Question(id=question["id"], question=question["question"]) for question in questions], None
+    )
+    return f'"{snapshot.version}"'
+
+
+async def test_etag_and_body_come_from_the_same_catalog_snapshot(client):
+    async with client:
+        first = await client.get("/api/v1/questions/")
+        second = await client.get("/api/v1/questions/")
+
+    assert len(first.json()["questions"]) == 1
+    assert first.headers["etag"] == etag_of(first.json()["questions"])
+    assert len(second.json()["questions"]) == 2
+    assert second.headers["etag"] == etag_of(second.json()["questions"])
+
+
+async def test_matching_if_none_match_gets_not_modified(client):
+    async with client:
+        first = await client.get("/api/v1/questions/")
+        # The catalog changed since: the stale ETag no longer matches
+        changed = await client.get("/api/v1/questions/", headers={"If-None-Match": first.headers["etag"]})
+        unchanged = await client.get("/api/v1/questions/", headers={"If-None-Match": "*"})
+
+    assert changed.status_code == 200
+    assert len(changed.json()["questions"]) == 2
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
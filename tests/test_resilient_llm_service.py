@@ -0,0 +1,134 @@
+import asyncio
+import time
+from typing import List, Optional
+
+import pytest
+
+from app.core.deadline import deadline_scope
+from app.core.exceptions.evaluation_exceptions import TransientLLMException
+from app.infrastructure.external_services import resilient_llm_service
+from app.infrastructure.external_services.langchain_llm_service import LangchainLLMService
+from app.infrastructure.external_services.llm_simulator import LLMSimulator, SimulatedLLMError, SimulatedOpenAIClient
+from app.infrastructure.external_services.resilient_llm_service import LatencyTracker, ResilientLLMService
+
+pytestmark = pytest.mark.anyio
+
+OPERATION = "evaluate_single_answer"
+HEDGE_DELAY = 0.1
+
+
+class ScriptedSimulator(LLMSimulator):
+    """
+    Seeded simulator whose calls take scripted latencies and fail on demand;
+    records when each call started and which ones were cancelled.
+    """
+
+    def __init__(self, latencies: List[float], failures: Optional[List[bool]] = None):
+        super().__init__(latency_sigma=0.0, tokens_per_second=1e9, seed=42)
+        self.latencies = list(latencies)
+        self.failures = list(failures or [])
+        self.started: List[float] = []
+        self.cancelled = 0
+
+    def check_failure(self) -> None:
+        self.started.append(time.monotonic())
+        if self.failures and self.failures.pop(0):
+            raise SimulatedLLMError(500, "Simulated server error")
+
+    def time_to_first_token(self) -> float:
+        return self.latencies.pop(0) if self.latencies else super().time_to_first_token()
+
+    async def complete(self, messages):
+        try:
+            return await super().complete(messages)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+def make_service(simulator: ScriptedSimulator, **options) -> ResilientLLMService:
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.observe(OPERATION, HEDGE_DELAY)
+    options.setdefault("max_retries", 0)
+    return ResilientLLMService(
+        LangchainLLMService(client=SimulatedOpenAIClient(simulator)),
+        hedge_percentile=95.0,
+        hedge_min_samples=20,
+        latency_tracker=tracker,
+        **options
+    )
+
+
+@pytest.fixture
+def longest_backoff(monkeypatch):
+    # Full jitter draws the longest possible backoff
+    monkeypatch.setattr(resilient_llm_service.random, "uniform", lambda low, high: high)
+
+
+async def test_hedge_is_sent_after_the_latency_percentile_and_the_loser_is_cancelled():
+    simulator = ScriptedSimulator(latencies=[5.0, 0.01])
+    service = make_service(simulator)
+
+    started = time.monotonic()
+    result = await service.evaluate_single_answer("Where do you live?", "I live in a small town.")
+    elapsed = time.monotonic() - started
+
+    assert result["estimated_level"]
+    assert len(simulator.started) == 2
+    assert simulator.started[1] - simulator.started[0] >= HEDGE_DELAY * 0.9
+    assert elapsed < 1.0
+    await asyncio.sleep(0)
+    assert simulator.cancelled == 1
+
+
+async def test_no_hedge_while_the_primary_is_faster_than_the_percentile():
+    simulator = ScriptedSimulator(latencies=[0.01])
+    service = make_service(simulator)
+
+    await service.evaluate_single_answer("Where do you live?", "I live in a small town.")
+    await asyncio.sleep(HEDGE_DELAY * 1.5)
+    assert len(simulator.started) == 1
+    assert simulator.cancelled == 0
+
+
+async def test_no_hedge_before_enough_latency_samples():
+    simulator = ScriptedSimulator(latencies=[0.3])
+    service = ResilientLLMService(
+        LangchainLLMService(client=SimulatedOpenAIClient(simulator)), hedge_min_samples=20, max_retries=0
+    )
+
+    await service.evaluate_single_answer("Where do you live?", "I live in a small town.")
+    assert len(simulator.started) == 1
+
+
+async def test_primary_failure_before_the_hedge_delay_is_raised():
+    simulator = ScriptedSimulator(latencies=[0.01, 0.01], failures=[True])
+    service = make_service(simulator)
+
+    with pytest.raises(TransientLLMException):
+        await service.evaluate_single_answer("Where do you live?", "I live in a small town.")
+    await asyncio.sleep(HEDGE_DELAY * 1.5)
+    assert len(simulator.started) == 1
+
+
+async def test_transient_failure_is_retried_within_the_deadline(longest_backoff):
+    simulator = ScriptedSimulator(latencies=[0.01, 0.01], failures=[True, False])
+    service = make_service(simulator, max_retries=2, backoff_base=0.05)
+
+    with deadline_scope(5.0):
+        result = await service.evaluate_single_answer("Where do you live?", "I live in a small town.")
+    assert result["estimated_level"]
+    assert len(simulator.started) == 2
+
+
+async def test_no_retry_when_the_backoff_exceeds_the_remaining_deadline(longest_backoff):
+    simulator = ScriptedSimulator(latencies=[0.01, 0.01], failures=[True, False])
+    service = make_service(simulator, max_retries=2, backoff_base=2.0)
+
+    started = time.monotonic()
+    with deadline_scope(1.0):
+        with pytest.raises(TransientLLMException):
+            await service.evaluate_single_answer("Where do you live?", "I live in a small town.")
+    assert len(simulator.started) == 1
+    assert time.monotonic() - started < 0.5
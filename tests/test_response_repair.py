@@ -0,0 +1,129 @@
+import pytest
+
+from app.core.exceptions.evaluation_exceptions import InvalidResponseException
+from app.infrastructure.external_services.response_repair import (
+    normalize_level,
+    normalize_question_id,
+    parse_json_lenient,
+    remove_trailing_commas,
+    repair_feedback_item,
+    repair_next_questions,
+    unwrap_evaluation
+)
+
+SCORES = {"grammar": 6.0, "vocabulary": 7.0, "fluency": 5.5}
+VALID_ITEM = {
+    "question_id": 1, "estimated_level": "B1", "scores": SCORES,
+    "mistakes": ["Missing article"], "suggestions": ["Use 'the' before unique nouns"]
+}
+
+
+@pytest.mark.parametrize("content, expected, repaired", [
+    ('{"level": "B1"}', {"level": "B1"}, False),
+    ('[1, 2]', [1, 2], False),
+    ('```json\n{"level": "B1"}\n```', {"level": "B1"}, True),
+    ('```\n[1, 2]\n```', [1, 2], True),
+    ('Here is the evaluation: {"level": "B1"} Hope it helps!', {"level": "B1"}, True),
+    ('{"feedback": [1, 2,],}', {"feedback": [1, 2]}, True),
+    ('{"feedback": [{"a": 1,\n  },\n]\n}', {"feedback": [{"a": 1}]}, True),
+    ('{"reason": "Lists like [a, b,] are fine",}', {"reason": "Lists like [a, b,] are fine"}, True),
+])
+def test_parse_json_lenient_repairs_common_defects(content, expected, repaired):
+    assert parse_json_lenient(content) == (expected, repaired)
+
+
+@pytest.mark.parametrize("content", [
+    "I cannot evaluate these answers.",
+    "",
+    None,
+    '{"level": }',
+    '}{',
+])
+def test_parse_json_lenient_rejects_unrepairable_content(content):
+    with pytest.raises(InvalidResponseException):
+        parse_json_lenient(content)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('[1, 2,]', '[1, 2]'),
+    ('{"a": 1 , }', '{"a": 1  }'),
+    ('{"a": [1,\n\t]}', '{"a": [1\n\t]}'),
+    ('{"a": "x,}"}', '{"a": "x,}"}'),
+    ('{"a": "say \\"hi,\\"]"}', '{"a": "say \\"hi,\\"]"}'),
+    ('[1, 2]', '[1, 2]'),
+])
+def test_remove_trailing_commas_ignores_string_contents(text, expected):
+    assert remove_trailing_commas(text) == expected
+
+
+@pytest.mark.parametrize("result, expected, repaired", [
+    (
+        {"evaluation": {"level": "B1", "feedback": []}, "next_questions": ["Why?"]},
+        {"level": "B1", "feedback": [], "next_questions": ["Why?"]},
+        True
+    ),
+    ({"level": "B1", "feedback": []}, {"level": "B1", "feedback": []}, False),
+    ({"evaluation": "B1"}, {"evaluation": "B1"}, False),
+])
+def test_unwrap_evaluation_flattens_the_nested_layout(result, expected, repaired):
+    assert unwrap_evaluation(result) == (expected, repaired)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("B2", "B2"),
+    ("b2", "B2"),
+    ("B2+", "B2"),
+    ("Level: c1 (advanced)", "C1"),
+    ("upper intermediate", None),
+    ("D1", None),
+    (3, None),
+    (None, None),
+])
+def test_normalize_level(value, expected):
+    assert normalize_level(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (3, 3),
+    ("3", 3),
+    (" 4 ", 4),
+    (True, None),
+    ("third", None),
+    (None, None),
+])
+def test_normalize_question_id(value, expected):
+    assert normalize_question_id(value) == expected
+
+
+@pytest.mark.parametrize("item, expected, repaired", [
+    (VALID_ITEM, VALID_ITEM, False),
+    ({**VALID_ITEM, "question_id": "1", "estimated_level": "b1+"}, VALID_ITEM, True),
+    (
+        {**VALID_ITEM, "scores": {"grammar": "6", "vocabulary": 12, "fluency": -1}},
+        {**VALID_ITEM, "scores": {"grammar": 6.0, "vocabulary": 10.0, "fluency": 0.0}},
+        True
+    ),
+    (
+        {**VALID_ITEM, "mistakes": "Missing article", "suggestions": None},
+        {**VALID_ITEM, "mistakes": ["Missing article"], "suggestions": []},
+        True
+    ),
+    ({**VALID_ITEM, "estimated_level": "fluent"}, None, False),
+    ({**VALID_ITEM, "scores": {"grammar": 6.0, "vocabulary": 7.0}}, None, False),
+    ({**VALID_ITEM, "scores": {**SCORES, "fluency": "good"}}, None, False),
+    ({**VALID_ITEM, "scores": [6.0, 7.0, 5.5]}, None, False),
+    ("B1", None, False),
+])
+def test_repair_feedback_item(item, expected, repaired):
+    assert repair_feedback_item(item) == (expected, repaired)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (["Why?", " How? ", ""], ["Why?", "How?"]),
+    ({"next_questions": ["Why?"]}, ["Why?"]),
+    ([], None),
+    ("Why?", None),
+    (None, None),
+])
+def test_repair_next_questions(value, expected):
+    assert repair_next_questions(value) == expected